@@ -3,8 +3,22 @@ from typing import Dict, Union
 
 from flask import Flask, current_app, redirect, request, url_for
 
-from app.models.setting import Setting
-from app.models.view import View
+from app.services.autocomplete import autocomplete
+from app.services.billing import billing_cli
+from app.services.counters import counters_cli
+from app.services.dashboard import dashboard_stats
+from app.services.dues import dues_report
+from app.services.duplicates import people_cli
+from app.services.files import file_verifier, files_cli
+from app.services.images import image_derivatives, images_cli
+from app.services.orphans import orphan_collector
+from app.services.phones import phones_cli
+from app.services.rollups import rollups_cli
+from app.services.salaries import salary_stats
+from app.services.search import search_cli
+from app.services.settings import setting_cache
+from app.services.storage import content_store
+from app.services.views import view_recorder
 
 from .blueprints.admin import bp as admin_bp
 from .blueprints.api import bp as api_bp
@@ -16,7 +30,7 @@ from .extensions import bcrypt, db, login_manager, migrate
 
 
 def ctx() -> Dict:
-    setting: Union[Setting, None] = Setting.query.first()
+    setting: Union[Dict, None] = setting_cache.get()
 
     dct: Dict = {
         "DEFAULT_AVATAR_URL": url_for(
@@ -29,7 +43,7 @@ def ctx() -> Dict:
     if setting:
         dct = {
             **dct,
-            **{key.upper(): value for key, value in setting.to_dict().items()},
+            **{key.upper(): value for key, value in setting.items()},
         }
 
         dct.setdefault("PROJECT_TITLE", dct.get("SITE_NAME", "N/A"))
@@ -47,6 +61,16 @@ def create_app(config_class: type[Config] | None = None) -> Flask:
     migrate.init_app(app, db)
     bcrypt.init_app(app)
     login_manager.init_app(app)
+    view_recorder.init_app(app)
+    setting_cache.init_app(app)
+    dashboard_stats.init_app(app)
+    salary_stats.init_app(app)
+    dues_report.init_app(app)
+    autocomplete.init_app(app)
+    file_verifier.init_app(app)
+    content_store.init_app(app)
+    image_derivatives.init_app(app)
+    orphan_collector.init_app(app)
 
     @app.context_processor
     def _():
@@ -55,20 +79,27 @@ def create_app(config_class: type[Config] | None = None) -> Flask:
 
     @app.before_request
     def _():
-        if not Setting.query.count() and request.endpoint not in [
+        if not setting_cache.exists() and request.endpoint not in [
             "static",
             "init.setup",
         ]:
             return redirect(url_for("init.setup"))
 
         if request.endpoint not in ["static"]:
-            view = View()
-            view.path = (request.path,)
-            view.ip_address = (request.remote_addr,)
-            view.user_agent = request.headers.get("User-Agent")
-
-            db.session.add(view)
-            db.session.commit()
+            view_recorder.record(
+                request.path,
+                request.remote_addr,
+                request.headers.get("User-Agent"),
+            )
+
+    app.cli.add_command(rollups_cli)
+    app.cli.add_command(files_cli)
+    app.cli.add_command(images_cli)
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(billing_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(people_cli)
+    app.cli.add_command(phones_cli)
 
     app.register_blueprint(main_bp)
     app.register_blueprint(init_bp, url_prefix="/init")
@@ -12,10 +12,16 @@ from app.models.student import Student
 from app.models.teacher import Teacher
 from app.models.user import User
 from app.models.view import View
+from app.services.dashboard import dashboard_stats
 
 
 @bp.get("/")
 @bp.get("/dashboard")
 @login_required
 def dashboard():
-    return render_template("admin/pages/dashboard.html", title="Dashboard", **globals())
+    return render_template(
+        "admin/pages/dashboard.html",
+        title="Dashboard",
+        stats=dashboard_stats.get(),
+        **globals(),
+    )
@@ -1,7 +1,10 @@
-from flask import Blueprint, redirect, url_for
+import json
+
+from flask import Blueprint, Response, redirect, url_for
 from flask_login import current_user
 
 from app.models.user import Role
+from app.services.pagination import PaginationError
 
 bp = Blueprint("api", __name__)
 
@@ -12,14 +15,26 @@ def _():
         return redirect(url_for("auth.login"))
 
 
+@bp.errorhandler(PaginationError)
+def pagination_error(err: PaginationError) -> Response:
+    return Response(
+        json.dumps({"message": str(err), "category": "error"}),
+        status=400,
+        headers={"Content-Type": "application/json"},
+    )
+
+
 from .routes import (
     analytics,
     course,
+    dues,
     employee,
     enrollment,
+    file,
     job,
     main,
     payment,
+    search,
     setting,
     student,
     teacher,
@@ -1,34 +1,42 @@
 import json
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Tuple
 
 from flask import Response, jsonify
 from flask_login import login_required
-from sqlalchemy import extract, func
 
 from app.blueprints.api import bp
-from app.extensions import console, db
 from app.models.payment import Payment
+from app.models.rollup import rollup_series
 from app.models.student import Student
 from app.models.view import View
 
 
+def _monthly(model: str, start: date, end: date) -> Dict[date, Tuple[int, Decimal]]:
+    """Fold the daily rollups of ``model`` into ``{first_of_month: (count, amount)}``."""
+    months: Dict[date, Tuple[int, Decimal]] = {}
+
+    for day, (count, amount) in sorted(rollup_series(model, start, end).items()):
+        if not count:
+            continue
+
+        month = day.replace(day=1)
+        total_count, total_amount = months.get(month, (0, Decimal(0)))
+        months[month] = (total_count + count, total_amount + amount)
+
+    return months
+
+
 @bp.get("/analytics/weekly-views")
 @login_required
 def weekly_views() -> Response:
     response: Response = Response(headers={"Content-Type": "application/json"})
 
-    today = datetime.now().date()
+    today = datetime.now(timezone.utc).date()
     week_ago = today - timedelta(days=6)
 
-    results = (
-        db.session.query(
-            func.date(View.created_at).label("date"), func.count(View.id).label("views")
-        )
-        .filter(View.created_at >= week_ago)
-        .group_by(func.date(View.created_at))
-        .order_by(func.date(View.created_at))
-        .all()
-    )
+    results = rollup_series(View.__tablename__, week_ago, today)
 
     x = []
     y = []
@@ -37,7 +45,7 @@ def weekly_views() -> Response:
         day = week_ago + timedelta(days=i)
         day_str = day.strftime("%a")
 
-        count = next((r.views for r in results if r.date == day), 0)
+        count, _ = results.get(day, (0, 0))
 
         x.append(day_str)
         y.append(count)
@@ -50,30 +58,19 @@ def weekly_views() -> Response:
 
 @bp.route("/analytics/monthly_students")
 def monthly_students() -> Response:
-    now = datetime.now()
-
-    start_date = now.replace(day=1) - timedelta(days=360)
-
-    results = (
-        db.session.query(
-            extract("year", Student.created_at).label("year"),
-            extract("month", Student.created_at).label("month"),
-            func.count(Student.student_id).label("count"),
-        )
-        .filter(Student.created_at >= start_date)
-        .group_by("year", "month")
-        .order_by("year", "month")
-        .all()
-    )
+    today = datetime.now(timezone.utc).date()
+
+    start_date = today.replace(day=1) - timedelta(days=360)
+
+    results = _monthly(Student.__tablename__, start_date, today)
 
     # Prepare data
     x = []
     y = []
 
-    for row in results:
-        month_label = datetime(int(row.year), int(row.month), 1).strftime("%b")
-        x.append(month_label)
-        y.append(row.count)
+    for month, (count, _) in results.items():
+        x.append(month.strftime("%b"))
+        y.append(count)
 
     response: Response = Response(headers={"Content-Type": "application/json"})
 
@@ -84,28 +81,17 @@ def monthly_students() -> Response:
 
 @bp.route("/analytics/monthly_payments")
 def monthly_payments() -> Response:
-    now = datetime.now(timezone.utc)
-    start_date = now.replace(day=1) - timedelta(days=360)
-
-    # Query: sum payments per month
-    results = (
-        db.session.query(
-            extract("year", Payment.created_at).label("year"),
-            extract("month", Payment.created_at).label("month"),
-            func.sum(Payment.amount).label("total"),
-        )
-        .filter(Payment.created_at >= start_date)
-        .group_by("year", "month")
-        .order_by("year", "month")
-        .all()
-    )
+    today = datetime.now(timezone.utc).date()
+    start_date = today.replace(day=1) - timedelta(days=360)
+
+    # Sum payments per month
+    results = _monthly(Payment.__tablename__, start_date, today)
 
     x = []
     y = []
-    for row in results:
-        month_label = datetime(int(row.year), int(row.month), 1).strftime("%b")
-        x.append(month_label)
-        y.append(f"{row.total:.2f}")
+    for month, (_, total) in results.items():
+        x.append(month.strftime("%b"))
+        y.append(f"{total:.2f}")
 
     response: Response = Response(headers={"Content-Type": "application/json"})
     response.response = json.dumps(dict(zip(x, y)))
@@ -1,15 +1,16 @@
 import json
-import pathlib
 from typing import Dict, List, OrderedDict, Tuple, Union
 
 from flask import Response, request
 from flask_login import login_required
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
 from app.extensions import db
 from app.forms.course import AddCourseForm, UpdateCourseForm
 from app.models.course import Course
 from app.models.file import CourseFile, File
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 from .. import bp
@@ -18,16 +19,11 @@ from .. import bp
 @bp.get("/fetch/courses")
 @login_required
 def fetch_courses() -> Response:
-    courses: List[Course] = Course.query.all()
-
-    response: Response = Response(
-        json.dumps([c.to_dict() for c in courses]),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Course).options(*Course.load_profile()).order_by(Course.course_id),
+        Course.to_dict,
     )
 
-    return response
-
 
 @bp.get("/fetch/rows/courses")
 @login_required
@@ -44,9 +40,30 @@ def fetch_courses_rows() -> Response:
         (ColumnID("start_time"), ColumnName("Start Time")),
         (ColumnID("end_time"), ColumnName("End Time")),
         (ColumnID("monthly_fee"), ColumnName("Monthly Fee")),
+        (ColumnID("active_enrollments_count"), ColumnName("Active Enrollments")),
     ]
 
-    courses: List[Course] = Course.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Course).options(*Course.load_profile("row")),
+        Course.course_id,
+        sortable={
+            "course_title": Course.course_title,
+            "start_date": Course.start_date,
+            "end_date": Course.end_date,
+            "start_time": Course.start_time,
+            "end_time": Course.end_time,
+            "monthly_fee": Course.monthly_fee,
+            "active_enrollments_count": Course.active_enrollments_count,
+            "closed_enrollments_count": Course.closed_enrollments_count,
+        },
+        searchable=[Course.course_title, Course.course_description],
+        filterable={
+            "teacher_id": Course.teacher_id,
+            "active_enrollments_count": Course.active_enrollments_count,
+            "closed_enrollments_count": Course.closed_enrollments_count,
+        },
+    )
+    courses: List[Course] = page.items
     rows: List[List] = []
 
     for course in courses:
@@ -69,7 +86,7 @@ def fetch_courses_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {"cols": cols, "rows": rows}
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
@@ -176,16 +193,12 @@ def update_course() -> Response:
                                     else:
                                         db.session.commit()
 
-                                        if not File.query.filter_by(
-                                            file_url=link
-                                        ).first():
-                                            path: pathlib.Path = pathlib.Path(link)
-
-                                            file: File = File()
-
-                                            file.file_name = path.name
-                                            file.file_url = f"{path!s}"
-                                            file.file_for = name
+                                        if link not in {
+                                            f.file.file_url for f in course.files
+                                        }:
+                                            file: File = File.from_link(
+                                                link, file_for=name
+                                            )
 
                                             db.session.add(file)
                                             db.session.commit()
@@ -285,13 +298,7 @@ def add_course() -> Response:
                     match name:
                         case "banner":
                             link = links.pop()
-                            path: pathlib.Path = pathlib.Path(link)
-
-                            file: File = File()
-
-                            file.file_name = path.name
-                            file.file_url = f"{path!s}"
-                            file.file_for = name
+                            file: File = File.from_link(link, file_for=name)
 
                             db.session.add(file)
                             db.session.commit()
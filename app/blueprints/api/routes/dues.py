@@ -0,0 +1,132 @@
+import json
+from typing import Dict, List, Tuple
+
+from flask import Response, render_template, request
+from flask_login import login_required
+
+from app.models.course import Course
+from app.models.enrollment import Enrollment, current_month
+from app.models.student import Student
+from app.services.billing import run_billing
+from app.services.dues import dues_report, parse_month, unpaid_enrollments
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
+from app.types import ColumnID, ColumnName
+
+from .. import bp
+
+
+@bp.get("/fetch/dues")
+@login_required
+def fetch_dues() -> Response:
+    """Return every ACTIVE enrollment without a payment for ``?month=YYYY-MM``."""
+    month: str = parse_month(request.args.get("month", current_month()))
+
+    return stream_json(
+        unpaid_enrollments(month)
+        .options(*Enrollment.load_profile())
+        .order_by(Enrollment.enrollment_id),
+        Enrollment.to_dict,
+    )
+
+
+@bp.get("/fetch/rows/dues")
+@login_required
+def fetch_dues_rows() -> Response:
+    """Return the unpaid enrollments of ``?month=YYYY-MM`` as table rows."""
+    month: str = parse_month(request.args.get("month", current_month()))
+    args: Dict[str, str] = {k: v for k, v in request.args.items() if k != "month"}
+
+    def build() -> str:
+        cols: List[Tuple[ColumnID, ColumnName]] = [
+            (ColumnID("enrollment_id"), ColumnName("Enrollment ID")),
+            (ColumnID("student"), ColumnName("Student")),
+            (ColumnID("course"), ColumnName("Course")),
+            (ColumnID("enrollment_date"), ColumnName("Enrolled")),
+            (ColumnID("monthly_fee"), ColumnName("Amount Due")),
+        ]
+
+        page: KeysetPage = KeysetPage(
+            unpaid_enrollments(month)
+            .join(Enrollment.student)
+            .join(Enrollment.course)
+            .options(*Enrollment.load_profile("row")),
+            Enrollment.enrollment_id,
+            sortable={
+                "student": Student.first_name,
+                "course": Course.course_title,
+                "enrollment_date": Enrollment.enrollment_date,
+                "monthly_fee": Enrollment.monthly_fee,
+            },
+            searchable=[
+                Student.first_name,
+                Student.middle_name,
+                Student.last_name,
+                Student.email,
+                Course.course_title,
+            ],
+            filterable={
+                "course_id": Enrollment.course_id,
+                "student_id": Enrollment.student_id,
+            },
+            args=args,
+        )
+        rows: List[List] = []
+
+        for e in page.items:
+            row: List = []
+
+            for col_id, _ in cols:
+                match col_id:
+                    case "student":
+                        s = e.student
+                        row.append(
+                            render_template(
+                                "admin/components/tables/td/student.html",
+                                avatar_path=s.avatar_path,
+                                full_name=f"{s.first_name} {s.middle_name or ''} {s.last_name}".strip(),
+                                email=s.email,
+                            )
+                        )
+                    case "course":
+                        row.append(e.course.course_title)
+                    case "enrollment_date":
+                        row.append(e.display_enrollment_date)
+                    case "monthly_fee":
+                        row.append(e.display_monthly_fee)
+                    case _:
+                        row.append(getattr(e, col_id, "N/A"))
+
+            rows.append(row)
+
+        return json.dumps({"cols": cols, "rows": rows, "month": month, **page.meta()})
+
+    return Response(
+        dues_report.page(month, args, build),
+        status=200,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@bp.post("/billing/run")
+@login_required
+def billing_run() -> Response:
+    """Generate the dues of ``month`` (form field, default: current month)."""
+    month: str = parse_month(request.form.get("month") or current_month())
+    result: Dict = run_billing(month)
+
+    return Response(
+        json.dumps(
+            {
+                "title": "Good job!",
+                "message": f"{result['created']} due(s) created for {month}.",
+                "category": "success",
+                "month": month,
+                "created": result["created"],
+                "total": result["total"],
+                "amount": f"{result['amount']:.2f}",
+            }
+        ),
+        status=200,
+        headers={"Content-Type": "application/json"},
+    )
@@ -3,6 +3,7 @@ from typing import Dict, List, OrderedDict, Tuple, Union
 
 from flask import Response, current_app, request, url_for
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.blueprints.api import bp
 from app.extensions import console, db
@@ -10,22 +11,23 @@ from app.forms import AddEmployeeForm
 from app.forms.employee import UpdateEmployeeForm
 from app.models.employee import Employee
 from app.models.phone import EmployeePhone
+from app.services.duplicates import describe_duplicates, possible_duplicates
+from app.services.pagination import KeysetPage
+from app.services.phones import diff_phones
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 
 @bp.get("/fetch/employees")
 @login_required
 def fetch_employees() -> Response:
-    employees: List[Employee] = Employee.query.all()
-
-    response: Response = Response(
-        json.dumps([employee.to_dict() for employee in employees]),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Employee)
+        .options(*Employee.load_profile())
+        .order_by(Employee.employee_id),
+        Employee.to_dict,
     )
 
-    return response
-
 
 @bp.get("/fetch/rows/employees")
 @login_required
@@ -43,7 +45,25 @@ def fetch_employees_rows() -> Response:
         (ColumnID("hire_date"), ColumnName("Hire Date")),
     ]
 
-    jobs: List[Employee] = Employee.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Employee).options(*Employee.load_profile("row")),
+        Employee.employee_id,
+        sortable={
+            "first_name": Employee.first_name,
+            "middle_name": Employee.middle_name,
+            "last_name": Employee.last_name,
+            "email": Employee.email,
+            "hire_date": Employee.hire_date,
+        },
+        searchable=[
+            Employee.first_name,
+            Employee.middle_name,
+            Employee.last_name,
+            Employee.email,
+        ],
+        filterable={"job_id": Employee.job_id},
+    )
+    jobs: List[Employee] = page.items
     rows: List[List] = []
 
     for job in jobs:
@@ -61,10 +81,7 @@ def fetch_employees_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {
-        "cols": cols,
-        "rows": rows,
-    }
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
@@ -174,23 +191,17 @@ def update_employee() -> Response:
             if form.phones.data:
                 try:
                     nphones = json.loads(form.phones.data)
-                    ophones = employee.phones
+                    removed, added = diff_phones(employee.phones, nphones)
 
-                    for ophone in ophones:
-                        if ophone.phone_number not in nphones:
-                            db.session.delete(ophone)
+                    for ophone in removed:
+                        db.session.delete(ophone)
 
-                    for nphone in nphones:
-                        if (
-                            not db.session.query(EmployeePhone)
-                            .filter(EmployeePhone.phone_number == nphone)
-                            .first()
-                        ):
-                            phone = EmployeePhone()
-                            phone.employee_id = form.employee_id.data
-                            phone.phone_number = nphone
+                    for nphone in added:
+                        phone = EmployeePhone()
+                        phone.employee_id = employee.employee_id
+                        phone.phone_number = nphone
 
-                            db.session.add(phone)
+                        db.session.add(phone)
 
                     db.session.commit()
                 except Exception as err:
@@ -296,10 +307,8 @@ def add_employee() -> Response:
 
         if form.phones.data:
             try:
+                # The form already checked the numbers against the index.
                 for phone in json.loads(form.phones.data):
-                    if EmployeePhone.query.filter_by(phone_number=phone).first():
-                        continue
-
                     employee_phone = EmployeePhone()
                     employee_phone.employee_id = employee.employee_id
                     employee_phone.phone_number = phone
@@ -315,6 +324,10 @@ def add_employee() -> Response:
         response["category"] = "success"
         response["id"] = employee.employee_id
 
+        if duplicates := possible_duplicates("employee", employee.employee_id):
+            response["duplicates"] = duplicates
+            response["message"] += " " + describe_duplicates(duplicates)
+
     else:
         response["errors"] = form.errors
 
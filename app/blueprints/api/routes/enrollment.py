@@ -5,10 +5,14 @@ from typing import Dict, List, OrderedDict, Tuple, Union
 
 from flask import Response, current_app, render_template
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.extensions import db
 from app.forms.enrollment import AddEnrollmentForm, UpdateEnrollmentForm
 from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.student import Student
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 from .. import bp
@@ -18,16 +22,13 @@ from .. import bp
 @login_required
 def fetch_enrollments() -> Response:
     """Return all enrollments as JSON (full dicts)."""
-    enrollments: List[Enrollment] = Enrollment.query.all()
-
-    response: Response = Response(
-        json.dumps([e.to_dict() for e in enrollments]),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Enrollment)
+        .options(*Enrollment.load_profile())
+        .order_by(Enrollment.enrollment_id),
+        Enrollment.to_dict,
     )
 
-    return response
-
 
 @bp.get("/fetch/rows/enrollments")
 @login_required
@@ -44,7 +45,31 @@ def fetch_enrollments_rows() -> Response:
         (ColumnID("discount_rate"), ColumnName("Discount Rate")),
     ]
 
-    enrollments: List[Enrollment] = Enrollment.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Enrollment)
+        .join(Enrollment.student)
+        .options(*Enrollment.load_profile("row")),
+        Enrollment.enrollment_id,
+        sortable={
+            "student": Student.first_name,
+            "status": Enrollment.status,
+            "enrollment_date": Enrollment.enrollment_date,
+            "monthly_fee": Enrollment.monthly_fee,
+            "discount_rate": Enrollment.discount_rate,
+        },
+        searchable=[
+            Student.first_name,
+            Student.middle_name,
+            Student.last_name,
+            Student.email,
+        ],
+        filterable={
+            "status": Enrollment.status,
+            "course_id": Enrollment.course_id,
+            "student_id": Enrollment.student_id,
+        },
+    )
+    enrollments: List[Enrollment] = page.items
     rows: List[List] = []
 
     for e in enrollments:
@@ -82,7 +107,7 @@ def fetch_enrollments_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {"cols": cols, "rows": rows}
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
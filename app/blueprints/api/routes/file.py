@@ -0,0 +1,117 @@
+import json
+import os
+from typing import List, Set, Tuple, Union
+
+from flask import Response, request
+from flask_login import login_required
+from werkzeug.utils import secure_filename
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.file import File
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.downloads import send_upload
+from app.services.storage import content_store
+from app.services.streaming import stream_zip
+
+from .. import bp
+
+
+def _not_found(what: str) -> Response:
+    return Response(
+        json.dumps(
+            {
+                "message": f"{what} with the given ID was not found :(",
+                "category": "error",
+            }
+        ),
+        headers={"Content-Type": "application/json"},
+        status=404,
+    )
+
+
+@bp.get("/download/file/<int:file_id>")
+@login_required
+def download_file(file_id: int) -> Response:
+    """Download a ``File``; ``?inline=1`` lets the browser display it."""
+    file: Union[File, None] = db.session.get(File, file_id)
+    path: Union[str, None] = content_store.local_path(file.file_url) if file else None
+
+    if path is None or not os.path.isfile(path):
+        return _not_found("File")
+
+    return send_upload(
+        path,
+        file.file_name,
+        mimetype=file.mime_type,
+        etag=file.file_hash,
+        immutable=bool(file.file_hash) and request.args.get("v") == file.file_hash[:16],
+        as_attachment=not request.args.get("inline", type=int),
+    )
+
+
+def _archive(files: List[File], name: str) -> Response:
+    """Stream ``files`` as ``<name>.zip``, grouped in folders by ``file_for``."""
+    entries: List[Tuple[str, str]] = []
+    seen: Set[str] = set()
+
+    for file in files:
+        path: Union[str, None] = content_store.local_path(file.file_url)
+
+        if path is None:
+            continue
+
+        arcname: str = secure_filename(file.file_name or "") or f"file-{file.file_id}"
+        if file.file_for:
+            arcname = f"{secure_filename(file.file_for)}/{arcname}"
+
+        stem, extension = os.path.splitext(arcname)
+        number: int = 1
+        while arcname in seen:
+            number += 1
+            arcname = f"{stem} ({number}){extension}"
+
+        seen.add(arcname)
+        entries.append((arcname, path))
+
+    return stream_zip(entries, f"{secure_filename(name) or 'files'}.zip")
+
+
+@bp.get("/download/student/<int:student_id>/files")
+@login_required
+def download_student_files(student_id: int) -> Response:
+    student: Union[Student, None] = db.session.get(
+        Student, student_id, options=Student.load_profile()
+    )
+
+    if student is None:
+        return _not_found("Student")
+
+    return _archive([f.file for f in student.files], student.full_name)
+
+
+@bp.get("/download/teacher/<int:teacher_id>/files")
+@login_required
+def download_teacher_files(teacher_id: int) -> Response:
+    teacher: Union[Teacher, None] = db.session.get(
+        Teacher, teacher_id, options=Teacher.load_profile()
+    )
+
+    if teacher is None:
+        return _not_found("Teacher")
+
+    return _archive([f.file for f in teacher.files], teacher.full_name)
+
+
+@bp.get("/download/course/<int:course_id>/files")
+@login_required
+def download_course_files(course_id: int) -> Response:
+    course: Union[Course, None] = db.session.get(
+        Course, course_id, options=Course.load_profile()
+    )
+
+    if course is None:
+        return _not_found("Course")
+
+    return _archive([f.file for f in course.files], course.course_title)
@@ -4,27 +4,25 @@ from typing import Dict, List, Tuple, Union
 
 from flask import Response
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.blueprints.api import bp
 from app.extensions import db
 from app.forms import AddJobForm, UpdateJobForm
 from app.models.job import Job
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 
 @bp.get("/fetch/jobs")
 @login_required
 def fetch_jobs() -> Response:
-    jobs: List[Dict] = [job.to_dict() for job in Job.query.all()]
-
-    response: Response = Response(
-        json.dumps(jobs),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Job).options(*Job.load_profile()).order_by(Job.job_id),
+        Job.to_dict,
     )
 
-    return response
-
 
 @bp.get("/fetch/rows/jobs")
 @login_required
@@ -38,9 +36,22 @@ def fetch_jobs_rows() -> Response:
         (ColumnID("job_title"), ColumnName("Job Title")),
         (ColumnID("min_salary"), ColumnName("Min Salary")),
         (ColumnID("max_salary"), ColumnName("Max Salary")),
+        (ColumnID("employee_count"), ColumnName("Employees")),
     ]
 
-    jobs: List[Job] = Job.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Job).options(*Job.load_profile("row")),
+        Job.job_id,
+        sortable={
+            "job_title": Job.job_title,
+            "min_salary": Job.min_salary,
+            "max_salary": Job.max_salary,
+            "employee_count": Job.employee_count,
+        },
+        searchable=[Job.job_title],
+        filterable={"employee_count": Job.employee_count},
+    )
+    jobs: List[Job] = page.items
     rows: List[List] = []
 
     for job in jobs:
@@ -61,10 +72,7 @@ def fetch_jobs_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {
-        "cols": cols,
-        "rows": rows,
-    }
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
@@ -4,25 +4,24 @@ from typing import Dict, List, OrderedDict, Tuple, Union
 
 from flask import Response, current_app
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.blueprints.api import bp
 from app.extensions import db
 from app.forms.payment import AddPaymentForm, UpdatePaymentForm
 from app.models.payment import Payment
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 
 @bp.get("/fetch/payments")
 @login_required
 def fetch_payments() -> Response:
-    payments: List[Payment] = Payment.query.all()
-
-    response: Response = Response(
-        json.dumps([payment.to_dict() for payment in payments]),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Payment).options(*Payment.load_profile()).order_by(Payment.payment_id),
+        Payment.to_dict,
     )
-    return response
 
 
 @bp.get("/fetch/rows/payments")
@@ -38,7 +37,22 @@ def fetch_payments_rows() -> Response:
         (ColumnID("month_for"), ColumnName("For Month")),
     ]
 
-    payments: List[Payment] = Payment.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Payment).options(*Payment.load_profile("row")),
+        Payment.payment_id,
+        sortable={
+            "enrollment_id": Payment.enrollment_id,
+            "amount": Payment.amount,
+            "payment_date": Payment.payment_date,
+            "month_for": Payment.month_for,
+        },
+        searchable=[Payment.month_for],
+        filterable={
+            "enrollment_id": Payment.enrollment_id,
+            "month_for": Payment.month_for,
+        },
+    )
+    payments: List[Payment] = page.items
     rows: List[List] = []
 
     for payment in payments:
@@ -58,7 +72,7 @@ def fetch_payments_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {"cols": cols, "rows": rows}
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
     response.response = json.dumps(dct)
     response.status_code = 200
     return response
@@ -0,0 +1,90 @@
+import json
+from typing import Dict, List
+
+from flask import Response, current_app, request
+from flask_login import login_required
+
+from app.services.autocomplete import SOURCES, autocomplete
+from app.services.people import search_people
+from app.services.phones import lookup_phone
+
+from .. import bp
+
+
+@bp.get("/search/people")
+@login_required
+def search_people_route() -> Response:
+    """Return the students, teachers and employees closest to ``?q=``."""
+    limit: int = min(
+        request.args.get("limit", current_app.config["PEOPLE_SEARCH_LIMIT"], type=int),
+        current_app.config["PEOPLE_SEARCH_MAX_LIMIT"],
+    )
+    people: List[Dict] = search_people(request.args.get("q", ""), max(limit, 1))
+
+    return Response(
+        json.dumps({"q": request.args.get("q", ""), "people": people}),
+        status=200,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@bp.get("/autocomplete/<kind>")
+@login_required
+def autocomplete_route(kind: str) -> Response:
+    """Return ``[{"id", "label"}]`` of the students, courses or enrollments
+    whose name (or ID) starts with ``?q=``."""
+    if kind not in SOURCES:
+        return Response(
+            json.dumps(
+                {"message": f"Cannot autocomplete {kind!r}", "category": "error"}
+            ),
+            status=404,
+            headers={"Content-Type": "application/json"},
+        )
+
+    return Response(
+        json.dumps(autocomplete.suggest(kind, request.args.get("q", ""))),
+        status=200,
+        headers={
+            "Content-Type": "application/json",
+            "Cache-Control": "private, max-age=10",
+        },
+    )
+
+
+@bp.get("/lookup/phone")
+@login_required
+def lookup_phone_route() -> Response:
+    """Return the student, teacher or employee owning ``?number=``, however
+    the number is spelled; a number several people share is a 409 listing
+    all of them."""
+    if (found := lookup_phone(request.args.get("number", ""))) is None:
+        return Response(
+            json.dumps(
+                {
+                    "message": "Phone number was not found :(",
+                    "category": "error",
+                }
+            ),
+            status=404,
+            headers={"Content-Type": "application/json"},
+        )
+
+    if len(found["holders"]) > 1:
+        return Response(
+            json.dumps(
+                {
+                    "message": "Phone number belongs to several people!",
+                    "category": "error",
+                    **found,
+                }
+            ),
+            status=409,
+            headers={"Content-Type": "application/json"},
+        )
+
+    return Response(
+        json.dumps({"number": found["number"], **found["holders"][0]}),
+        status=200,
+        headers={"Content-Type": "application/json"},
+    )
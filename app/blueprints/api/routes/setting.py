@@ -7,6 +7,7 @@ from flask_login import login_required
 from app.extensions import db
 from app.forms.setting import SettingForm
 from app.models.setting import Setting
+from app.services.settings import setting_cache
 
 from .. import bp
 
@@ -34,6 +35,8 @@ def update_setting() -> Response:
 
             db.session.commit()
 
+            setting_cache.invalidate()
+
             dct = {}
             dct["message"] = "Settings updated successfully."
             dct["title"] = "Updated!"
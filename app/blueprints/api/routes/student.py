@@ -1,15 +1,19 @@
 import json
-import pathlib
 from typing import Dict, List, OrderedDict, Tuple, Union
 
 from flask import Response, current_app, request, url_for
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.extensions import console, db
 from app.forms.student import AddStudentForm, UpdateStudentForm
 from app.models.file import File, StudentFile
 from app.models.phone import StudentPhone
 from app.models.student import Student
+from app.services.duplicates import describe_duplicates, possible_duplicates
+from app.services.pagination import KeysetPage
+from app.services.phones import diff_phones
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 from .. import bp
@@ -18,16 +22,11 @@ from .. import bp
 @bp.get("/fetch/students")
 @login_required
 def fetch_students() -> Response:
-    students: List[Student] = Student.query.all()
-
-    response: Response = Response(
-        json.dumps([student.to_dict() for student in students]),
-        status=200,
-        headers={"Content-Type": "application/json"},
+    return stream_json(
+        select(Student).options(*Student.load_profile()).order_by(Student.student_id),
+        Student.to_dict,
     )
 
-    return response
-
 
 @bp.get("/fetch/rows/students")
 @login_required
@@ -41,9 +40,33 @@ def fetch_students_rows() -> Response:
         (ColumnID("last_name"), ColumnName("Last Name")),
         (ColumnID("email"), ColumnName("Email")),
         (ColumnID("birthday"), ColumnName("Birthday")),
+        (ColumnID("active_enrollments_count"), ColumnName("Active Enrollments")),
     ]
 
-    students: List[Student] = Student.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Student).options(*Student.load_profile("row")),
+        Student.student_id,
+        sortable={
+            "first_name": Student.first_name,
+            "middle_name": Student.middle_name,
+            "last_name": Student.last_name,
+            "email": Student.email,
+            "birthday": Student.birthday,
+            "active_enrollments_count": Student.active_enrollments_count,
+            "closed_enrollments_count": Student.closed_enrollments_count,
+        },
+        searchable=[
+            Student.first_name,
+            Student.middle_name,
+            Student.last_name,
+            Student.email,
+        ],
+        filterable={
+            "active_enrollments_count": Student.active_enrollments_count,
+            "closed_enrollments_count": Student.closed_enrollments_count,
+        },
+    )
+    students: List[Student] = page.items
     rows: List[List] = []
 
     for student in students:
@@ -60,7 +83,7 @@ def fetch_students_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {"cols": cols, "rows": rows}
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
@@ -148,23 +171,17 @@ def update_student() -> Response:
 
             if form.phones.data:
                 nphones = json.loads(form.phones.data)
-                ophones = student.phones
-
-                for ophone in ophones:
-                    if ophone.phone_number not in nphones:
-                        db.session.delete(ophone)
-
-                for nphone in nphones:
-                    if (
-                        not db.session.query(StudentPhone)
-                        .filter(StudentPhone.phone_number == nphone)
-                        .first()
-                    ):
-                        phone = StudentPhone()
-                        phone.student_id = form.student_id.data
-                        phone.phone_number = nphone
-
-                        db.session.add(phone)
+                removed, added = diff_phones(student.phones, nphones)
+
+                for ophone in removed:
+                    db.session.delete(ophone)
+
+                for nphone in added:
+                    phone = StudentPhone()
+                    phone.student_id = student.student_id
+                    phone.phone_number = nphone
+
+                    db.session.add(phone)
             else:
                 for phone in student.phones:
                     db.session.delete(phone)
@@ -189,15 +206,16 @@ def update_student() -> Response:
 
                                 db.session.commit()
 
+                                # Identical uploads share one URL, so only this
+                                # student's own files count as already linked.
+                                linked: set = {f.file.file_url for f in student.files}
+
                                 files: List[File] = []
                                 for l in st:
-                                    if File.query.filter_by(file_url=l).first():
+                                    if l in linked:
                                         continue
 
-                                    path: pathlib.Path = pathlib.Path(l)
-                                    file: File = File()
-                                    file.file_name = path.name
-                                    file.file_url = path
+                                    file: File = File.from_link(l)
 
                                     files.append(file)
                                     db.session.add(file)
@@ -326,6 +344,10 @@ def add_student() -> Response:
         dct["category"] = "success"
         dct["id"] = student.student_id
 
+        if duplicates := possible_duplicates("student", student.student_id):
+            dct["duplicates"] = duplicates
+            dct["message"] += " " + describe_duplicates(duplicates)
+
         response.response = json.dumps(dct)
     else:
         dct = {"errors": form.errors}
@@ -1,9 +1,9 @@
 import json
-import pathlib
 from typing import Dict, List, Tuple, Union
 
 from flask import Response, current_app, request, url_for
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.blueprints.api import bp
 from app.extensions import console, db
@@ -11,32 +11,45 @@ from app.forms.teacher import AddTeacherForm, UpdateTeacherForm
 from app.models.file import File, TeacherFile
 from app.models.phone import TeacherPhone
 from app.models.teacher import Teacher
+from app.services.duplicates import describe_duplicates, possible_duplicates
+from app.services.pagination import KeysetPage
+from app.services.phones import diff_phones
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 
 @bp.get("/fetch/teachers")
 @login_required
 def fetch_teachers() -> Response:
-    teachers: List[Teacher] = Teacher.query.all()
-
-    response: Response = Response(headers={"Content-Type": "application/json"})
-
-    rows: List[Dict] = []
-
-    for teacher in teachers:
-        dct = teacher.to_dict()
-        rows.append(dct)
-
-    response.response = json.dumps(rows)
-    response.status_code = 200
-
-    return response
+    return stream_json(
+        select(Teacher).options(*Teacher.load_profile()).order_by(Teacher.teacher_id),
+        Teacher.to_dict,
+    )
 
 
 @bp.get("/fetch/rows/teachers")
 @login_required
 def fetch_teachers_rows():
-    teachers: List[Teacher] = Teacher.query.all()
+    page: KeysetPage = KeysetPage(
+        select(Teacher).options(*Teacher.load_profile("row")),
+        Teacher.teacher_id,
+        sortable={
+            "first_name": Teacher.first_name,
+            "middle_name": Teacher.middle_name,
+            "last_name": Teacher.last_name,
+            "email": Teacher.email,
+            "birthday": Teacher.birthday,
+            "total_students_count": Teacher.total_students_count,
+        },
+        searchable=[
+            Teacher.first_name,
+            Teacher.middle_name,
+            Teacher.last_name,
+            Teacher.email,
+        ],
+        filterable={"total_students_count": Teacher.total_students_count},
+    )
+    teachers: List[Teacher] = page.items
     response: Response = Response(headers={"Content-Type": "application/json"})
 
     cols: List[Tuple[ColumnID, ColumnName]] = [
@@ -46,6 +59,7 @@ def fetch_teachers_rows():
         (ColumnID("last_name"), ColumnName("Last Name")),
         (ColumnID("email"), ColumnName("Email")),
         (ColumnID("birthday"), ColumnName("Birthday")),
+        (ColumnID("total_students_count"), ColumnName("Students")),
     ]
     rows: List[List] = []
 
@@ -67,10 +81,7 @@ def fetch_teachers_rows():
 
         rows.append(row)
 
-    dct: Dict = {
-        "cols": cols,
-        "rows": rows,
-    }
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response.response = json.dumps(dct)
     response.status_code = 200
@@ -159,23 +170,17 @@ def update_teacher() -> Response:
 
             if form.phones.data:
                 nphones = json.loads(form.phones.data)
-                ophones = teacher.phones
+                removed, added = diff_phones(teacher.phones, nphones)
 
-                for ophone in ophones:
-                    if ophone.phone_number not in nphones:
-                        db.session.delete(ophone)
+                for ophone in removed:
+                    db.session.delete(ophone)
 
-                for nphone in nphones:
-                    if (
-                        not db.session.query(TeacherPhone)
-                        .filter(TeacherPhone.phone_number == nphone)
-                        .first()
-                    ):
-                        phone = TeacherPhone()
-                        phone.teacher_id = form.teacher_id.data
-                        phone.phone_number = nphone
+                for nphone in added:
+                    phone = TeacherPhone()
+                    phone.teacher_id = teacher.teacher_id
+                    phone.phone_number = nphone
 
-                        db.session.add(phone)
+                    db.session.add(phone)
 
                 db.session.commit()
             else:
@@ -206,16 +211,16 @@ def update_teacher() -> Response:
 
                                 db.session.commit()
 
+                                # Identical uploads share one URL, so only this
+                                # teacher's own files count as already linked.
+                                linked: set = {f.file.file_url for f in teacher.files}
+
                                 files: List[File] = []
                                 for l in st:
-                                    if File.query.filter_by(file_url=l).first():
+                                    if l in linked:
                                         continue
 
-                                    path: pathlib.Path = pathlib.Path(l)
-                                    file: File = File()
-                                    file.file_name = path.name
-                                    file.file_url = path
-                                    file.file_for = "resume"
+                                    file: File = File.from_link(l, file_for="resume")
 
                                     files.append(file)
                                     db.session.add(file)
@@ -325,16 +330,10 @@ def add_teacher() -> Response:
                                 files: List[File] = []
 
                                 for l in link:
-                                    if File.query.filter_by(file_url=l).first():
+                                    if l in {f.file_url for f in files}:
                                         continue
 
-                                    path: pathlib.Path = pathlib.Path(l)
-
-                                    file: File = File()
-
-                                    file.file_name = path.name
-                                    file.file_url = path
-                                    file.file_for = name
+                                    file: File = File.from_link(l, file_for=name)
 
                                     db.session.add(file)
                                     files.append(file)
@@ -370,6 +369,10 @@ def add_teacher() -> Response:
         dct["category"] = "success"
         dct["id"] = teacher.teacher_id
 
+        if duplicates := possible_duplicates("teacher", teacher.teacher_id):
+            dct["duplicates"] = duplicates
+            dct["message"] += " " + describe_duplicates(duplicates)
+
         response.response = json.dumps(dct)
     else:
         dct = {"errors": form.errors}
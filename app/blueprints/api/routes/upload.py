@@ -1,12 +1,12 @@
 import json
-import math
-import os
-from datetime import datetime as dt
-from typing import Dict, List
+from typing import Dict, List, Union
 
-from flask import Response, current_app, request, url_for
+from flask import Response, request
 from flask_login import login_required
-from werkzeug.utils import secure_filename
+
+from app.services.images import image_derivatives
+from app.services.storage import content_store
+from app.services.uploads import ChunkedUpload, UploadError
 
 from .. import bp
 
@@ -19,30 +19,14 @@ def upload() -> Response:
     lst: List[Dict] = []
 
     for file in request.files.values():
-        dst = os.path.join(
-            current_app.config["UPLOAD_FOLDER"],
-            today := dt.now().strftime("%Y-%m-%d"),
-        )
-
-        os.makedirs(dst, exist_ok=True)
-
         if file.filename:
-            file.save(
-                os.path.join(
-                    dst,
-                    filename := f"{math.floor(dt.now().timestamp())}_{secure_filename(file.filename)}",
-                )
-            )
+            stored: Dict = content_store.save(file.stream, file.filename)
+            image_derivatives.enqueue(stored["url"])
 
             lst.append(
                 {
                     "message": "File successfully uploaded.",
-                    "file": {
-                        "name": file.filename,
-                        "url": url_for(
-                            "static", filename=f"uploads/{today}/{filename}"
-                        ),
-                    },
+                    "file": stored,
                     "status": 200,
                 }
             )
@@ -50,3 +34,118 @@ def upload() -> Response:
     response.response = json.dumps(lst)
 
     return response
+
+
+def _json(dct: Union[Dict, List], status: int = 200) -> Response:
+    return Response(
+        json.dumps(dct),
+        status=status,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@bp.errorhandler(UploadError)
+def upload_error(err: UploadError) -> Response:
+    dct: Dict = {"message": str(err), "category": "error", "status": err.status}
+
+    if err.offset is not None:
+        dct["offset"] = err.offset
+
+    return _json(dct, err.status)
+
+
+@bp.post("/upload/chunked")
+@login_required
+def init_chunked_upload() -> Response:
+    """Start a resumable upload: ``{"name", "size", "sha256"?}``."""
+    data: Dict = request.get_json(silent=True) or request.form.to_dict()
+
+    try:
+        size: int = int(data.get("size", -1))
+    except (TypeError, ValueError):
+        raise UploadError("Invalid size.")
+
+    sha256: Union[str, None] = (data.get("sha256") or "").lower() or None
+
+    # Already stored: nothing needs to be sent.
+    if sha256 and (file := content_store.find(sha256, data.get("name", ""))):
+        return _json({"complete": True, "file": file})
+
+    upload: ChunkedUpload = ChunkedUpload.create(data.get("name", ""), size, sha256)
+
+    return _json(upload.to_dict(), 201)
+
+
+@bp.post("/upload/check")
+@login_required
+def check_upload() -> Response:
+    """Look up ``{"name", "sha256"}`` in the store before sending any bytes."""
+    data: Dict = request.get_json(silent=True) or request.form.to_dict()
+    file: Union[Dict, None] = content_store.find(
+        data.get("sha256", ""), data.get("name", "")
+    )
+
+    if file is None:
+        return _json({"message": "Not stored yet.", "category": "info"}, 404)
+
+    return _json(
+        [
+            {
+                "message": "File successfully uploaded.",
+                "file": file,
+                "status": 200,
+            }
+        ]
+    )
+
+
+@bp.get("/upload/chunked/<upload_id>")
+@login_required
+def chunked_upload_status(upload_id: str) -> Response:
+    return _json(ChunkedUpload.load(upload_id).to_dict())
+
+
+@bp.put("/upload/chunked/<upload_id>")
+@login_required
+def append_chunk(upload_id: str) -> Response:
+    """Append the raw request body at ``?offset=``.
+
+    ``X-Chunk-SHA256`` optionally carries the checksum of this chunk.
+    """
+    upload: ChunkedUpload = ChunkedUpload.load(upload_id)
+
+    offset: int = request.args.get("offset", type=int, default=-1)
+    upload.append(
+        request.stream,
+        offset,
+        request.content_length,
+        request.headers.get("X-Chunk-SHA256"),
+    )
+
+    return _json(upload.to_dict())
+
+
+@bp.post("/upload/chunked/<upload_id>/finalize")
+@login_required
+def finalize_chunked_upload(upload_id: str) -> Response:
+    data: Dict = request.get_json(silent=True) or request.form.to_dict()
+    file: Dict = ChunkedUpload.load(upload_id).finalize(data.get("sha256"))
+    image_derivatives.enqueue(file["url"])
+
+    return _json(
+        [
+            {
+                "message": "File successfully uploaded.",
+                "file": file,
+                "status": 200,
+            }
+        ]
+    )
+
+
+@bp.delete("/upload/chunked/<upload_id>")
+@login_required
+def abort_chunked_upload(upload_id: str) -> Response:
+    ChunkedUpload.load(upload_id).abort()
+
+    return _json({"message": "Upload aborted.", "category": "success"})
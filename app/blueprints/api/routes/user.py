@@ -3,32 +3,51 @@ from typing import Dict, List, Tuple, Union
 
 from flask import Response, request, url_for
 from flask_login import login_required
+from sqlalchemy import select
 
 from app.blueprints.api import bp
 from app.constants import DEFAULT_AVATAR
 from app.extensions import console, db
 from app.forms import AddUserForm, UpdateUserForm
 from app.models.user import User
+from app.services.pagination import KeysetPage
+from app.services.streaming import stream_json
 from app.types import ColumnID, ColumnName
 
 
 @bp.get("/fetch/users")
 @login_required
 def fetch_users() -> Response:
-    users: List[User] = [user.to_dict() for user in User.query.all()]
-
-    response: Response = Response(
-        json.dumps(users), headers={"Content-Type": "application/json"}
+    return stream_json(
+        select(User).options(*User.load_profile()).order_by(User.user_id),
+        User.to_dict,
     )
-    response.status_code = 200
-
-    return response
 
 
 @bp.get("/fetch/rows/users")
 @login_required
 def fetch_users_rows() -> Response:
-    users: List[User] = User.query.all()
+    page: KeysetPage = KeysetPage(
+        select(User).options(*User.load_profile("row")),
+        User.user_id,
+        sortable={
+            "first_name": User.first_name,
+            "middle_name": User.middle_name,
+            "last_name": User.last_name,
+            "user_name": User.user_name,
+            "email": User.email,
+            "birthday": User.birthday,
+        },
+        searchable=[
+            User.first_name,
+            User.middle_name,
+            User.last_name,
+            User.user_name,
+            User.email,
+        ],
+        filterable={"role": User.role},
+    )
+    users: List[User] = page.items
 
     cols: List[Tuple[ColumnID, ColumnName]] = [
         (ColumnID("user_id"), ColumnName("User ID")),
@@ -53,10 +72,7 @@ def fetch_users_rows() -> Response:
 
         rows.append(row)
 
-    dct: Dict = {
-        "cols": cols,
-        "rows": rows,
-    }
+    dct: Dict = {"cols": cols, "rows": rows, **page.meta()}
 
     response: Response = Response(
         json.dumps(dct),
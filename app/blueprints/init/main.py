@@ -7,11 +7,12 @@ from app.blueprints.init import bp
 from app.extensions import console, db
 from app.forms.setting import SettingForm
 from app.models.setting import Setting
+from app.services.settings import setting_cache
 
 
 @bp.before_request
 def _():
-    if Setting.query.first():
+    if setting_cache.exists():
         return redirect(url_for("main.home"))
 
 
@@ -30,6 +31,8 @@ def setup() -> Union[str, Response]:
                 db.session.add(setting)
                 db.session.commit()
 
+                setting_cache.invalidate()
+
                 dct = {}
 
                 dct["message"] = "Setting successfully saved!"
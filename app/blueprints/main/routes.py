@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List
 
-from flask import Response, render_template
+from flask import Response, render_template, request, url_for
 
 from app.forms.contact import ContactForm
 from app.forms.newsletter import NewsletterForm
@@ -8,9 +8,13 @@ from app.forms.search import SearchForm
 from app.models.course import Course
 from app.models.student import Student
 from app.models.teacher import Teacher
+from app.services.search import search as search_index
 
 from . import bp
 
+# Page links shown around the current page of the search results.
+PAGER_WINDOW: int = 5
+
 
 @bp.context_processor
 def _():
@@ -43,14 +47,36 @@ def contact() -> str:
 
 @bp.get("/courses")
 def courses() -> str:
-    courses: List[Course] = Course.query.all()
+    query = Course.query
+
+    if teacher_id := request.args.get("teacher", type=int):
+        query = query.filter_by(teacher_id=teacher_id)
+
+    courses: List[Course] = query.all()
 
     return render_template("main/pages/courses.html", title="Courses", courses=courses)
 
 
 @bp.get("/search")
 def search():
-    return render_template("main/pages/result.html", title="Result")
+    keyword: str = request.args.get("keyword", "").strip()
+    page: int = request.args.get("page", 1, type=int)
+    result: Dict = search_index(keyword, page)
+
+    for item in result["items"]:
+        item["url"] = (
+            url_for("main.courses", _anchor=f"course-{item['id']}")
+            if item["kind"] == "course"
+            else url_for("main.courses", teacher=item["id"])
+        )
+
+    last_page: int = result["pages"]
+    first: int = max(
+        1, min(result["page"] - PAGER_WINDOW // 2, last_page - PAGER_WINDOW + 1)
+    )
+    result["window"] = range(first, min(last_page, first + PAGER_WINDOW - 1) + 1)
+
+    return render_template("main/pages/result.html", title="Result", result=result)
 
 
 @bp.post("/newsletter")
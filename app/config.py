@@ -20,8 +20,95 @@ class Config:
 
     UPLOAD_FOLDER = os.path.join("app", "static", "uploads")
 
+    # Seconds an unreferenced upload is kept before it may be deleted
+    UPLOAD_GRACE_PERIOD = float(os.getenv("UPLOAD_GRACE_PERIOD", "86400"))
+
+    # Periodic removal of unreferenced uploads (see app/services/orphans.py);
+    # 0 disables it, `flask files gc` can be run from cron instead
+    UPLOAD_GC_INTERVAL = float(os.getenv("UPLOAD_GC_INTERVAL", "0"))
+    UPLOAD_GC_QUARANTINE = os.getenv("UPLOAD_GC_QUARANTINE", "false").lower() == "true"
+
+    # Downloads of uploaded files (see app/services/downloads.py): "" serves
+    # them from Python, "x-sendfile" (Apache, lighttpd) or "x-accel-redirect"
+    # (nginx, with an internal location at DOWNLOAD_ACCEL_PREFIX aliased to
+    # UPLOAD_FOLDER) hands the transfer to the front proxy
+    DOWNLOAD_OFFLOAD = os.getenv("DOWNLOAD_OFFLOAD", "")
+    DOWNLOAD_ACCEL_PREFIX = os.getenv("DOWNLOAD_ACCEL_PREFIX", "/internal/uploads/")
+    DOWNLOAD_MAX_AGE = int(os.getenv("DOWNLOAD_MAX_AGE", str(365 * 24 * 3600)))
+
+    # Streamed ZIP downloads of an entity's files (see app/services/streaming.py)
+    ARCHIVE_CHUNK_SIZE = int(os.getenv("ARCHIVE_CHUNK_SIZE", str(256 * 1024)))
+    ARCHIVE_MAX_CONCURRENT = int(os.getenv("ARCHIVE_MAX_CONCURRENT", "4"))
+
+    # Chunked uploads (see app/services/uploads.py)
+    UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(16 * 1024 * 1024)))
+    UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", str(4 * 1024 * 1024 * 1024)))
+
+    # Image variants, name -> width in pixels (see app/services/images.py)
+    IMAGE_VARIANTS = {"thumb": 96, "card": 480, "full": 1600}
+    IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "webp")
+    IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "80"))
+    IMAGE_CACHE_SIZE = int(os.getenv("IMAGE_CACHE_SIZE", "4096"))
+
     CURRENCY_SYMBOL = chr(36)
 
     DEFAULT_AVATAR = "admin/assets/img/default-avatar.png"
 
     APP_DIR = "app"
+
+    # Rows per page of the admin tables (see app/services/pagination.py)
+    TABLE_PAGE_SIZE = int(os.getenv("TABLE_PAGE_SIZE", "50"))
+    TABLE_MAX_PAGE_SIZE = int(os.getenv("TABLE_MAX_PAGE_SIZE", "500"))
+
+    # ORM objects per batch of the streamed /api/fetch/* responses
+    STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+
+    # Background re-verification of file metadata (see app/services/files.py);
+    # 0 disables it, `flask files verify` can be run from cron instead
+    FILE_VERIFY_INTERVAL = float(os.getenv("FILE_VERIFY_INTERVAL", "0"))
+    FILE_VERIFY_BATCH_SIZE = int(os.getenv("FILE_VERIFY_BATCH_SIZE", "200"))
+    FILE_VERIFY_MAX_AGE = float(os.getenv("FILE_VERIFY_MAX_AGE", "86400"))
+
+    # Seconds the salary averages are memoized for (see app/services/salaries.py)
+    SALARY_STATS_TTL = float(os.getenv("SALARY_STATS_TTL", "300"))
+
+    # Results per page of the public site search (see app/services/search.py)
+    SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "10"))
+
+    # Default and maximum matches of /api/search/people (see app/services/people.py)
+    PEOPLE_SEARCH_LIMIT = int(os.getenv("PEOPLE_SEARCH_LIMIT", "10"))
+    PEOPLE_SEARCH_MAX_LIMIT = int(os.getenv("PEOPLE_SEARCH_MAX_LIMIT", "50"))
+
+    # Suggestions per /api/autocomplete/* lookup, per-worker LRU size and how
+    # long other workers may serve stale suggestions (see
+    # app/services/autocomplete.py)
+    AUTOCOMPLETE_LIMIT = int(os.getenv("AUTOCOMPLETE_LIMIT", "10"))
+    AUTOCOMPLETE_CACHE_SIZE = int(os.getenv("AUTOCOMPLETE_CACHE_SIZE", "512"))
+    AUTOCOMPLETE_CACHE_TTL = float(os.getenv("AUTOCOMPLETE_CACHE_TTL", "60"))
+
+    # Country code of numbers typed without one, used to normalize phone
+    # numbers for the shared index (see app/services/phones.py)
+    PHONE_COUNTRY_CODE = os.getenv("PHONE_COUNTRY_CODE", "93")
+
+    # Duplicate-person detection (see app/services/duplicates.py): lowest
+    # similarity reported, and blocks larger than this are skipped by the scan
+    DEDUPE_MIN_SCORE = float(os.getenv("DEDUPE_MIN_SCORE", "0.6"))
+    DEDUPE_MAX_BLOCK = int(os.getenv("DEDUPE_MAX_BLOCK", "50"))
+
+    # Seconds a page of the unpaid-dues report is memoized for (see app/services/dues.py)
+    DUES_CACHE_TTL = float(os.getenv("DUES_CACHE_TTL", "300"))
+
+    # Seconds the admin dashboard statistics are memoized for
+    DASHBOARD_STATS_TTL = float(os.getenv("DASHBOARD_STATS_TTL", "60"))
+
+    # Touched whenever the Setting row changes (see app/services/settings.py);
+    # defaults to "setting.version" in the app's instance folder
+    SETTING_VERSION_FILE = os.getenv("SETTING_VERSION_FILE")
+
+    # Page-view recording (see app/services/views.py)
+    VIEW_RECORDER_ENABLED = os.getenv("VIEW_RECORDER_ENABLED", "true").lower() == "true"
+    VIEW_QUEUE_SIZE = int(os.getenv("VIEW_QUEUE_SIZE", "10000"))
+    VIEW_BATCH_SIZE = int(os.getenv("VIEW_BATCH_SIZE", "500"))
+    VIEW_FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "2"))
+    VIEW_OVERLOAD_POLICY = os.getenv("VIEW_OVERLOAD_POLICY", "drop")  # or "sample"
+    VIEW_SAMPLE_RATE = float(os.getenv("VIEW_SAMPLE_RATE", "0.1"))
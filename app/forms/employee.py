@@ -21,7 +21,7 @@ from wtforms.validators import (
     ValidationError,
 )
 
-from app.models.phone import EmployeePhone
+from app.services.phones import check_phones
 
 from ..extensions import db
 from ..models.employee import Employee
@@ -56,18 +56,8 @@ class AddEmployeeForm(FlaskForm):
             raise ValidationError("Email already registered")
 
     def validate_phones(self, phones):
-        nums = json.loads(phones.data)
-
-        for num in nums:
-            if (
-                db.session.query(EmployeePhone)
-                .filter(
-                    EmployeePhone.phone_number == num,
-                )
-                .first()
-            ):
-
-                raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        if error := check_phones(json.loads(phones.data), "employee"):
+            raise ValidationError(error)
 
     def validate_job_id(self, job_id) -> None:
         pattern: re.Pattern = re.compile(r"^\d{0,}$")
@@ -96,22 +86,16 @@ class UpdateEmployeeForm(AddEmployeeForm):
         ):
             raise ValidationError("Email already registered")
 
+    def validate_employee_id(self, employee_id) -> None:
+        if not str(employee_id.data).isdigit():
+            raise ValidationError("Not a valid decimal value.")
+
     def validate_phones(self, phones):
         nums = json.loads(phones.data)
 
-        if hasattr(self, "employee_id"):
-            employee_id = self.employee_id.data
-
-            for num in nums:
-                if (
-                    db.session.query(EmployeePhone)
-                    .filter(
-                        and_(
-                            EmployeePhone.employee_id != employee_id,
-                            EmployeePhone.phone_number == num,
-                        )
-                    )
-                    .first()
-                ):
-
-                    raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        # employee_id is validated after phones; a bad id is reported there.
+        if not str(self.employee_id.data).isdigit():
+            return
+
+        if error := check_phones(nums, "employee", int(self.employee_id.data)):
+            raise ValidationError(error)
@@ -22,7 +22,7 @@ from wtforms.validators import (
     ValidationError,
 )
 
-from app.models.phone import StudentPhone
+from app.services.phones import check_phones
 
 from ..extensions import db
 from ..models.job import Job
@@ -51,18 +51,8 @@ class AddStudentForm(FlaskForm):
             raise ValidationError("Email already registered")
 
     def validate_phones(self, phones):
-        nums = json.loads(phones.data)
-
-        for num in nums:
-            if (
-                db.session.query(StudentPhone)
-                .filter(
-                    StudentPhone.phone_number == num,
-                )
-                .first()
-            ):
-
-                raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        if error := check_phones(json.loads(phones.data), "student"):
+            raise ValidationError(error)
 
     def validate_job_id(self, job_id) -> None:
         pattern: re.Pattern = re.compile(r"^\d{0,}$")
@@ -95,22 +85,16 @@ class UpdateStudentForm(AddStudentForm):
         ):
             raise ValidationError("Email already registered")
 
+    def validate_student_id(self, student_id) -> None:
+        if not str(student_id.data).isdigit():
+            raise ValidationError("Not a valid decimal value.")
+
     def validate_phones(self, phones):
         nums = json.loads(phones.data)
 
-        if hasattr(self, "student_id"):
-            student_id = self.student_id.data
-
-            for num in nums:
-                if (
-                    db.session.query(StudentPhone)
-                    .filter(
-                        and_(
-                            StudentPhone.student_id != student_id,
-                            StudentPhone.phone_number == num,
-                        )
-                    )
-                    .first()
-                ):
-
-                    raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        # student_id is validated after phones; a bad id is reported there.
+        if not str(self.student_id.data).isdigit():
+            return
+
+        if error := check_phones(nums, "student", int(self.student_id.data)):
+            raise ValidationError(error)
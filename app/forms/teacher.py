@@ -23,7 +23,7 @@ from wtforms.validators import (
     ValidationError,
 )
 
-from app.models.phone import TeacherPhone
+from app.services.phones import check_phones
 
 from ..extensions import db
 from ..models.teacher import Teacher
@@ -62,18 +62,8 @@ class AddTeacherForm(FlaskForm):
             raise ValidationError("Email already registered")
 
     def validate_phones(self, phones):
-        nums = json.loads(phones.data)
-
-        for num in nums:
-            if (
-                db.session.query(TeacherPhone)
-                .filter(
-                    TeacherPhone.phone_number == num,
-                )
-                .first()
-            ):
-
-                raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        if error := check_phones(json.loads(phones.data), "teacher"):
+            raise ValidationError(error)
 
 
 class UpdateTeacherForm(AddTeacherForm):
@@ -94,23 +84,16 @@ class UpdateTeacherForm(AddTeacherForm):
         ):
             raise ValidationError("Email already registered")
 
-    def validate_phones(self, phones):
+    def validate_teacher_id(self, teacher_id) -> None:
+        if not str(teacher_id.data).isdigit():
+            raise ValidationError("Not a valid decimal value.")
 
+    def validate_phones(self, phones):
         nums = json.loads(phones.data)
 
-        if hasattr(self, "employee_id"):
-            teacher_id = self.teacher_id.data
-
-            for num in nums:
-                if (
-                    db.session.query(TeacherPhone)
-                    .filter(
-                        and_(
-                            TeacherPhone.teacher_id != teacher_id,
-                            TeacherPhone.phone_number == num,
-                        )
-                    )
-                    .first()
-                ):
-
-                    raise ValidationError(f"Duplicate entry {num!r} for phone number!")
+        # teacher_id is validated after phones; a bad id is reported there.
+        if not str(self.teacher_id.data).isdigit():
+            return
+
+        if error := check_phones(nums, "teacher", int(self.teacher_id.data)):
+            raise ValidationError(error)
@@ -1,12 +1,15 @@
 import app.models.base
 
+from .block import person_blocks
 from .course import Course
+from .due import dues
 from .employee import Employee
 from .enrollment import Enrollment
 from .file import File, StudentFile, TeacherFile
 from .job import Job
 from .payment import Payment
-from .phone import EmployeePhone, StudentPhone, TeacherPhone
+from .phone import EmployeePhone, StudentPhone, TeacherPhone, phone_index
+from .rollup import daily_rollups
 from .setting import Setting
 from .student import Student
 from .teacher import Teacher
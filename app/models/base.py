@@ -1,11 +1,14 @@
 import random
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 
 from numerize import numerize
-from sqlalchemy import Column, Integer, String, event, extract, func
+from sqlalchemy import Column, Integer, String, and_, case, event, func, select
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.extensions import db
+from app.models.rollup import rollup_windows
 
 
 class Base(db.Model):
@@ -28,6 +31,15 @@ class Base(db.Model):
         nullable=False,
     )
 
+    @classmethod
+    def load_profile(cls, name: str = "dict") -> List[LoaderOption]:
+        """Relationship loaders a serializer needs, so lists avoid N+1 queries.
+
+        ``"dict"`` covers ``to_dict``; models override this next to their
+        serializers and may add other profiles (e.g. ``"row"`` for table rows).
+        """
+        return []
+
     def get_display_value(self, attr):
         value = getattr(self, attr, None)
         return "N/A" if value is None else value
@@ -41,26 +53,13 @@ class Base(db.Model):
 
     @classmethod
     def weekly_growth(cls):
-        now = datetime.now(timezone.utc)
+        today = datetime.now(timezone.utc).date()
 
-        start_of_week = datetime.combine(
-            (now - timedelta(days=now.weekday())).date(),
-            datetime.min.time(),
-            tzinfo=timezone.utc,
-        )
+        start_of_week = today - timedelta(days=today.weekday())
         start_of_last_week = start_of_week - timedelta(weeks=1)
-        end_of_last_week = start_of_week
-
-        current_week = (
-            db.session.query(cls).filter(cls.created_at >= start_of_week).count()
-        )
 
-        previous_week = (
-            db.session.query(cls)
-            .filter(
-                cls.created_at >= start_of_last_week, cls.created_at < end_of_last_week
-            )
-            .count()
+        current_week, previous_week = cls._created_counts(
+            [(start_of_week, None), (start_of_last_week, start_of_week)]
         )
 
         return cls._percent_change(current_week, previous_week)
@@ -74,19 +73,11 @@ class Base(db.Model):
 
     @classmethod
     def monthly_growth(cls):
-        current_month = datetime.now().month
-        last_month = current_month - 1 if current_month > 1 else 12
+        start_of_month = datetime.now(timezone.utc).date().replace(day=1)
+        start_of_last_month = (start_of_month - timedelta(days=1)).replace(day=1)
 
-        current_count = (
-            db.session.query(func.count(cls.created_at))
-            .filter(extract("month", cls.created_at) == current_month)
-            .scalar()
-        )
-
-        previous_count = (
-            db.session.query(func.count(cls.created_at))
-            .filter(extract("month", cls.created_at) == last_month)
-            .scalar()
+        current_count, previous_count = cls._created_counts(
+            [(start_of_month, None), (start_of_last_month, start_of_month)]
         )
 
         return cls._percent_change(current_count, previous_count)
@@ -105,6 +96,30 @@ class Base(db.Model):
 
         return growth
 
+    @classmethod
+    def _created_counts(cls, windows: List[Tuple[date, Optional[date]]]) -> List[int]:
+        """Rows created in each ``[start, end)`` window: read from the daily
+        rollups when the table has them, else counted over ``created_at``."""
+        from app.services.rollups import TRACKED
+
+        if cls.__tablename__ in TRACKED:
+            return [count for count, _ in rollup_windows(cls.__tablename__, windows)]
+
+        def midnight(day: date) -> datetime:
+            return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+
+        columns = []
+
+        for start, end in windows:
+            condition = cls.created_at >= midnight(start)
+
+            if end is not None:
+                condition = and_(condition, cls.created_at < midnight(end))
+
+            columns.append(func.count(case((condition, 1))))
+
+        return list(db.session.execute(select(*columns).select_from(cls)).one())
+
     @staticmethod
     def _percent_change(current, previous):
         if previous == 0:
@@ -116,11 +131,15 @@ class Base(db.Model):
         return numerize.numerize(cls.query.count(), 2)
 
 
+def make_uid(cls) -> str:
+    prefix = cls.__name__[0].upper()  # First letter of class name
+    random_number = random.randint(100000, 999999)
+    return f"{prefix}-{random_number}"
+
+
 @event.listens_for(Base, "before_insert", propagate=True)
 def generate_uid(mapper, connection, target):
-    prefix = target.__class__.__name__[0].upper()  # First letter of class name
-    random_number = random.randint(100000, 999999)
-    target.uid = f"{prefix}-{random_number}"
+    target.uid = make_uid(target.__class__)
 
 
 db.Model = Base
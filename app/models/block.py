@@ -0,0 +1,12 @@
+from app.extensions import db
+
+# Plain table rather than a model: rows are derived from people and phones by
+# app/services/duplicates.py.  ``key`` leads the primary key so a block is one
+# index range; the second index finds the keys of one person.
+person_blocks = db.Table(
+    "person_blocks",
+    db.Column("key", db.String(64), primary_key=True),  # e.g. "n:M530R250"
+    db.Column("kind", db.String(10), primary_key=True),  # student/teacher/employee
+    db.Column("person_id", db.Integer, primary_key=True),
+    db.Index("ix_person_blocks_person", "kind", "person_id"),
+)
@@ -1,10 +1,12 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import selectinload
 
 from app.constants import CURRENCY_SYMBOL
 from app.extensions import db
-from app.models.enrollment import EnrollmentStatus
+from app.models.enrollment import Enrollment, EnrollmentStatus
 from app.models.file import CourseFile, File
 
 
@@ -20,17 +22,25 @@ class Course(db.Model):
     )
 
     # Course Info
-    course_title = db.Column(db.String(100), nullable=False)
+    course_title = db.Column(db.String(100), nullable=False, index=True)
     course_description = db.Column(db.Text, nullable=True)
 
     # Schedule
-    start_date = db.Column(db.Date, nullable=False)
-    end_date = db.Column(db.Date, nullable=False)
-    start_time = db.Column(db.Time, nullable=True)
-    end_time = db.Column(db.Time, nullable=True)
+    start_date = db.Column(db.Date, nullable=False, index=True)
+    end_date = db.Column(db.Date, nullable=False, index=True)
+    start_time = db.Column(db.Time, nullable=True, index=True)
+    end_time = db.Column(db.Time, nullable=True, index=True)
 
     # Financials
-    monthly_fee = db.Column(db.Numeric(12, 2), nullable=True)
+    monthly_fee = db.Column(db.Numeric(12, 2), nullable=True, index=True)
+
+    # Counters kept exact by app/services/counters.py
+    active_enrollments_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
+    closed_enrollments_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
 
     # Relationships
     teacher = db.relationship("Teacher", back_populates="courses")
@@ -41,6 +51,11 @@ class Course(db.Model):
         "CourseFile", back_populates="course", cascade="all, delete, delete-orphan"
     )
 
+    # Covering index for the title prefix lookups of app/services/autocomplete.py
+    __table_args__ = (
+        db.Index("ix_courses_title_lower", func.lower(course_title), course_title),
+    )
+
     def __repr__(self):
         return f"<Course {self.course_title} ID={self.course_id}>"
 
@@ -75,38 +90,58 @@ class Course(db.Model):
 
         return "N/A"
 
-    @property
-    def active_enrollments_count(self) -> int:
-        """Count of active enrollments."""
-        return len(
-            [
-                e
-                for e in self.enrollments
-                if e.status.value == EnrollmentStatus.ACTIVE.value
-            ]
+    @classmethod
+    def _earnings(cls):
+        """SUM of ``Enrollment.monthly_fee`` of active enrollments (joined to
+        courses), each rounded to cents as billed."""
+        return func.coalesce(func.sum(Enrollment._discounted(cls.monthly_fee)), 0)
+
+    @hybrid_property
+    def monthly_earnings(self) -> float:
+        total = db.session.scalar(
+            select(self._earnings())
+            .select_from(Enrollment)
+            .join(Course)
+            .where(
+                Enrollment.course_id == self.course_id,
+                Enrollment.status == EnrollmentStatus.ACTIVE,
+            )
         )
+        return round(float(total), 2)
 
-    @property
-    def closed_enrollments_count(self) -> int:
-        """Count of closed enrollments."""
-        return len(
-            [
-                e
-                for e in self.enrollments
-                if e.status.value == EnrollmentStatus.CLOSED.value
-            ]
+    @monthly_earnings.inplace.expression
+    @classmethod
+    def _monthly_earnings_expression(cls):
+        return (
+            select(cls._earnings())
+            .where(
+                Enrollment.course_id == cls.course_id,
+                Enrollment.status == EnrollmentStatus.ACTIVE,
+            )
+            .scalar_subquery()
         )
 
-    @property
-    def monthly_earnings(self) -> float:
-        total = sum(
-            [
-                float(e.monthly_fee or 0)
-                for e in self.enrollments
-                if e.status == EnrollmentStatus.ACTIVE
-            ]
+    @classmethod
+    def monthly_earnings_for(cls, course_ids: Iterable[int]) -> Dict[int, float]:
+        """Return ``{course_id: monthly_earnings}`` in one grouped query."""
+        ids = list(course_ids)
+        earnings: Dict[int, float] = {course_id: 0.0 for course_id in ids}
+
+        rows = db.session.execute(
+            select(Enrollment.course_id, cls._earnings())
+            .join(Course)
+            .where(
+                Enrollment.course_id.in_(ids),
+                Enrollment.status == EnrollmentStatus.ACTIVE,
+            )
+            .group_by(Enrollment.course_id)
+        ).all()
+
+        earnings.update(
+            {course_id: round(float(total), 2) for course_id, total in rows}
         )
-        return round(total, 2)
+
+        return earnings
 
     @property
     def display_monthly_earnings(self) -> str:
@@ -124,6 +159,14 @@ class Course(db.Model):
             self.updated_at.strftime("%Y-%m-%d %H:%M:%S") if self.updated_at else "N/A"
         )
 
+    @classmethod
+    def load_profile(cls, name: str = "dict"):
+        match name:
+            case "dict":
+                return [selectinload(cls.files).joinedload(CourseFile.file)]
+            case _:
+                return super().load_profile(name)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "course_id": self.course_id,
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from app.extensions import db
+
+# Plain table rather than a model: rows are generated by the set-based billing
+# run (see app/services/billing.py), so they don't carry the uid/timestamp
+# columns of ``Base``.  The primary key makes a run idempotent per month.
+dues = db.Table(
+    "dues",
+    db.Column(
+        "enrollment_id",
+        db.Integer,
+        db.ForeignKey("enrollments.enrollment_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column("month_for", db.String(20), primary_key=True),  # e.g. "2025-09"
+    db.Column("amount", db.Numeric(12, 2), nullable=False),
+    db.Column(
+        "created_at",
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    ),
+)
@@ -1,6 +1,7 @@
 from datetime import date, datetime, timezone
 
 from flask import url_for
+from sqlalchemy.orm import selectinload
 
 from app.constants import CURRENCY_SYMBOL, DEFAULT_AVATAR
 from app.extensions import db
@@ -16,9 +17,9 @@ class Employee(db.Model):
     job_id = db.Column(db.Integer, db.ForeignKey("jobs.job_id"), nullable=True)
 
     # Personal Info
-    first_name = db.Column(db.String(50), nullable=False)
-    middle_name = db.Column(db.String(50))
-    last_name = db.Column(db.String(50), nullable=False)
+    first_name = db.Column(db.String(50), nullable=False, index=True)
+    middle_name = db.Column(db.String(50), index=True)
+    last_name = db.Column(db.String(50), nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=True, index=True)
     birthday = db.Column(db.Date, nullable=True)
 
@@ -32,7 +33,7 @@ class Employee(db.Model):
     address = db.Column(db.String(255), nullable=True)
     salary = db.Column(db.Numeric(12, 2), nullable=True)
     hire_date = db.Column(
-        db.Date, nullable=False, default=datetime.now(timezone.utc).date
+        db.Date, nullable=False, default=datetime.now(timezone.utc).date, index=True
     )
 
     # Relationships
@@ -44,6 +45,14 @@ class Employee(db.Model):
     def __repr__(self):
         return f"<Employee {self.first_name} {self.last_name} ID={self.employee_id}>"
 
+    @classmethod
+    def load_profile(cls, name: str = "dict"):
+        match name:
+            case "dict":
+                return [selectinload(cls.phones)]
+            case _:
+                return super().load_profile(name)
+
     def to_dict(self):
         dct = {
             "employee_id": self.employee_id,
@@ -79,11 +88,14 @@ class Employee(db.Model):
 
     @property
     def is_salary_gt_avg(self) -> bool:
-        employees = self.query.all()
-        lst = [employee.salary.__int__() for employee in employees]
-        average_salary = sum(lst) / len(lst)
+        from app.services.salaries import salary_stats
+
+        average: float | None = salary_stats.average("employees")
+
+        if self.salary is None or average is None:
+            return False
 
-        return self.salary > average_salary
+        return float(self.salary) > average
 
     # --- Display properties for templates ---
     @property
@@ -1,10 +1,19 @@
 import enum
 from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, Optional
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import UniqueConstraint, exists, func, select, type_coerce
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
+from sqlalchemy.orm import selectinload
 
 from app.constants import CURRENCY_SYMBOL
 from app.extensions import db
+from app.models.payment import Payment
+
+
+def current_month() -> str:
+    return datetime.now().strftime("%Y-%m")
 
 
 class EnrollmentStatus(enum.Enum):
@@ -29,11 +38,19 @@ class Enrollment(db.Model):
 
     # Enrollment Info
     enrollment_date = db.Column(
-        db.Date, nullable=False, default=lambda: datetime.now(timezone.utc).date()
+        db.Date,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).date(),
+        index=True,
     )
-    discount_rate = db.Column(db.Numeric(5, 2), nullable=True)  # e.g., 10.00 for 10%
+    discount_rate = db.Column(
+        db.Numeric(5, 2), nullable=True, index=True
+    )  # e.g., 10.00 for 10%
     status = db.Column(
-        db.Enum(EnrollmentStatus), nullable=False, default=EnrollmentStatus.ACTIVE
+        db.Enum(EnrollmentStatus),
+        nullable=False,
+        default=EnrollmentStatus.ACTIVE,
+        index=True,
     )
 
     # Relationships
@@ -47,30 +64,121 @@ class Enrollment(db.Model):
         UniqueConstraint("student_id", "course_id", name="uix_student_course"),
     )
 
-    @property
-    def monthly_fee(self):
-        m = self.course.monthly_fee
-        return round(m - (m / 100 * self.discount_rate), 2)
-
-    @property
-    def monthly_discount(self):
-        m = self.course.monthly_fee
-        return m - self.monthly_fee
-
-    @property
+    @hybrid_property
+    def monthly_fee(self) -> Optional[Decimal]:
+        """Course fee minus the discount; ``None`` if the course has no fee."""
+        fee = self.course.monthly_fee
+
+        if fee is None:
+            return None
+
+        # Half away from zero, like SQL ``round()``; ``round()`` is half-even.
+        return (fee * (100 - (self.discount_rate or 0)) / 100).quantize(
+            Decimal("0.01"), ROUND_HALF_UP
+        )
+
+    @monthly_fee.inplace.expression
+    @classmethod
+    def _monthly_fee_expression(cls):
+        from app.models.course import Course
+
+        return (
+            select(cls._discounted(Course.monthly_fee))
+            .where(Course.course_id == cls.course_id)
+            .scalar_subquery()
+        )
+
+    @hybrid_property
+    def monthly_discount(self) -> Optional[Decimal]:
+        fee = self.course.monthly_fee
+
+        if fee is None:
+            return None
+
+        return fee - self.monthly_fee
+
+    @monthly_discount.inplace.expression
+    @classmethod
+    def _monthly_discount_expression(cls):
+        from app.models.course import Course
+
+        return (
+            select(Course.monthly_fee - cls._discounted(Course.monthly_fee))
+            .where(Course.course_id == cls.course_id)
+            .scalar_subquery()
+        )
+
+    @classmethod
+    def _discounted(cls, fee):
+        discount = func.coalesce(cls.discount_rate, 0)
+
+        return type_coerce(
+            func.round(fee * (100 - discount) / 100, 2), db.Numeric(12, 2)
+        )
+
+    @hybrid_method
+    def is_paid_for(self, month: str) -> bool:
+        """Check if a payment exists for ``month`` (``"YYYY-MM"``)."""
+        return db.session.scalar(
+            select(
+                exists().where(
+                    Payment.enrollment_id == self.enrollment_id,
+                    Payment.month_for == month,
+                )
+            )
+        )
+
+    @is_paid_for.inplace.expression
+    @classmethod
+    def _is_paid_for_expression(cls, month: str):
+        return exists().where(
+            Payment.enrollment_id == cls.enrollment_id, Payment.month_for == month
+        )
+
+    @hybrid_property
     def is_paid_this_month(self) -> bool:
         """Check if this student has paid for the current month."""
-        current_month = datetime.now().strftime("%Y-%m")
-        return any(payment.month_for == current_month for payment in self.payments)
+        return self.is_paid_for(current_month())
+
+    @is_paid_this_month.inplace.expression
+    @classmethod
+    def _is_paid_this_month_expression(cls):
+        return cls.is_paid_for(current_month())
+
+    @hybrid_property
+    def total_payments(self) -> Decimal:
+        return db.session.scalar(
+            select(func.coalesce(func.sum(Payment.amount), 0)).where(
+                Payment.enrollment_id == self.enrollment_id
+            )
+        )
+
+    @total_payments.inplace.expression
+    @classmethod
+    def _total_payments_expression(cls):
+        return (
+            select(func.coalesce(func.sum(Payment.amount), 0))
+            .where(Payment.enrollment_id == cls.enrollment_id)
+            .scalar_subquery()
+        )
+
+    @classmethod
+    def total_payments_for(cls, enrollment_ids: Iterable[int]) -> Dict[int, Decimal]:
+        """Return ``{enrollment_id: total_payments}`` in one grouped query."""
+        ids = list(enrollment_ids)
+        totals: Dict[int, Decimal] = {
+            enrollment_id: Decimal(0) for enrollment_id in ids
+        }
 
-    @property
-    def total_payments(self):
-        total = 0
+        rows = db.session.execute(
+            select(Payment.enrollment_id, func.sum(Payment.amount))
+            .where(Payment.enrollment_id.in_(ids))
+            .group_by(Payment.enrollment_id)
+        ).all()
 
-        for payment in self.payments:
-            total += payment.amount
+        totals.update({enrollment_id: total for enrollment_id, total in rows})
 
-        return total
+        return totals
 
     @property
     def display_discount_rate(self) -> str:
@@ -81,10 +189,16 @@ class Enrollment(db.Model):
 
     @property
     def display_monthly_discount(self) -> str:
+        if self.monthly_discount is None:
+            return "N/A"
+
         return f"{CURRENCY_SYMBOL}{self.monthly_discount}"
 
     @property
     def display_monthly_fee(self):
+        if self.monthly_fee is None:
+            return "N/A"
+
         return f"{CURRENCY_SYMBOL}{self.monthly_fee}"
 
     @property
@@ -99,6 +213,15 @@ class Enrollment(db.Model):
     def display_enrollment_date(self) -> str:
         return self.enrollment_date.strftime("%Y-%m-%d")
 
+    @classmethod
+    def load_profile(cls, name: str = "dict"):
+        match name:
+            case "row":
+                # The table row renders the student and the discounted fee.
+                return [selectinload(cls.student), selectinload(cls.course)]
+            case _:
+                return super().load_profile(name)
+
     def to_dict(self) -> dict:
         return {
             "enrollment_id": self.enrollment_id,
@@ -1,8 +1,11 @@
+import hashlib
+import mimetypes
 import pathlib
 from datetime import datetime, timezone
 from typing import Optional, Self
 
 import humanize
+from flask import url_for
 
 from app.constants import APP_DIR
 from app.extensions import db
@@ -26,22 +29,107 @@ class File(db.Model):
     )
     file_description = db.Column(db.String(255))
     file_for = db.Column(db.String(25))
-    file_url = db.Column(db.String(255), nullable=False)
+    file_url = db.Column(db.String(255), nullable=False, index=True)
+
+    # Metadata captured at registration and reconciled by `flask files verify`
+    file_size = db.Column(db.BigInteger, nullable=True)
+    file_hash = db.Column(db.String(64), nullable=True, index=True)  # sha256 hex
+    mime_type = db.Column(db.String(100), nullable=True)
+    file_exists = db.Column(db.Boolean, nullable=False, default=True)
+    verified_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    @classmethod
+    def from_link(cls, link, file_for: Optional[str] = None) -> Self:
+        """Build a ``File`` for an uploaded link, with its metadata filled in.
+
+        The file is only stat-ed, so registering a large upload never waits
+        on hashing it; ``flask files verify`` fills in any missing hash.
+        """
+        path: pathlib.Path = pathlib.Path(link)
+
+        file: Self = cls()
+        file.file_name = path.name
+        file.file_url = f"{path!s}"
+        file.file_for = file_for
+        file.refresh_metadata(read=False)
+
+        return file
+
+    def refresh_metadata(self: Self, rehash: bool = True, read: bool = True) -> bool:
+        """Stat (and hash) the file on disk; returns ``True`` if anything changed.
+
+        With ``rehash=False`` the content hash is only recomputed when the size
+        changed or no hash was stored yet.  With ``read=False`` the file is
+        never read: a content-store blob takes its hash from its name, any
+        other file keeps the hash it has.
+        """
+        before = (self.file_size, self.file_hash, self.mime_type, self.file_exists)
+
+        try:
+            size: Optional[int] = self.path.stat().st_size
+        except OSError:
+            size = None
+
+        self.file_exists = size is not None
+
+        if size is None:
+            pass
+        elif not read:
+            self.file_hash = self._stored_hash() or self.file_hash
+        elif rehash or self.file_hash is None or size != self.file_size:
+            self.file_hash = self._sha256()
+
+        self.file_size = size
+        self.mime_type = mimetypes.guess_type(self.file_name or self.file_url)[0]
+        self.verified_at = datetime.now(timezone.utc)
+
+        return before != (
+            self.file_size,
+            self.file_hash,
+            self.mime_type,
+            self.file_exists,
+        )
+
+    def _stored_hash(self: Self) -> Optional[str]:
+        """SHA-256 a content-store URL carries in its name, or ``None``."""
+        from app.services.storage import content_store
+
+        path: Optional[str] = content_store.path_for_url(self.file_url)
+
+        return pathlib.PurePath(path).name[:64] if path else None
+
+    def _sha256(self: Self) -> Optional[str]:
+        digest = hashlib.sha256()
+
+        try:
+            with self.path.open("rb") as fp:
+                while chunk := fp.read(1024 * 1024):
+                    digest.update(chunk)
+        except OSError:
+            return None
+
+        return digest.hexdigest()
 
     @property
     def path(self: Self) -> pathlib.Path:
         return pathlib.Path(f"{APP_DIR}/{self.file_url}")
 
+    def download_url(self: Self, inline: bool = False) -> str:
+        """Download URL; versioned by content hash so it may be cached forever."""
+        return url_for(
+            "api.download_file",
+            file_id=self.file_id,
+            v=self.file_hash[:16] if self.file_hash else None,
+            inline=1 if inline else None,
+        )
+
     @property
     def exists(self: Self) -> bool:
-        return self.path.exists()
+        return bool(self.file_exists)
 
     @property
     def size(self: Self) -> int:
-        try:
-            return self.path.stat().st_size if self.exists else 0
-        except OSError:
-            return 0
+        return (self.file_size or 0) if self.exists else 0
 
     @property
     def human_size(self: Self) -> str:
@@ -82,6 +170,8 @@ class File(db.Model):
             "size": self.size,
             "human_size": self.human_size,
             "exists": self.exists,
+            "hash": self.file_hash,
+            "mime_type": self.mime_type,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -1,19 +1,28 @@
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from app.constants import CURRENCY_SYMBOL
 from app.extensions import db
+from app.models.employee import Employee
 
 
 class Job(db.Model):
     __tablename__ = "jobs"
 
     job_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    job_title = db.Column(db.String(100), nullable=False)
+    job_title = db.Column(db.String(100), nullable=False, index=True)
     job_description = db.Column(db.Text, nullable=True)
-    min_salary = db.Column(db.Numeric(12, 2), nullable=False)
-    max_salary = db.Column(db.Numeric(12, 2), nullable=False)
+    min_salary = db.Column(db.Numeric(12, 2), nullable=False, index=True)
+    max_salary = db.Column(db.Numeric(12, 2), nullable=False, index=True)
+
+    # Counters kept exact by app/services/counters.py
+    employee_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
 
     employees = db.relationship(
         "Employee", back_populates="job", cascade="all, delete, delete-orphan"
@@ -35,28 +44,84 @@ class Job(db.Model):
 
         return dct
 
-    @property
-    def employee_count(self) -> int:
-        return len(self.employees)
+    # Salary aggregates; employees without a salary count as 0 and a job
+    # without employees yields None.
+    SALARY_AGGREGATES = {
+        "average_salary": func.avg,
+        "highest_salary": func.max,
+        "lowest_salary": func.min,
+    }
 
-    @property
+    def _salary_stat(self, name: str) -> float | None:
+        # Served from the cached per-job figures of the salary stats service.
+        from app.services.salaries import salary_stats
+
+        return salary_stats.job(self.job_id)[name]
+
+    @classmethod
+    def _salary_stat_expression(cls, aggregate):
+        return (
+            select(aggregate(func.coalesce(Employee.salary, 0)))
+            .where(Employee.job_id == cls.job_id)
+            .scalar_subquery()
+        )
+
+    @hybrid_property
     def average_salary(self) -> float | None:
-        if not self.employees:
-            return None
-        total_salary = sum([float(emp.salary or 0) for emp in self.employees])
-        return total_salary / len(self.employees)
+        return self._salary_stat("average_salary")
 
-    @property
+    @average_salary.inplace.expression
+    @classmethod
+    def _average_salary_expression(cls):
+        return cls._salary_stat_expression(func.avg)
+
+    @hybrid_property
     def highest_salary(self) -> float | None:
-        if not self.employees:
-            return None
-        return max([float(emp.salary or 0) for emp in self.employees])
+        return self._salary_stat("highest_salary")
 
-    @property
+    @highest_salary.inplace.expression
+    @classmethod
+    def _highest_salary_expression(cls):
+        return cls._salary_stat_expression(func.max)
+
+    @hybrid_property
     def lowest_salary(self) -> float | None:
-        if not self.employees:
-            return None
-        return min([float(emp.salary or 0) for emp in self.employees])
+        return self._salary_stat("lowest_salary")
+
+    @lowest_salary.inplace.expression
+    @classmethod
+    def _lowest_salary_expression(cls):
+        return cls._salary_stat_expression(func.min)
+
+    @classmethod
+    def salary_stats_for(
+        cls, job_ids: Iterable[int]
+    ) -> Dict[int, Dict[str, float | None]]:
+        """Return the salary aggregates of many jobs in one grouped query."""
+        ids = list(job_ids)
+        stats: Dict[int, Dict[str, float | None]] = {
+            job_id: dict.fromkeys(cls.SALARY_AGGREGATES) for job_id in ids
+        }
+        salary = func.coalesce(Employee.salary, 0)
+
+        rows = db.session.execute(
+            select(
+                Employee.job_id,
+                *[
+                    aggregate(salary).label(name)
+                    for name, aggregate in cls.SALARY_AGGREGATES.items()
+                ],
+            )
+            .where(Employee.job_id.in_(ids))
+            .group_by(Employee.job_id)
+        ).all()
+
+        for row in rows:
+            stats[row.job_id] = {
+                name: float(getattr(row, name)) for name in cls.SALARY_AGGREGATES
+            }
+
+        return stats
 
     @property
     def display_min_salary(self) -> str:
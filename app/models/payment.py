@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 
 import humanize
 from numerize.numerize import numerize
+from sqlalchemy import func, select
 
 from app.constants import CURRENCY_SYMBOL
 from app.extensions import db
@@ -15,21 +17,36 @@ class Payment(db.Model):
 
     # Foreign Key
     enrollment_id = db.Column(
-        db.Integer, db.ForeignKey("enrollments.enrollment_id"), nullable=False
+        db.Integer,
+        db.ForeignKey("enrollments.enrollment_id"),
+        nullable=False,
+        index=True,
     )
 
     # Payment Info
-    amount = db.Column(db.Numeric(12, 2), nullable=False)  # Payment amount
+    # Payment amount; ``active_history`` loads the old value on change, even
+    # when expired, so the rollups can apply the difference.
+    amount = db.column_property(
+        db.Column(db.Numeric(12, 2), nullable=False, index=True), active_history=True
+    )
     payment_date = db.Column(
-        db.Date, nullable=False, default=lambda: datetime.now(timezone.utc).date()
+        db.Date,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).date(),
+        index=True,
     )
     month_for = db.Column(
-        db.String(20), nullable=True  # e.g., "2025-09" for the month being paid
+        db.String(20), nullable=True, index=True  # e.g., "2025-09" for the month paid
     )
 
     # Relationship
     enrollment = db.relationship("Enrollment", back_populates="payments")
 
+    __table_args__ = (
+        # Serves "has enrollment X paid for month Y" lookups and anti-joins.
+        db.Index("ix_payments_enrollment_month", "enrollment_id", "month_for"),
+    )
+
     @property
     def display_amount(self) -> str:
         return f"{CURRENCY_SYMBOL}{float(self.amount):,.2f}"
@@ -57,13 +74,13 @@ class Payment(db.Model):
             return "N/A"
 
     @classmethod
-    def display_total(cls) -> str:
-        amount: float = 0
+    def total_amount(cls) -> Decimal:
+        """Sum of every payment, computed by the database."""
+        return db.session.scalar(select(func.coalesce(func.sum(cls.amount), 0)))
 
-        for p in cls.query.all():
-            amount += p.amount
-
-        return f"{CURRENCY_SYMBOL}{numerize(amount, 2)}"
+    @classmethod
+    def display_total(cls) -> str:
+        return f"{CURRENCY_SYMBOL}{numerize(float(cls.total_amount()), 2)}"
 
     def to_dict(self) -> dict:
         return {
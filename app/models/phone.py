@@ -75,3 +75,17 @@ class StudentPhone(db.Model):
 
     def __repr__(self):
         return f"<StudentPhone {self.phone_number} Student={self.student_id}>"
+
+
+# Plain table rather than a model: one row per normalized number of every
+# student, teacher and employee phone, maintained by app/services/phones.py.
+# Every holder of a number is kept, so a number freed by one person stays
+# indexed for the others; uniqueness is enforced when phones are submitted.
+# The primary key leads with the number, so a reverse lookup is an index seek.
+phone_index = db.Table(
+    "phone_index",
+    db.Column("number", db.String(16), primary_key=True),  # e.g. "+93700123456"
+    db.Column("kind", db.String(10), primary_key=True),  # student/teacher/employee
+    db.Column("person_id", db.Integer, primary_key=True),
+    db.Index("ix_phone_index_person", "kind", "person_id"),
+)
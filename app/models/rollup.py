@@ -0,0 +1,103 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, insert, select, update
+from sqlalchemy.engine import Connection
+
+from app.extensions import db
+
+# Plain table rather than a model: rows are written with upserts from ORM
+# events, so they don't carry the uid/timestamp columns of ``Base``.
+daily_rollups = db.Table(
+    "daily_rollups",
+    db.Column("model", db.String(50), primary_key=True),  # table name
+    db.Column("day", db.Date, primary_key=True),
+    db.Column("count", db.Integer, nullable=False, default=0),
+    db.Column("amount", db.Numeric(14, 2), nullable=False, default=0),
+)
+
+
+def rollup_day(value: Optional[datetime]) -> date:
+    return (value or datetime.now(timezone.utc)).date()
+
+
+def bump_rollup(
+    connection: Connection,
+    model: str,
+    day: date,
+    count: int = 1,
+    amount: Decimal | float = 0,
+) -> None:
+    """Add ``count``/``amount`` to the rollup row of ``model`` on ``day``."""
+    c = daily_rollups.c
+    values = {"model": model, "day": day, "count": count, "amount": amount}
+
+    match connection.dialect.name:
+        case "sqlite" | "postgresql" as name:
+            if name == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as upsert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as upsert
+
+            stmt = upsert(daily_rollups).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.model, c.day],
+                set_={
+                    "count": c["count"] + stmt.excluded["count"],
+                    "amount": c.amount + stmt.excluded.amount,
+                },
+            )
+            connection.execute(stmt)
+
+        case "mysql" | "mariadb":
+            from sqlalchemy.dialects.mysql import insert as upsert
+
+            stmt = upsert(daily_rollups).values(**values)
+            stmt = stmt.on_duplicate_key_update(
+                count=c["count"] + stmt.inserted["count"],
+                amount=c.amount + stmt.inserted.amount,
+            )
+            connection.execute(stmt)
+
+        case _:
+            result = connection.execute(
+                update(daily_rollups)
+                .where(and_(c.model == model, c.day == day))
+                .values(count=c["count"] + count, amount=c.amount + amount)
+            )
+
+            if not result.rowcount:
+                connection.execute(insert(daily_rollups).values(**values))
+
+
+def rollup_windows(
+    model: str, windows: Iterable[Tuple[date, Optional[date]]]
+) -> List[Tuple[int, Decimal]]:
+    """Return ``(count, amount)`` of ``model`` for each ``[start, end)`` window."""
+    c = daily_rollups.c
+    columns = []
+
+    for start, end in windows:
+        condition = c.day >= start if end is None else and_(c.day >= start, c.day < end)
+        columns.append(func.coalesce(func.sum(case((condition, c["count"]))), 0))
+        columns.append(func.coalesce(func.sum(case((condition, c.amount))), 0))
+
+    row = db.session.execute(select(*columns).where(c.model == model)).one()
+
+    return [(row[i], Decimal(str(row[i + 1]))) for i in range(0, len(row), 2)]
+
+
+def rollup_series(
+    model: str, start: date, end: date
+) -> Dict[date, Tuple[int, Decimal]]:
+    """Return ``{day: (count, amount)}`` of ``model`` for ``start <= day <= end``."""
+    c = daily_rollups.c
+
+    rows = db.session.execute(
+        select(c.day, c["count"], c.amount).where(
+            c.model == model, c.day >= start, c.day <= end
+        )
+    ).all()
+
+    return {day: (count, Decimal(str(amount))) for day, count, amount in rows}
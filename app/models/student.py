@@ -2,10 +2,12 @@ from datetime import date, datetime, timezone
 
 import humanize
 from flask import url_for
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 
 from app.constants import DEFAULT_AVATAR
 from app.extensions import db
-from app.models.enrollment import EnrollmentStatus
+from app.models.file import StudentFile
 
 
 class Student(db.Model):
@@ -15,15 +17,23 @@ class Student(db.Model):
     student_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
 
     # Personal Info
-    first_name = db.Column(db.String(50), nullable=False)
-    middle_name = db.Column(db.String(50))
-    last_name = db.Column(db.String(50), nullable=False)
+    first_name = db.Column(db.String(50), nullable=False, index=True)
+    middle_name = db.Column(db.String(50), index=True)
+    last_name = db.Column(db.String(50), nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    birthday = db.Column(db.Date, nullable=True)
+    birthday = db.Column(db.Date, nullable=True, index=True)
 
     # Files
     avatar_path = db.Column(db.String(255), nullable=True)  # Path to avatar image
 
+    # Counters kept exact by app/services/counters.py
+    active_enrollments_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
+    closed_enrollments_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
+
     # Relationship
     enrollments = db.relationship(
         "Enrollment", back_populates="student", cascade="all, delete, delete-orphan"
@@ -35,6 +45,25 @@ class Student(db.Model):
         "StudentFile", back_populates="student", cascade="all, delete, delete-orphan"
     )
 
+    # Covering indexes for the case-insensitive name prefix lookups of
+    # app/services/autocomplete.py
+    __table_args__ = (
+        db.Index(
+            "ix_students_first_name_lower",
+            func.lower(first_name),
+            first_name,
+            middle_name,
+            last_name,
+        ),
+        db.Index(
+            "ix_students_last_name_lower",
+            func.lower(last_name),
+            first_name,
+            middle_name,
+            last_name,
+        ),
+    )
+
     @property
     def full_name(self) -> str:
         parts = [self.first_name]
@@ -63,14 +92,6 @@ class Student(db.Model):
         total = sum((f.file.size for f in self.files), start=0)
         return humanize.naturalsize(total)
 
-    @property
-    def active_enrollments_count(self) -> int:
-        return len([e for e in self.enrollments if e.status == EnrollmentStatus.ACTIVE])
-
-    @property
-    def closed_enrollments_count(self) -> int:
-        return len([e for e in self.enrollments if e.status == EnrollmentStatus.CLOSED])
-
     @property
     def display_created_at(self) -> str:
         return (
@@ -90,6 +111,18 @@ class Student(db.Model):
 
         return url_for("static", filename=DEFAULT_AVATAR)
 
+    @classmethod
+    def load_profile(cls, name: str = "dict"):
+        match name:
+            case "dict":
+                return [
+                    selectinload(cls.phones),
+                    selectinload(cls.files).joinedload(StudentFile.file),
+                    selectinload(cls.enrollments),
+                ]
+            case _:
+                return super().load_profile(name)
+
     def to_dict(self) -> dict:
         return {
             "student_id": self.student_id,
@@ -2,9 +2,11 @@ from datetime import date, datetime, timezone
 
 import humanize
 from flask import url_for
+from sqlalchemy.orm import selectinload
 
 from app.constants import CURRENCY_SYMBOL, DEFAULT_AVATAR
 from app.extensions import db
+from app.models.file import TeacherFile
 
 
 class Teacher(db.Model):
@@ -14,15 +16,21 @@ class Teacher(db.Model):
     teacher_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
 
     # Personal Info
-    first_name = db.Column(db.String(50), nullable=False)
-    middle_name = db.Column(db.String(50))
-    last_name = db.Column(db.String(50), nullable=False)
+    first_name = db.Column(db.String(50), nullable=False, index=True)
+    middle_name = db.Column(db.String(50), index=True)
+    last_name = db.Column(db.String(50), nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    birthday = db.Column(db.Date, nullable=True)
+    birthday = db.Column(db.Date, nullable=True, index=True)
 
     avatar_path = db.Column(db.String(255), nullable=True)  # Path to avatar image
     salary = db.Column(db.Numeric(12, 2), nullable=True)
 
+    # Enrollments in all of the teacher's courses, kept exact by
+    # app/services/counters.py
+    total_students_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
+
     # Relationship
     courses = db.relationship(
         "Course", back_populates="teacher", cascade="all, delete, delete-orphan"
@@ -73,22 +81,15 @@ class Teacher(db.Model):
         return humanize.naturalsize(total)
 
     @property
-    def total_students_count(self) -> int:
-        total: int = 0
-
-        for course in self.courses:
-            total = total + len(course.enrollments)
+    def is_salary_gt_avg(self) -> bool:
+        from app.services.salaries import salary_stats
 
-        return total
+        average: float | None = salary_stats.average("teachers")
 
-    @property
-    def is_salary_gt_avg(self) -> bool:
-        teachers = self.query.all()
-        salaries = [float(t.salary) for t in teachers if t.salary is not None]
-        if not salaries or self.salary is None:
+        if self.salary is None or average is None:
             return False
-        avg_salary = sum(salaries) / len(salaries)
-        return float(self.salary) > avg_salary
+
+        return float(self.salary) > average
 
     @property
     def display_created_at(self) -> str:
@@ -109,6 +110,17 @@ class Teacher(db.Model):
 
         return url_for("static", filename=DEFAULT_AVATAR)
 
+    @classmethod
+    def load_profile(cls, name: str = "dict"):
+        match name:
+            case "dict":
+                return [
+                    selectinload(cls.phones),
+                    selectinload(cls.files).joinedload(TeacherFile.file),
+                ]
+            case _:
+                return super().load_profile(name)
+
     def to_dict(self):
         dct = {
             "teacher_id": self.teacher_id,
@@ -24,15 +24,15 @@ class User(UserMixin, db.Model):
 
     user_id = db.Column(db.Integer, primary_key=True)
 
-    first_name = db.Column(db.String(50))
-    middle_name = db.Column(db.String(50))
-    last_name = db.Column(db.String(50))
+    first_name = db.Column(db.String(50), index=True)
+    middle_name = db.Column(db.String(50), index=True)
+    last_name = db.Column(db.String(50), index=True)
     user_name = db.Column(db.String(50), unique=True, nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
 
     password_hash = db.Column(db.String(128), nullable=False)
 
-    birthday = db.Column(db.Date)
+    birthday = db.Column(db.Date, index=True)
     role = db.Column(db.Enum(Role), default=Role.USER, nullable=False)
 
     # Files
@@ -0,0 +1,181 @@
+from typing import Callable, Dict, List, Optional
+
+from flask import Flask
+from sqlalchemy import Select, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.student import Student
+from app.services.cache import TTLCache
+from app.services.events import invalidate_on_commit
+
+# Models whose changes can alter a suggestion.
+AUTOCOMPLETE_MODELS = (Student, Course, Enrollment)
+
+
+def _prefix(column, q: str):
+    """``lower(column)`` starts with ``q``, as a range the index can seek."""
+    lowered = func.lower(column)
+    return (lowered >= q) & (lowered < q + "\uffff")
+
+
+def _name(table):
+    return (
+        table.first_name
+        + " "
+        + func.coalesce(table.middle_name + " ", "")
+        + table.last_name
+    )
+
+
+def _students(q: str, limit: int) -> Select:
+    """An id match, then first-name matches, then last-name-only matches.
+
+    Each name branch is its own ``LIMIT``-ed seek in the order of its
+    ``lower(...)`` index, joined with ``UNION ALL``; one ``OR`` over both
+    indexes would need a temp sort of every match.
+    """
+    s = Student.__table__.c
+    label = _name(s).label("label")
+
+    def branch(rank: int, column, *where):
+        return (
+            select(
+                s.student_id,
+                label,
+                literal(rank).label("rank"),
+                func.lower(column).label("key"),
+            )
+            .where(*where)
+            .order_by(
+                func.lower(column),
+                s.first_name,
+                s.middle_name,
+                s.last_name,
+                s.student_id,
+            )
+            .limit(limit)
+            .subquery()
+        )
+
+    branches = [
+        branch(1, s.first_name, _prefix(s.first_name, q)),
+        branch(2, s.last_name, _prefix(s.last_name, q), ~_prefix(s.first_name, q)),
+    ]
+
+    if q.isdigit():
+        branches.append(branch(0, s.first_name, s.student_id == int(q)))
+
+    matches = union_all(*(select(*b.c) for b in branches)).subquery()
+
+    return (
+        select(matches.c.student_id, matches.c.label)
+        .order_by(matches.c.rank, matches.c.key, matches.c.label, matches.c.student_id)
+        .limit(limit)
+    )
+
+
+def _courses(q: str, limit: int) -> Select:
+    c = Course.__table__.c
+    where = [_prefix(c.course_title, q)]
+
+    if q.isdigit():
+        where.append(c.course_id == int(q))
+
+    return (
+        select(c.course_id, c.course_title)
+        .where(or_(*where))
+        .order_by(func.lower(c.course_title), c.course_title, c.course_id)
+        .limit(limit)
+    )
+
+
+def _enrollments(q: str, limit: int) -> Select:
+    e = Enrollment.__table__.c
+    s = Student.__table__.c
+    c = Course.__table__.c
+    students = select(s.student_id).where(
+        or_(_prefix(s.first_name, q), _prefix(s.last_name, q))
+    )
+    where = [e.student_id.in_(students)]
+
+    if q.isdigit():
+        where.append(e.enrollment_id == int(q))
+
+    return (
+        select(e.enrollment_id, _name(s) + " — " + c.course_title)
+        .select_from(Enrollment.__table__)
+        .join(Student.__table__, s.student_id == e.student_id)
+        .join(Course.__table__, c.course_id == e.course_id)
+        .where(or_(*where))
+        .order_by(func.lower(s.first_name), func.lower(s.last_name), e.enrollment_id)
+        .limit(limit)
+    )
+
+
+SOURCES: Dict[str, Callable[[str, int], Select]] = {
+    "students": _students,
+    "courses": _courses,
+    "enrollments": _enrollments,
+}
+
+
+class Autocomplete:
+    """Prefix suggestions (id + label) for the ID fields of the admin forms.
+
+    Each lookup is one range scan over a covering ``lower(...)`` index;
+    answers are kept in a per-worker LRU of ``AUTOCOMPLETE_CACHE_SIZE``
+    entries for ``AUTOCOMPLETE_CACHE_TTL`` seconds, so the repeated prefixes
+    of a debounced input cost nothing.  A commit in this process touching
+    students, courses or enrollments clears it; other workers catch up
+    within the TTL.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.limit: int = 10
+        self.cache: TTLCache = TTLCache(ttl=0)
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.limit = app.config["AUTOCOMPLETE_LIMIT"]
+        self.cache = TTLCache(
+            ttl=app.config["AUTOCOMPLETE_CACHE_TTL"],
+            maxsize=app.config["AUTOCOMPLETE_CACHE_SIZE"],
+        )
+
+        app.extensions["autocomplete"] = self
+
+    def suggest(self, kind: str, q: str) -> List[Dict]:
+        """Up to ``AUTOCOMPLETE_LIMIT`` ``{"id", "label"}`` matches of ``q``."""
+        q = q.strip().lower()
+
+        if not q:
+            return []
+
+        def load() -> List[Dict]:
+            rows = db.session.execute(SOURCES[kind](q, self.limit))
+            return [{"id": pk, "label": label} for pk, label in rows]
+
+        return self.cache.get_or_set((kind, q), load)
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+
+autocomplete: Autocomplete = Autocomplete()
+
+
+def _touches_autocomplete(session: Session) -> bool:
+    return any(
+        isinstance(obj, AUTOCOMPLETE_MODELS)
+        for obj in session.new | session.dirty | session.deleted
+    )
+
+
+invalidate_on_commit(
+    "autocomplete_stale", _touches_autocomplete, autocomplete.invalidate
+)
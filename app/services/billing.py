@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Optional
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, exists, func, insert, literal, select
+
+from app.extensions import console, db
+from app.models.due import dues
+from app.models.enrollment import Enrollment, EnrollmentStatus, current_month
+from app.services.dues import parse_month
+
+
+def run_billing(month: str) -> Dict[str, int | Decimal]:
+    """Generate the dues of every ACTIVE enrollment for ``month``.
+
+    One ``INSERT ... SELECT`` taking the fee from the SQL side of
+    ``Enrollment.monthly_fee``, in a single transaction.  Enrollments already
+    billed for the month are skipped, so re-running a month only adds the
+    enrollments created since.  Courses without a monthly fee are not billed.
+    Rows a concurrent run inserts first are ignored rather than failing on
+    the primary key.
+    """
+    already_billed = exists().where(
+        dues.c.enrollment_id == Enrollment.enrollment_id, dues.c.month_for == month
+    )
+
+    created: int = db.session.execute(
+        insert(dues)
+        .prefix_with("OR IGNORE", dialect="sqlite")
+        .prefix_with("IGNORE", dialect="mysql")
+        .from_select(
+            ["enrollment_id", "month_for", "amount", "created_at"],
+            select(
+                Enrollment.enrollment_id,
+                literal(month),
+                Enrollment.monthly_fee,
+                literal(datetime.now(timezone.utc), dues.c.created_at.type),
+            ).where(
+                Enrollment.status == EnrollmentStatus.ACTIVE,
+                Enrollment.monthly_fee.is_not(None),
+                ~already_billed,
+            ),
+        )
+    ).rowcount
+    db.session.commit()
+
+    total, amount = db.session.execute(
+        select(func.count(), func.coalesce(func.sum(dues.c.amount), 0)).where(
+            dues.c.month_for == month
+        )
+    ).one()
+
+    return {"created": created, "total": total, "amount": Decimal(amount)}
+
+
+# SQLite only honours ``ON DELETE CASCADE`` with ``PRAGMA foreign_keys``, which
+# is not enabled, so the dues of a deleted enrollment are dropped here.
+@event.listens_for(Enrollment, "after_delete")
+def _enrollment_deleted(mapper, connection, target) -> None:
+    connection.execute(
+        delete(dues).where(dues.c.enrollment_id == target.enrollment_id)
+    )
+
+
+billing_cli: AppGroup = AppGroup("billing", help="Generate monthly dues.")
+
+
+@billing_cli.command("run")
+@click.option("--month", help="Month to bill as YYYY-MM (default: current month).")
+def run_command(month: Optional[str]) -> None:
+    """Bill every active enrollment for a month; safe to re-run."""
+    try:
+        month = parse_month(month or current_month())
+    except ValueError as err:
+        raise click.BadParameter(str(err), param_hint="--month") from err
+
+    result = run_billing(month)
+
+    console.print(
+        f"{month}: {result['created']} due(s) created, "
+        f"{result['total']} in total ({result['amount']:.2f})"
+    )
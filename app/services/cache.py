@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Tiny thread-safe in-process cache whose entries expire after ``ttl`` seconds.
+
+    With ``maxsize`` it also keeps at most that many entries, evicting the
+    least recently used one first.
+    """
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None) -> None:
+        self.ttl: float = ttl
+        self.maxsize: Optional[int] = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                return default
+
+            self._data.move_to_end(key)
+
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+
+        if value is missing:
+            value = factory()
+            self.set(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
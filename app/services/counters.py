@@ -0,0 +1,246 @@
+from typing import Dict, Optional, Set, Tuple
+
+from flask.cli import AppGroup
+from sqlalchemy import Connection, event, func, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.extensions import console, db
+from app.models.course import Course
+from app.models.employee import Employee
+from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.job import Job
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.events import previous
+
+STATUS_COUNTERS: Dict[EnrollmentStatus, str] = {
+    EnrollmentStatus.ACTIVE: "active_enrollments_count",
+    EnrollmentStatus.CLOSED: "closed_enrollments_count",
+}
+
+
+def _load_previous(target, value, oldvalue, initiator) -> None:
+    pass
+
+
+# ``active_history`` loads the old value on assignment even when the object
+# was expired, so the flush hooks below can tell which counters to move.
+for attribute in (
+    Enrollment.student_id,
+    Enrollment.course_id,
+    Enrollment.status,
+    Course.teacher_id,
+    Employee.job_id,
+):
+    event.listen(attribute, "set", _load_previous, active_history=True)
+
+
+def _bump(
+    connection: Connection, target, model, pk: Optional[int], counter: str, delta: int
+) -> None:
+    """Add ``delta`` to ``model.counter`` of row ``pk``, then expire it in memory."""
+    if pk is None or not delta:
+        return
+
+    table = model.__table__
+    primary_key = table.primary_key.columns[0]
+
+    connection.execute(
+        update(table)
+        .where(primary_key == pk)
+        .values({counter: table.c[counter] + delta})
+    )
+
+    session: Optional[Session] = Session.object_session(target)
+
+    if session is not None:
+        session.info.setdefault("stale_counters", set()).add((model, pk, counter))
+
+
+def _teacher_of(connection: Connection, course_id: Optional[int]) -> Optional[int]:
+    if course_id is None:
+        return None
+
+    return connection.scalar(
+        select(Course.__table__.c.teacher_id).where(
+            Course.__table__.c.course_id == course_id
+        )
+    )
+
+
+def _count_enrollment(
+    connection: Connection,
+    target: Enrollment,
+    student_id: Optional[int],
+    course_id: Optional[int],
+    status: Optional[EnrollmentStatus],
+    delta: int,
+) -> None:
+    if status not in STATUS_COUNTERS:
+        return
+
+    counter: str = STATUS_COUNTERS[status]
+
+    _bump(connection, target, Student, student_id, counter, delta)
+    _bump(connection, target, Course, course_id, counter, delta)
+    _bump(
+        connection,
+        target,
+        Teacher,
+        _teacher_of(connection, course_id),
+        "total_students_count",
+        delta,
+    )
+
+
+@event.listens_for(Enrollment, "after_insert")
+def _enrollment_inserted(mapper, connection, target: Enrollment) -> None:
+    _count_enrollment(
+        connection, target, target.student_id, target.course_id, target.status, 1
+    )
+
+
+@event.listens_for(Enrollment, "after_delete")
+def _enrollment_deleted(mapper, connection, target: Enrollment) -> None:
+    _count_enrollment(
+        connection,
+        target,
+        previous(target, "student_id"),
+        previous(target, "course_id"),
+        previous(target, "status"),
+        -1,
+    )
+
+
+@event.listens_for(Enrollment, "after_update")
+def _enrollment_updated(mapper, connection, target: Enrollment) -> None:
+    keys: Tuple[str, ...] = ("student_id", "course_id", "status")
+    before = tuple(previous(target, key) for key in keys)
+    after = tuple(getattr(target, key) for key in keys)
+
+    if before != after:
+        _count_enrollment(connection, target, *before, -1)
+        _count_enrollment(connection, target, *after, 1)
+
+
+@event.listens_for(Course, "after_update")
+def _course_updated(mapper, connection, target: Course) -> None:
+    """Moving a course to another teacher moves its enrollments with it."""
+    before: Optional[int] = previous(target, "teacher_id")
+
+    if before == target.teacher_id:
+        return
+
+    table = Course.__table__
+    enrollments: int = connection.scalar(
+        select(
+            table.c.active_enrollments_count + table.c.closed_enrollments_count
+        ).where(table.c.course_id == target.course_id)
+    )
+
+    _bump(connection, target, Teacher, before, "total_students_count", -enrollments)
+    _bump(
+        connection,
+        target,
+        Teacher,
+        target.teacher_id,
+        "total_students_count",
+        enrollments,
+    )
+
+
+@event.listens_for(Employee, "after_insert")
+def _employee_inserted(mapper, connection, target: Employee) -> None:
+    _bump(connection, target, Job, target.job_id, "employee_count", 1)
+
+
+@event.listens_for(Employee, "after_delete")
+def _employee_deleted(mapper, connection, target: Employee) -> None:
+    _bump(connection, target, Job, previous(target, "job_id"), "employee_count", -1)
+
+
+@event.listens_for(Employee, "after_update")
+def _employee_updated(mapper, connection, target: Employee) -> None:
+    before: Optional[int] = previous(target, "job_id")
+
+    if before != target.job_id:
+        _bump(connection, target, Job, before, "employee_count", -1)
+        _bump(connection, target, Job, target.job_id, "employee_count", 1)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _expire_counters(session: Session, flush_context) -> None:
+    """Make loaded objects re-read the counters that were bumped in SQL."""
+    stale: Set = session.info.pop("stale_counters", set())
+
+    for model, pk, counter in stale:
+        key = inspect(model).identity_key_from_primary_key((pk,))
+
+        if (obj := session.identity_map.get(key)) is not None:
+            session.expire(obj, [counter])
+
+
+def repair_counters() -> Dict[str, int]:
+    """Recompute every counter column from scratch; returns rows updated per table.
+
+    One ``UPDATE ... SET counter = (correlated count)`` per table, for data
+    changed behind the ORM's back (bulk statements, manual SQL, restores).
+    """
+    enrollments = Enrollment.__table__.c
+    courses = Course.__table__.c
+
+    def enrollments_of(column, status: EnrollmentStatus):
+        return (
+            select(func.count())
+            .where(column, enrollments.status == status)
+            .scalar_subquery()
+        )
+
+    statements = {
+        "students": update(Student.__table__).values(
+            {
+                counter: enrollments_of(
+                    enrollments.student_id == Student.__table__.c.student_id, status
+                )
+                for status, counter in STATUS_COUNTERS.items()
+            }
+        ),
+        "courses": update(Course.__table__).values(
+            {
+                counter: enrollments_of(
+                    enrollments.course_id == courses.course_id, status
+                )
+                for status, counter in STATUS_COUNTERS.items()
+            }
+        ),
+        "teachers": update(Teacher.__table__).values(
+            total_students_count=select(func.count())
+            .select_from(Enrollment.__table__.join(Course.__table__))
+            .where(courses.teacher_id == Teacher.__table__.c.teacher_id)
+            .scalar_subquery()
+        ),
+        "jobs": update(Job.__table__).values(
+            employee_count=select(func.count())
+            .where(Employee.__table__.c.job_id == Job.__table__.c.job_id)
+            .scalar_subquery()
+        ),
+    }
+
+    updated: Dict[str, int] = {
+        name: db.session.execute(statement).rowcount
+        for name, statement in statements.items()
+    }
+    db.session.commit()
+
+    return updated
+
+
+counters_cli: AppGroup = AppGroup("counters", help="Maintain denormalized counters.")
+
+
+@counters_cli.command("repair")
+def repair_command() -> None:
+    """Recompute the enrollment, student and employee counter columns."""
+    updated = repair_counters()
+
+    console.print(", ".join(f"{name}: {rows}" for name, rows in updated.items()))
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Optional
+
+from flask import Flask
+from numerize import numerize
+from sqlalchemy import and_, case, func, select
+
+from app.constants import CURRENCY_SYMBOL
+from app.extensions import db
+from app.models.base import Base
+from app.models.rollup import daily_rollups
+from app.services.cache import TTLCache
+
+
+class ModelStats:
+    """Precomputed count and growth figures of one model for the dashboard."""
+
+    def __init__(
+        self,
+        total: int,
+        current_month: int,
+        previous_month: int,
+        current_week: int,
+        previous_week: int,
+        amount: Decimal = Decimal(0),
+    ) -> None:
+        self.total = total
+        self.amount = amount
+        self.monthly_growth = Base._percent_change(current_month, previous_month)
+        self.weekly_growth = Base._percent_change(current_week, previous_week)
+
+    @property
+    def count(self) -> str:
+        return numerize.numerize(self.total, 2)
+
+    @property
+    def display_total(self) -> str:
+        return f"{CURRENCY_SYMBOL}{numerize.numerize(float(self.amount), 2)}"
+
+    @property
+    def monthly_growth_clr(self) -> str:
+        return "success" if self.monthly_growth > 0 else "danger"
+
+    @property
+    def weekly_growth_clr(self) -> str:
+        return "success" if self.weekly_growth > 0 else "danger"
+
+    @property
+    def display_monthly_growth(self) -> str:
+        return self._display(self.monthly_growth)
+
+    @property
+    def display_weekly_growth(self) -> str:
+        return self._display(self.weekly_growth)
+
+    @staticmethod
+    def _display(growth: float) -> str:
+        sign = chr(43) if growth > 0 else chr(45)
+        return f"{sign}{abs(growth)}{chr(37)}"
+
+
+class DashboardStats:
+    """Counts and growth of every dashboard model, fetched in one round trip.
+
+    All figures come from a single grouped query over ``daily_rollups``
+    (conditional sums over the day column), memoized for
+    ``DASHBOARD_STATS_TTL`` seconds.
+    """
+
+    MODELS = (
+        "employees",
+        "students",
+        "teachers",
+        "courses",
+        "enrollments",
+        "payments",
+        "views",
+    )
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.cache: TTLCache = TTLCache(ttl=0)
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.cache = TTLCache(ttl=app.config["DASHBOARD_STATS_TTL"])
+
+        app.extensions["dashboard_stats"] = self
+
+    def get(self) -> Dict[str, ModelStats]:
+        return self.cache.get_or_set("stats", self.compute)
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+    def compute(self) -> Dict[str, ModelStats]:
+        today = datetime.now(timezone.utc).date()
+
+        month_start = today.replace(day=1)
+        previous_month_start = (month_start - timedelta(days=1)).replace(day=1)
+        week_start = today - timedelta(days=today.weekday())
+        previous_week_start = week_start - timedelta(weeks=1)
+
+        c = daily_rollups.c
+
+        def window(start, end=None):
+            condition = (
+                c.day >= start if end is None else and_(c.day >= start, c.day < end)
+            )
+            return func.coalesce(func.sum(case((condition, c["count"]))), 0)
+
+        rows = db.session.execute(
+            select(
+                c.model,
+                func.sum(c["count"]).label("total"),
+                window(month_start).label("current_month"),
+                window(previous_month_start, month_start).label("previous_month"),
+                window(week_start).label("current_week"),
+                window(previous_week_start, week_start).label("previous_week"),
+                func.sum(c.amount).label("amount"),
+            )
+            .where(c.model.in_(self.MODELS))
+            .group_by(c.model)
+        ).all()
+
+        stats: Dict[str, ModelStats] = {
+            name: ModelStats(0, 0, 0, 0, 0) for name in self.MODELS
+        }
+
+        for row in rows:
+            stats[row.model] = ModelStats(
+                total=row.total or 0,
+                current_month=row.current_month,
+                previous_month=row.previous_month,
+                current_week=row.current_week,
+                previous_week=row.previous_week,
+                amount=Decimal(str(row.amount or 0)),
+            )
+
+        return stats
+
+
+dashboard_stats: DashboardStats = DashboardStats()
@@ -0,0 +1,88 @@
+import os
+import unicodedata
+from typing import Dict, Optional
+from urllib.parse import quote
+
+from flask import Response, current_app, request, send_file
+
+
+def _filename_options(download_name: str) -> Dict[str, str]:
+    """``Content-Disposition`` parameters, as ``send_file`` would write them."""
+    try:
+        download_name.encode("ascii")
+    except UnicodeEncodeError:
+        simple: str = unicodedata.normalize("NFKD", download_name)
+        return {
+            "filename": simple.encode("ascii", "ignore").decode("ascii"),
+            "filename*": f"UTF-8''{quote(download_name, safe='')}",
+        }
+
+    return {"filename": download_name}
+
+
+def send_upload(
+    path: str,
+    download_name: str,
+    mimetype: Optional[str] = None,
+    etag: Optional[str] = None,
+    immutable: bool = False,
+    as_attachment: bool = True,
+) -> Response:
+    """Send an uploaded file without streaming it through Python if possible.
+
+    With ``DOWNLOAD_OFFLOAD`` set to ``x-sendfile`` or ``x-accel-redirect``
+    only headers are returned and the front proxy transfers the bytes (and
+    answers ``Range`` requests itself).  Otherwise Werkzeug serves the file
+    with ``Range`` and conditional request support, through the server's
+    ``wsgi.file_wrapper`` (``os.sendfile`` under gunicorn) for full responses.
+
+    ``etag`` should be the content hash; ``immutable`` marks the response as
+    cacheable forever, which is only safe for URLs that change with it.
+    """
+    offload: str = current_app.config["DOWNLOAD_OFFLOAD"].lower()
+
+    if offload in ("x-sendfile", "x-accel-redirect"):
+        if etag and etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(mimetype=mimetype or "application/octet-stream")
+
+            if offload == "x-sendfile":
+                response.headers["X-Sendfile"] = os.path.abspath(path)
+            else:
+                relative: str = os.path.relpath(
+                    path, current_app.config["UPLOAD_FOLDER"]
+                ).replace(os.sep, "/")
+                response.headers["X-Accel-Redirect"] = current_app.config[
+                    "DOWNLOAD_ACCEL_PREFIX"
+                ].rstrip("/") + quote(f"/{relative}")
+
+            response.headers.set(
+                "Content-Disposition",
+                "attachment" if as_attachment else "inline",
+                **_filename_options(download_name),
+            )
+
+        if etag:
+            response.set_etag(etag)
+    else:
+        response = send_file(
+            path,
+            mimetype=mimetype,
+            as_attachment=as_attachment,
+            download_name=download_name,
+            conditional=True,
+            etag=etag or True,
+        )
+
+    response.cache_control.private = True
+
+    if immutable:
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = current_app.config["DOWNLOAD_MAX_AGE"]
+        response.cache_control.immutable = True
+    else:
+        # Always revalidate; a matching ETag costs a 304 and no body.
+        response.cache_control.no_cache = True
+
+    return response
@@ -0,0 +1,81 @@
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.models.course import Course
+from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.payment import Payment
+from app.models.student import Student
+from app.services.cache import TTLCache
+from app.services.events import invalidate_on_commit
+from app.services.pagination import PaginationError
+
+MONTH_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+# Models whose changes can alter (or re-render) a report page.
+DUES_MODELS = (Payment, Enrollment, Student, Course)
+
+
+def parse_month(value: Optional[str]) -> str:
+    """Validate a ``YYYY-MM`` month, as stored in ``Payment.month_for``."""
+    if value is None or not MONTH_PATTERN.match(value):
+        raise PaginationError(f"Invalid month {value!r}, expected YYYY-MM")
+
+    return value
+
+
+def unpaid_enrollments(month: str) -> Select:
+    """ACTIVE enrollments without a payment for ``month``.
+
+    A single ``NOT EXISTS`` anti-join, answered from the
+    ``(enrollment_id, month_for)`` index on payments.
+    """
+    return select(Enrollment).where(
+        Enrollment.status == EnrollmentStatus.ACTIVE,
+        ~Enrollment.is_paid_for(month),
+    )
+
+
+class DuesReport:
+    """Per-month cache of the unpaid-dues report pages.
+
+    Pages are memoized for ``DUES_CACHE_TTL`` seconds under the month and
+    the table parameters.  A commit in this process touching payments,
+    enrollments, students or courses drops the cache; other workers catch
+    up within the TTL.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.cache: TTLCache = TTLCache(ttl=0)
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.cache = TTLCache(ttl=app.config["DUES_CACHE_TTL"])
+
+        app.extensions["dues_report"] = self
+
+    def page(self, month: str, args: Dict[str, str], factory: Callable[[], Any]) -> Any:
+        key: Tuple = (month, tuple(sorted(args.items())))
+
+        return self.cache.get_or_set(key, factory)
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+
+dues_report: DuesReport = DuesReport()
+
+
+def _touches_dues(session: Session) -> bool:
+    return any(
+        isinstance(obj, DUES_MODELS)
+        for obj in session.new | session.dirty | session.deleted
+    )
+
+
+invalidate_on_commit("dues_stale", _touches_dues, dues_report.invalidate)
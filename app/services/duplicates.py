@@ -0,0 +1,345 @@
+import re
+import unicodedata
+from datetime import date
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import (
+    Connection,
+    and_,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+)
+
+from app.extensions import console, db
+from app.models.block import person_blocks
+from app.services.people import PEOPLE, listen_people, owner_column, primary_key
+
+SOUNDEX = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+# Letters spelled several ways in Dari/Arabic names, and the long vowels
+# dropped from the consonant skeleton of non-Latin names.
+ARABIC_FOLD = str.maketrans("يكةأإآ", "یکهااا")
+ARABIC_VOWELS = set("اوی")
+
+# Attributes that change a person's blocking keys.
+BLOCKED_ATTRIBUTES = ("first_name", "middle_name", "last_name", "birthday")
+
+# {"kind", "id", "first_name", "last_name", "name", "birthday", "phones"}
+Person = Dict
+
+
+def phonetic(value: Optional[str]) -> str:
+    """Sound-alike code of a name: Soundex for Latin script, otherwise the
+    folded consonant skeleton (so "Mohammad"/"Muhammad" share a code)."""
+    value = unicodedata.normalize("NFKD", (value or "").lower())
+    letters = [ch for ch in value if ch.isalpha() and not unicodedata.combining(ch)]
+
+    if not letters:
+        return ""
+
+    if all(ch.isascii() for ch in letters):
+        code, previous = letters[0].upper(), SOUNDEX.get(letters[0])
+
+        for ch in letters[1:]:
+            digit = SOUNDEX.get(ch)
+
+            if digit and digit != previous:
+                code += digit
+            if ch not in "hw":
+                previous = digit
+
+        return (code + "000")[:4]
+
+    letters = "".join(letters).translate(ARABIC_FOLD)
+    skeleton = letters[0] + "".join(ch for ch in letters[1:] if ch not in ARABIC_VOWELS)
+
+    return re.sub(r"(.)\1+", r"\1", skeleton)[:8]
+
+
+def _suffix(phone: str) -> Optional[str]:
+    """Last 7 digits of a phone number, the part every spelling shares."""
+    digits = re.sub(r"\D", "", phone)
+    return digits[-7:] if len(digits) >= 7 else None
+
+
+def blocking_keys(
+    first_name: str,
+    last_name: str,
+    birthday: Optional[date] = None,
+    phones: Iterable[str] = (),
+) -> Set[str]:
+    """Blocks a person falls in: name sound, birthday and phone suffix.
+
+    Two records are only ever compared when they share one of these keys.
+    """
+    first, last = phonetic(first_name), phonetic(last_name)
+    keys: Set[str] = set()
+
+    if first or last:
+        keys.add(f"n:{first}{last}")
+    if birthday is not None:
+        keys.add(f"b:{birthday.isoformat()}:{first[:1]}")
+
+    for phone in phones:
+        if suffix := _suffix(phone):
+            keys.add(f"p:{suffix}")
+
+    return keys
+
+
+def _load(connection: Connection, kind: str, ids: Iterable[int]) -> Dict[int, Person]:
+    """Names, birthdays and phones of the ``kind`` people with ``ids``."""
+    _, model, phone_model = PEOPLE[kind]
+    t = model.__table__.c
+    ids = list(ids)
+    people: Dict[int, Person] = {}
+
+    for offset in range(0, len(ids), 500):
+        chunk = ids[offset : offset + 500]
+
+        for row in connection.execute(
+            select(
+                primary_key(model),
+                t.first_name,
+                t.middle_name,
+                t.last_name,
+                t.birthday,
+            ).where(primary_key(model).in_(chunk))
+        ):
+            people[row[0]] = {
+                "kind": kind,
+                "id": row[0],
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "name": " ".join(
+                    part
+                    for part in (row.first_name, row.middle_name, row.last_name)
+                    if part
+                ),
+                "birthday": row.birthday,
+                "phones": [],
+            }
+
+        owner = owner_column(phone_model)
+
+        for person_id, phone in connection.execute(
+            select(owner, phone_model.__table__.c.phone_number).where(owner.in_(chunk))
+        ):
+            people[person_id]["phones"].append(phone)
+
+    return people
+
+
+def refresh_blocks(
+    connection: Connection, kind: str, ids: Iterable[Optional[int]]
+) -> None:
+    """Recompute the blocking keys of the ``kind`` people with ``ids``."""
+    ids = [i for i in set(ids) if i is not None]
+
+    if not ids:
+        return
+
+    c = person_blocks.c
+    connection.execute(
+        delete(person_blocks).where(c.kind == kind, c.person_id.in_(ids))
+    )
+
+    rows = [
+        {"key": key, "kind": kind, "person_id": person["id"]}
+        for person in _load(connection, kind, ids).values()
+        for key in blocking_keys(
+            person["first_name"],
+            person["last_name"],
+            person["birthday"],
+            person["phones"],
+        )
+    ]
+
+    if rows:
+        connection.execute(insert(person_blocks), rows)
+
+
+def rebuild_blocks() -> int:
+    """Recompute every person's keys; returns the number of key rows."""
+    connection = db.session.connection()
+    connection.execute(delete(person_blocks))
+
+    for kind, (_, model, _) in PEOPLE.items():
+        ids = connection.scalars(select(primary_key(model))).all()
+
+        for offset in range(0, len(ids), 5000):
+            refresh_blocks(connection, kind, ids[offset : offset + 5000])
+
+    total: int = connection.scalar(select(func.count()).select_from(person_blocks))
+    db.session.commit()
+
+    return total
+
+
+listen_people(refresh_blocks, BLOCKED_ATTRIBUTES)
+
+
+def similarity(a: Person, b: Person) -> float:
+    """0..1 likelihood that two records are the same person.
+
+    Name resemblance counts for up to 0.6; a shared birthday and a shared
+    phone number add 0.25 each.
+    """
+    names = SequenceMatcher(None, a["name"].lower(), b["name"].lower()).ratio()
+    score = 0.6 * names
+
+    if a["birthday"] is not None and a["birthday"] == b["birthday"]:
+        score += 0.25
+
+    phones = {_suffix(p) for p in a["phones"]} - {None}
+    if phones & {_suffix(p) for p in b["phones"]}:
+        score += 0.25
+
+    return round(min(score, 1.0), 3)
+
+
+def _score(
+    connection: Connection, pairs: Iterable[Tuple[str, int, str, int]], min_score: float
+) -> List[Dict]:
+    pairs = list(pairs)
+    wanted: Dict[str, Set[int]] = {kind: set() for kind in PEOPLE}
+
+    for kind_a, id_a, kind_b, id_b in pairs:
+        wanted[kind_a].add(id_a)
+        wanted[kind_b].add(id_b)
+
+    people: Dict[Tuple[str, int], Person] = {
+        (kind, person_id): person
+        for kind, ids in wanted.items()
+        for person_id, person in _load(connection, kind, ids).items()
+    }
+    matches: List[Dict] = []
+
+    for kind_a, id_a, kind_b, id_b in pairs:
+        a, b = people.get((kind_a, id_a)), people.get((kind_b, id_b))
+
+        if a and b and (score := similarity(a, b)) >= min_score:
+            matches.append({"a": a, "b": b, "score": score})
+
+    matches.sort(key=lambda match: -match["score"])
+
+    return matches
+
+
+def possible_duplicates(kind: str, person_id: int) -> List[Dict]:
+    """People sharing a block with one person and similar enough to them.
+
+    One self-join of ``person_blocks`` over its indexes, then the few
+    candidates are scored; meant to run right after an insert.
+    """
+    connection = db.session.connection()
+    a, b = person_blocks.alias("a"), person_blocks.alias("b")
+
+    candidates = connection.execute(
+        select(b.c.kind, b.c.person_id)
+        .join_from(a, b, a.c.key == b.c.key)
+        .where(
+            a.c.kind == kind,
+            a.c.person_id == person_id,
+            tuple_(b.c.kind, b.c.person_id) != tuple_(a.c.kind, a.c.person_id),
+        )
+        .distinct()
+    ).all()
+
+    return [
+        {
+            "kind": match["b"]["kind"],
+            "id": match["b"]["id"],
+            "name": match["b"]["name"],
+            "score": match["score"],
+        }
+        for match in _score(
+            connection,
+            [(kind, person_id, *candidate) for candidate in candidates],
+            current_app.config["DEDUPE_MIN_SCORE"],
+        )
+    ]
+
+
+def describe_duplicates(matches: List[Dict]) -> str:
+    """One sentence naming ``possible_duplicates`` for a flash message."""
+    names = ", ".join(f"{m['name']} ({m['kind']} #{m['id']})" for m in matches[:3])
+    return f"Possible duplicate of {names}." if names else ""
+
+
+def find_duplicates(
+    min_score: Optional[float] = None, max_block: Optional[int] = None
+) -> List[Dict]:
+    """Likely duplicate pairs across students, teachers and employees.
+
+    Candidate pairs come from one self-join of ``person_blocks`` on the key,
+    so only records sharing a block are compared; blocks larger than
+    ``max_block`` (very common names) are skipped to keep the scan linear.
+    """
+    min_score = (
+        current_app.config["DEDUPE_MIN_SCORE"] if min_score is None else min_score
+    )
+    max_block = max_block or current_app.config["DEDUPE_MAX_BLOCK"]
+    connection = db.session.connection()
+    a, b = person_blocks.alias("a"), person_blocks.alias("b")
+
+    oversized = (
+        select(person_blocks.c.key)
+        .group_by(person_blocks.c.key)
+        .having(func.count() > max_block)
+    )
+    pairs = connection.execute(
+        select(a.c.kind, a.c.person_id, b.c.kind, b.c.person_id)
+        .join_from(a, b, a.c.key == b.c.key)
+        .where(
+            or_(
+                a.c.kind < b.c.kind,
+                and_(a.c.kind == b.c.kind, a.c.person_id < b.c.person_id),
+            ),
+            a.c.key.not_in(oversized),
+        )
+        .distinct()
+    ).all()
+
+    return _score(connection, pairs, min_score)
+
+
+people_cli: AppGroup = AppGroup("people", help="Find duplicate people.")
+
+
+@people_cli.command("blocks")
+def blocks_command() -> None:
+    """Recompute the blocking keys of every student, teacher and employee."""
+    console.print(f"{rebuild_blocks()} key(s)")
+
+
+@people_cli.command("dedupe")
+@click.option("--min-score", type=float, help="Lowest similarity to report.")
+@click.option("--max-block", type=int, help="Skip blocks with more people.")
+def dedupe_command(min_score: Optional[float], max_block: Optional[int]) -> None:
+    """List likely duplicate students, teachers and employees."""
+    matches = find_duplicates(min_score, max_block)
+
+    for match in matches:
+        a, b = match["a"], match["b"]
+        console.print(
+            f"{match['score']:.2f}  {a['kind']} {a['id']} {a['name']!r}"
+            f"  ~  {b['kind']} {b['id']} {b['name']!r}"
+        )
+
+    console.print(f"{len(matches)} likely duplicate(s)")
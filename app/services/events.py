@@ -0,0 +1,43 @@
+from typing import Callable, Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+
+def previous(target, key: str):
+    """Value of ``key`` before the current flush."""
+    history = inspect(target).attrs[key].history
+
+    if history.deleted:
+        return history.deleted[0]
+
+    return history.unchanged[0] if history.unchanged else getattr(target, key)
+
+
+def changed(target, keys: Iterable[str]) -> bool:
+    """Whether the current flush changes any of the attributes ``keys``."""
+    attrs = inspect(target).attrs
+    return any(attrs[key].history.has_changes() for key in keys)
+
+
+def invalidate_on_commit(
+    name: str, touches: Callable[[Session], bool], invalidate: Callable[[], None]
+) -> None:
+    """Call ``invalidate`` once a transaction in which ``touches`` held ends.
+
+    ``touches(session)`` is checked after every flush; the result is kept in
+    ``session.info[name]`` until the commit.  A rollback invalidates too,
+    since figures read after the flush may come from rows that are gone.
+    """
+
+    def mark(session: Session, flush_context) -> None:
+        if touches(session):
+            session.info[name] = True
+
+    def transaction_end(session: Session, *args) -> None:
+        if session.info.pop(name, False):
+            invalidate()
+
+    event.listen(Session, "after_flush", mark)
+    event.listen(Session, "after_commit", transaction_end)
+    event.listen(Session, "after_soft_rollback", transaction_end)
@@ -0,0 +1,172 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import click
+from flask import Flask
+from flask.cli import AppGroup
+from sqlalchemy import or_, select
+
+from app.extensions import console, db
+from app.models.file import File
+from app.services.orphans import collect_orphans
+
+
+def verify_files(
+    batch_size: int = 500,
+    rehash: bool = False,
+    older_than: Optional[timedelta] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, int]:
+    """Reconcile the stored file metadata with what is on disk.
+
+    Walks ``files`` in primary-key batches, committing after each one.  Only
+    rows never verified (or verified longer than ``older_than`` ago) are
+    checked when ``older_than`` is given.  Hashes are recomputed only for files
+    whose size changed unless ``rehash`` is set.
+    """
+    stats: Dict[str, int] = {"checked": 0, "changed": 0, "missing": 0}
+    last_id: int = 0
+
+    while limit is None or stats["checked"] < limit:
+        stmt = select(File).where(File.file_id > last_id).order_by(File.file_id)
+
+        if older_than is not None:
+            cutoff = datetime.now(timezone.utc) - older_than
+            stmt = stmt.where(
+                or_(File.verified_at.is_(None), File.verified_at < cutoff)
+            )
+
+        size = (
+            batch_size if limit is None else min(batch_size, limit - stats["checked"])
+        )
+        files: List[File] = db.session.scalars(stmt.limit(size)).all()
+
+        if not files:
+            break
+
+        for file in files:
+            stats["checked"] += 1
+            stats["changed"] += file.refresh_metadata(rehash=rehash)
+            stats["missing"] += not file.file_exists
+
+        last_id = files[-1].file_id
+        db.session.commit()
+        db.session.expunge_all()
+
+    return stats
+
+
+class FileVerifier:
+    """Periodically re-verify stale file metadata in a daemon thread.
+
+    Disabled unless ``FILE_VERIFY_INTERVAL`` is positive; every interval it
+    checks up to ``FILE_VERIFY_BATCH_SIZE`` files last verified more than
+    ``FILE_VERIFY_MAX_AGE`` seconds ago.  The thread is started on the first
+    request so forked workers each get their own.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.app: Optional[Flask] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.app = app
+        self.interval: float = app.config["FILE_VERIFY_INTERVAL"]
+        self.batch_size: int = app.config["FILE_VERIFY_BATCH_SIZE"]
+        self.max_age: timedelta = timedelta(seconds=app.config["FILE_VERIFY_MAX_AGE"])
+
+        app.extensions["file_verifier"] = self
+
+        if self.interval > 0:
+            app.before_request(self._ensure_started)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="file-verifier", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+
+            try:
+                with self.app.app_context():
+                    verify_files(
+                        batch_size=self.batch_size,
+                        older_than=self.max_age,
+                        limit=self.batch_size,
+                    )
+            except Exception as err:
+                console.print(err)
+
+
+file_verifier: FileVerifier = FileVerifier()
+
+
+files_cli: AppGroup = AppGroup("files", help="Maintain uploaded files.")
+
+
+@files_cli.command("verify")
+@click.option("--rehash", is_flag=True, help="Recompute every content hash.")
+@click.option(
+    "--stale",
+    type=float,
+    default=None,
+    help="Only check files not verified within this many hours.",
+)
+@click.option("--batch-size", type=int, default=500, show_default=True)
+def verify_command(rehash: bool, stale: Optional[float], batch_size: int) -> None:
+    """Reconcile size, hash, MIME type and existence of files with disk."""
+    stats = verify_files(
+        batch_size=batch_size,
+        rehash=rehash,
+        older_than=None if stale is None else timedelta(hours=stale),
+    )
+
+    console.print(
+        f"checked: {stats['checked']}, changed: {stats['changed']}, "
+        f"missing: {stats['missing']}"
+    )
+
+
+@files_cli.command("gc")
+@click.option("--dry-run", is_flag=True, help="Only report what would be removed.")
+@click.option(
+    "--quarantine", is_flag=True, help="Move orphans to .quarantine/ instead."
+)
+@click.option(
+    "--grace",
+    type=float,
+    default=None,
+    help="Keep orphans younger than this many hours [UPLOAD_GRACE_PERIOD].",
+)
+@click.option("--verbose", is_flag=True, help="Print every orphan.")
+def gc_command(
+    dry_run: bool, quarantine: bool, grace: Optional[float], verbose: bool
+) -> None:
+    """Remove uploads that no row references any more."""
+    stats = collect_orphans(
+        grace_period=None if grace is None else grace * 3600,
+        dry_run=dry_run,
+        quarantine=quarantine,
+        verbose=verbose,
+    )
+
+    console.print(
+        f"scanned: {stats['scanned']}, referenced: {stats['referenced']}, "
+        f"recent: {stats['recent']}, "
+        f"{'orphans' if dry_run else 'removed'}: {stats['orphans']} "
+        f"({stats['bytes']} bytes)"
+    )
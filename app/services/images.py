@@ -0,0 +1,230 @@
+import os
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+import click
+from flask import Flask
+from flask.cli import AppGroup
+from sqlalchemy import select
+
+from app.extensions import console, db
+from app.services.storage import URL_COLUMNS, content_store, variant_extension
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - Pillow is optional
+    Image = ImageOps = None
+
+IMAGE_EXTENSIONS: Set[str] = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+
+
+class ImageDerivatives:
+    """Resized, recompressed variants of uploaded images.
+
+    Every variant in ``IMAGE_VARIANTS`` (name -> width in pixels) is written
+    next to its source blob as ``<sha256>.<variant>.<format>``, by a daemon
+    thread fed from a queue so uploads never wait for Pillow.  Lookups stat
+    the variants once and then serve them from a bounded in-memory cache;
+    until a variant exists the original URL is returned and the source is
+    queued, which also backfills images uploaded before this existed.
+    Without Pillow every lookup simply returns the original URL.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.variants: Dict[str, int] = {}
+        self.queue: queue.Queue = queue.Queue()
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._cache: OrderedDict = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.variants = dict(app.config["IMAGE_VARIANTS"])
+        self.format: str = app.config["IMAGE_FORMAT"].upper()
+        self.quality: int = app.config["IMAGE_QUALITY"]
+        self.cache_size: int = app.config["IMAGE_CACHE_SIZE"]
+        self.extension: str = variant_extension(self.format)
+
+        app.extensions["image_derivatives"] = self
+        app.add_template_global(self.src, "image_src")
+        app.add_template_global(self.srcset, "image_srcset")
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None and bool(self.variants)
+
+    def _source(self, url: Optional[str]) -> Optional[str]:
+        """Blob path of ``url`` if it is a stored image we can derive from."""
+        if not self.enabled:
+            return None
+
+        path: Optional[str] = content_store.path_for_url(url)
+
+        if path is None or os.path.splitext(path)[1] not in IMAGE_EXTENSIONS:
+            return None
+
+        return path
+
+    def _variant_path(self, source: str, variant: str) -> str:
+        directory, name = os.path.split(source)
+        return os.path.join(directory, f"{name[:64]}.{variant}{self.extension}")
+
+    def _variant_url(self, url: str, variant: str) -> str:
+        head, name = url.rsplit("/", 1)
+        return f"{head}/{name[:64]}.{variant}{self.extension}"
+
+    def urls(self, url: Optional[str]) -> Dict[str, str]:
+        """Variant name -> URL for ``url``; missing variants fall back to ``url``."""
+        with self._lock:
+            if cached := self._cache.get(url):
+                self._cache.move_to_end(url)
+                return cached
+
+        source: Optional[str] = self._source(url)
+
+        if source is None:
+            return {variant: url or "" for variant in self.variants}
+
+        dct: Dict[str, str] = {}
+
+        for variant in self.variants:
+            dct[variant] = (
+                self._variant_url(url, variant)
+                if os.path.exists(self._variant_path(source, variant))
+                else url
+            )
+
+        if url in dct.values():
+            self.enqueue(url)
+        else:
+            with self._lock:
+                self._cache[url] = dct
+
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return dct
+
+    def src(self, url: Optional[str], variant: str = "card") -> str:
+        return self.urls(url).get(variant, url or "")
+
+    def srcset(self, url: Optional[str]) -> str:
+        """``srcset`` value listing every built variant with its width."""
+        return ", ".join(
+            f"{variant_url} {self.variants[variant]}w"
+            for variant, variant_url in self.urls(url).items()
+            if variant_url != (url or "")
+        )
+
+    def enqueue(self, url: Optional[str]) -> bool:
+        """Queue ``url`` for the background worker; ``False`` if not an image."""
+        source: Optional[str] = self._source(url)
+
+        if source is None or source in self._failed:
+            return False
+
+        with self._lock:
+            if source in self._pending:
+                return True
+
+            self._pending.add(source)
+
+        self.queue.put(source)
+        self._ensure_started()
+
+        return True
+
+    def build(self, url: Optional[str], force: bool = False) -> List[str]:
+        """Synchronously write the missing variants of ``url``."""
+        source: Optional[str] = self._source(url)
+
+        if source is None:
+            return []
+
+        return self._render(source, force)
+
+    def _render(self, source: str, force: bool = False) -> List[str]:
+        targets: Dict[str, str] = {}
+
+        for variant in self.variants:
+            path: str = self._variant_path(source, variant)
+
+            if force or not os.path.exists(path):
+                targets[variant] = path
+
+        if not targets or not os.path.exists(source):
+            return []
+
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            mode = "RGBA" if image.has_transparency_data else "RGB"
+            image = image.convert("RGB" if self.format == "JPEG" else mode)
+
+            for variant, target in targets.items():
+                resized = image.copy()
+                # Bound the width only; never upscale.
+                resized.thumbnail((self.variants[variant], image.height))
+
+                temp: str = f"{target}.{uuid.uuid4().hex}.tmp"
+                resized.save(temp, format=self.format, quality=self.quality)
+                os.replace(temp, target)
+
+        return list(targets.values())
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="image-derivatives", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            source: str = self.queue.get()
+
+            try:
+                self._render(source)
+            except Exception as err:
+                # Not decodable; do not queue it again from every lookup.
+                self._failed.add(source)
+                console.print(err)
+            finally:
+                with self._lock:
+                    self._pending.discard(source)
+
+
+image_derivatives: ImageDerivatives = ImageDerivatives()
+
+
+images_cli: AppGroup = AppGroup("images", help="Maintain image derivatives.")
+
+
+@images_cli.command("build")
+@click.option("--force", is_flag=True, help="Rebuild variants that already exist.")
+def build_command(force: bool) -> None:
+    """Write the missing variants of every stored image."""
+    if not image_derivatives.enabled:
+        console.print("Pillow is not installed; nothing to do.")
+        return
+
+    built: int = 0
+
+    for column in URL_COLUMNS:
+        for url in db.session.scalars(select(column).distinct()):
+            try:
+                built += len(image_derivatives.build(url, force=force))
+            except Exception as err:
+                console.print(f"{url}: {err}")
+
+    console.print(f"variants written: {built}")
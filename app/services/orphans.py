@@ -0,0 +1,227 @@
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from flask import Flask, current_app
+from sqlalchemy import select
+
+from app.extensions import console, db
+from app.services.storage import URL_COLUMNS, content_store
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+QUARANTINE: str = ".quarantine"
+HASH_LENGTH: int = 64
+
+
+def referenced_paths(batch_size: int = 10000) -> Tuple[Set[str], Set[str]]:
+    """Upload paths (relative to ``UPLOAD_FOLDER``) referenced by any URL column.
+
+    Returns ``(paths, hashes)``: every referenced relative path, plus the
+    content hash of every referenced content-store blob so files derived from
+    a blob count as referenced too.  URLs are streamed in batches.
+    """
+    paths: Set[str] = set()
+    hashes: Set[str] = set()
+    marker: str = "/uploads/"
+
+    for column in URL_COLUMNS:
+        result = db.session.execute(
+            select(column).where(column.contains(marker)).distinct(),
+            execution_options={"yield_per": batch_size},
+        )
+
+        for (url,) in result:
+            relative: str = unquote(url.split(marker, 1)[1].split("?", 1)[0])
+            paths.add(relative)
+
+            if content_store.path_for_url(url):
+                hashes.add(relative.rsplit("/", 1)[-1][:HASH_LENGTH])
+
+    return paths, hashes
+
+
+def walk(root: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield ``(relative path, entry)`` for every file below ``root``.
+
+    Iterative ``os.scandir`` so the tree is streamed rather than listed, and
+    the quarantine itself is never scanned.
+    """
+    stack = [""]
+
+    while stack:
+        prefix: str = stack.pop()
+
+        try:
+            with os.scandir(os.path.join(root, prefix)) as entries:
+                for entry in entries:
+                    relative: str = f"{prefix}{entry.name}"
+
+                    if entry.is_dir(follow_symlinks=False):
+                        if relative != QUARANTINE:
+                            stack.append(f"{relative}/")
+                    elif entry.is_file(follow_symlinks=False):
+                        yield relative, entry
+        except FileNotFoundError:
+            continue
+
+
+def _is_referenced(relative: str, paths: Set[str], hashes: Set[str]) -> bool:
+    if relative in paths:
+        return True
+
+    if relative.startswith(f"{content_store.PREFIX}/"):
+        return relative.rsplit("/", 1)[-1][:HASH_LENGTH] in hashes
+
+    return False
+
+
+def _age_reference(root: str, relative: str, entry: os.DirEntry) -> float:
+    """Modification time that decides whether ``entry`` is old enough.
+
+    The JSON sidecar of a chunked upload is written once; the upload is only
+    abandoned when its ``.part`` file has not grown for the grace period.
+    """
+    mtime: float = entry.stat(follow_symlinks=False).st_mtime
+
+    if relative.startswith(".incoming/") and relative.endswith(".json"):
+        try:
+            part = os.path.join(root, relative[: -len(".json")] + ".part")
+            mtime = max(mtime, os.path.getmtime(part))
+        except FileNotFoundError:
+            pass
+
+    return mtime
+
+
+def collect_orphans(
+    grace_period: Optional[float] = None,
+    dry_run: bool = False,
+    quarantine: bool = False,
+    verbose: bool = False,
+) -> Dict[str, int]:
+    """Delete (or move to ``.quarantine/``) uploads nothing references.
+
+    Only files older than ``grace_period`` seconds (``UPLOAD_GRACE_PERIOD`` by
+    default) are touched, so an upload waiting for its form to be submitted
+    survives.  The referenced set is loaded first, then the tree is walked
+    once; each file costs a set lookup and, for unreferenced ones, a stat.
+    With ``dry_run`` nothing is changed and the would-be orphans are counted.
+    """
+    root: str = current_app.config["UPLOAD_FOLDER"]
+    if grace_period is None:
+        grace_period = current_app.config["UPLOAD_GRACE_PERIOD"]
+
+    stats: Dict[str, int] = {
+        "scanned": 0,
+        "referenced": 0,
+        "recent": 0,
+        "orphans": 0,
+        "bytes": 0,
+    }
+
+    paths, hashes = referenced_paths()
+
+    cutoff: float = time.time() - grace_period
+
+    for relative, entry in walk(root):
+        stats["scanned"] += 1
+
+        if _is_referenced(relative, paths, hashes):
+            stats["referenced"] += 1
+            continue
+
+        try:
+            if _age_reference(root, relative, entry) >= cutoff:
+                stats["recent"] += 1
+                continue
+
+            size: int = entry.stat(follow_symlinks=False).st_size
+
+            if verbose:
+                console.print(relative)
+
+            if not dry_run:
+                if quarantine:
+                    target = os.path.join(root, QUARANTINE, *relative.split("/"))
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(entry.path, target)
+                else:
+                    os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+
+        stats["orphans"] += 1
+        stats["bytes"] += size
+
+    return stats
+
+
+class OrphanCollector:
+    """Run :func:`collect_orphans` every ``UPLOAD_GC_INTERVAL`` seconds.
+
+    Disabled unless the interval is positive.  Workers share the upload tree,
+    so a lock file makes sure only one of them collects at a time.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.app: Optional[Flask] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.app = app
+        self.interval: float = app.config["UPLOAD_GC_INTERVAL"]
+        self.quarantine: bool = app.config["UPLOAD_GC_QUARANTINE"]
+
+        app.extensions["orphan_collector"] = self
+
+        if self.interval > 0:
+            app.before_request(self._ensure_started)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="orphan-collector", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+
+            try:
+                with self.app.app_context():
+                    self.collect()
+            except Exception as err:
+                console.print(err)
+
+    def collect(self) -> Optional[Dict[str, int]]:
+        """Collect once; ``None`` when another process is already at it."""
+        # Inside the quarantine, which is never scanned.
+        directory: str = os.path.join(current_app.config["UPLOAD_FOLDER"], QUARANTINE)
+        os.makedirs(directory, exist_ok=True)
+
+        with open(os.path.join(directory, ".gc.lock"), "a") as fp:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return None
+
+            return collect_orphans(quarantine=self.quarantine)
+
+
+orphan_collector: OrphanCollector = OrphanCollector()
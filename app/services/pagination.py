@@ -0,0 +1,223 @@
+import base64
+import binascii
+import enum
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask import current_app, request
+from sqlalchemy import Column, Select, and_, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.extensions import db
+
+# Dialects comparing row values, ``(a, b) > (?, ?)``, over an index.
+ROW_VALUE_DIALECTS = {"sqlite", "postgresql", "mysql", "mariadb"}
+
+
+class PaginationError(ValueError):
+    """Raised for malformed table parameters (bad cursor, unknown column...)."""
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode(column: ColumnElement, value: Any) -> Any:
+    """Convert a cursor or query-string value back to the column's Python type."""
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    try:
+        if issubclass(python_type, enum.Enum):
+            if value in python_type.__members__:
+                return python_type[value]
+            return python_type(value)
+        if python_type in (date, datetime, time):
+            return python_type.fromisoformat(value)
+        if python_type in (int, Decimal, float):
+            return python_type(value)
+    except (KeyError, TypeError, ValueError) as err:
+        raise PaginationError(f"Invalid value for {column.key}: {value!r}") from err
+
+    return value
+
+
+def _nullable(column: ColumnElement) -> bool:
+    """Whether ``column`` may hold ``NULL``; expressions are assumed to."""
+    expression = getattr(column, "expression", column)
+    return not isinstance(expression, Column) or expression.nullable
+
+
+def _after(
+    keys: Sequence[ColumnElement], values: Sequence[Any], descending: bool
+) -> ColumnElement:
+    """``keys`` come after ``values`` in the page order.
+
+    A row-value comparison where the database has them, so the whole
+    predicate is one index range; otherwise the equivalent ``OR``.
+    """
+    if len(keys) == 1:
+        return keys[0] < values[0] if descending else keys[0] > values[0]
+
+    if db.session.get_bind().dialect.name in ROW_VALUE_DIALECTS:
+        row = tuple_(*keys)
+        return row < tuple(values) if descending else row > tuple(values)
+
+    (column, *rest), (value, *more) = keys, values
+    first = column < value if descending else column > value
+
+    return or_(first, and_(column == value, _after(rest, more, descending)))
+
+
+class KeysetPage:
+    """One page of a table, selected with a keyset (seek) cursor.
+
+    Rows are ordered by the requested sort column with the primary key as a
+    tie-breaker, ``NULL`` values last.  The cursor encodes the
+    ``(sort value, primary key)`` of the last row, so fetching the next page is
+    an index range scan instead of an ``OFFSET``; a nullable column is read
+    as two such scans, its values and then its ``NULL`` rows.  Understood query
+    parameters:
+
+    * ``limit``  - page size (``TABLE_PAGE_SIZE``, capped at ``TABLE_MAX_PAGE_SIZE``)
+    * ``sort`` / ``order`` - a column of ``sortable`` and ``asc``/``desc``
+    * ``q`` - case-insensitive substring search over ``searchable``
+    * ``filter[<column>]`` - equality filter on a column of ``filterable``
+    * ``cursor`` - the ``next_cursor`` of the previous page
+    """
+
+    def __init__(
+        self,
+        stmt: Select,
+        pk: ColumnElement,
+        sortable: Optional[Dict[str, ColumnElement]] = None,
+        searchable: Sequence[ColumnElement] = (),
+        filterable: Optional[Dict[str, ColumnElement]] = None,
+        args: Optional[Dict[str, str]] = None,
+    ) -> None:
+        args = request.args if args is None else args
+        sortable = {pk.key: pk, **(sortable or {})}
+        filterable = filterable or {}
+
+        self.sortable: List[str] = list(sortable)
+
+        self.sort: str = args.get("sort") or pk.key
+        self.order: str = args.get("order", "asc").lower()
+        self.limit: int = self._limit(args.get("limit"))
+
+        if self.sort not in sortable:
+            raise PaginationError(f"Cannot sort by {self.sort!r}")
+        if self.order not in ("asc", "desc"):
+            raise PaginationError(f"Invalid order {self.order!r}")
+
+        column = sortable[self.sort]
+        descending = self.order == "desc"
+
+        if q := (args.get("q") or "").strip():
+            pattern = "%{}%".format(
+                q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            stmt = stmt.where(
+                or_(*[col.ilike(pattern, escape="\\") for col in searchable])
+            )
+
+        for key, value in args.items():
+            if key.startswith("filter[") and key.endswith("]"):
+                name = key[len("filter[") : -1]
+
+                if name not in filterable:
+                    raise PaginationError(f"Cannot filter by {name!r}")
+
+                stmt = stmt.where(filterable[name] == _decode(filterable[name], value))
+
+        cursor = args.get("cursor")
+        last = self._read_cursor(column, cursor) if cursor else None
+        keys = [pk] if column is pk else [column, pk]
+        nullable: bool = _nullable(column)
+        rows: List = []
+
+        def fetch(stmt: Select, order_by: List[ColumnElement], limit: int) -> List:
+            stmt = stmt.order_by(
+                *[c.desc() if descending else c.asc() for c in order_by]
+            )
+            return (
+                db.session.execute(stmt.add_columns(column, pk).limit(limit))
+                .unique()
+                .all()
+            )
+
+        if last is None or last[0] is not None:
+            # Non-NULL values: a range scan of the column's index from the
+            # cursor on, with no sort and no OR.
+            where = (
+                [] if last is None else [_after(keys, last[-len(keys) :], descending)]
+            )
+
+            if nullable:
+                where.append(column.is_not(None))
+
+            rows = fetch(stmt.where(*where), keys, self.limit + 1)
+
+        if nullable and len(rows) <= self.limit:
+            # Then the trailing block of NULLs, in primary key order.
+            where = [column.is_(None)]
+
+            if last is not None and last[0] is None:
+                where.append(_after([pk], last[1:], descending))
+
+            rows += fetch(stmt.where(*where), [pk], self.limit + 1 - len(rows))
+
+        self.has_more: bool = len(rows) > self.limit
+        self.items: List = [row[0] for row in rows[: self.limit]]
+        self.next_cursor: Optional[str] = (
+            self._cursor(*rows[self.limit - 1][1:]) if self.has_more else None
+        )
+
+    def _limit(self, value: Optional[str]) -> int:
+        default: int = current_app.config["TABLE_PAGE_SIZE"]
+        maximum: int = current_app.config["TABLE_MAX_PAGE_SIZE"]
+
+        try:
+            limit = int(value) if value else default
+        except ValueError as err:
+            raise PaginationError(f"Invalid limit {value!r}") from err
+
+        return max(1, min(limit, maximum))
+
+    @staticmethod
+    def _cursor(value: Any, pk: Any) -> str:
+        raw = json.dumps([_encode(value), pk], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _read_cursor(column: ColumnElement, cursor: str) -> Tuple[Any, Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            value, last_pk = json.loads(raw)
+        except (binascii.Error, ValueError, TypeError) as err:
+            raise PaginationError("Invalid cursor") from err
+
+        return _decode(column, value), last_pk
+
+    def meta(self) -> Dict[str, Any]:
+        return {
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            "sort": self.sort,
+            "order": self.order,
+            "limit": self.limit,
+            "sortable": self.sortable,
+        }
@@ -0,0 +1,247 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    Connection,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    delete,
+    event,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.phone import EmployeePhone, StudentPhone, TeacherPhone
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.events import changed, previous
+
+# kind -> (rowid code, model, phone model); ``rowid = id * 8 + code``.
+PEOPLE: Dict[str, tuple] = {
+    "student": (1, Student, StudentPhone),
+    "teacher": (2, Teacher, TeacherPhone),
+    "employee": (3, Employee, EmployeePhone),
+}
+KIND_NAMES: Dict[int, str] = {code: kind for kind, (code, *_) in PEOPLE.items()}
+
+CREATE_INDEX = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS people_index USING fts5("
+    "name, email, phones, tokenize = 'trigram')"
+)
+
+# Statement-building only, like ``search_index`` in app/services/search.py.
+people_index = Table(
+    "people_index",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("name", Text),
+    Column("email", Text),
+    Column("phones", Text),
+)
+
+event.listen(
+    db.metadata, "after_create", DDL(CREATE_INDEX).execute_if(dialect="sqlite")
+)
+event.listen(
+    db.metadata,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS people_index").execute_if(dialect="sqlite"),
+)
+
+NAME_ATTRIBUTES = ("first_name", "middle_name", "last_name", "email")
+
+# Candidates fetched from the index before re-ranking by trigram overlap.
+CANDIDATES = 50
+
+# Matches sharing less than this share of the query's trigrams are dropped.
+MIN_SCORE = 0.3
+
+
+def _enabled(connection: Connection) -> bool:
+    return connection.dialect.name == "sqlite"
+
+
+def primary_key(model: Type[db.Model]) -> Column:
+    return model.__table__.primary_key.columns[0]
+
+
+def owner_column(phone_model: Type[db.Model]) -> Column:
+    return next(iter(phone_model.__table__.foreign_keys)).parent
+
+
+def _digits(column):
+    """``column`` without the separators people type in phone numbers."""
+    for char in " -()+":
+        column = func.replace(column, char, "")
+
+    return column
+
+
+def _documents(kind: str):
+    """``SELECT rowid, name, email, phones`` of every person of ``kind``."""
+    code, model, phone_model = PEOPLE[kind]
+    t = model.__table__.c
+    phones = (
+        select(func.group_concat(_digits(phone_model.__table__.c.phone_number), " "))
+        .where(owner_column(phone_model) == primary_key(model))
+        .scalar_subquery()
+    )
+
+    return select(
+        (primary_key(model) * 8 + code).label("rowid"),
+        t.first_name + " " + func.coalesce(t.middle_name + " ", "") + t.last_name,
+        func.coalesce(t.email, ""),
+        func.coalesce(phones, ""),
+    )
+
+
+def reindex_people(
+    connection: Connection, kind: str, ids: Iterable[Optional[int]]
+) -> None:
+    """Replace the index rows of the ``kind`` people with primary keys ``ids``."""
+    ids = [i for i in set(ids) if i is not None]
+
+    if not ids or not _enabled(connection):
+        return
+
+    code, model, _ = PEOPLE[kind]
+
+    connection.execute(
+        delete(people_index).where(
+            people_index.c.rowid.in_([i * 8 + code for i in ids])
+        )
+    )
+    connection.execute(
+        insert(people_index).from_select(
+            ["rowid", "name", "email", "phones"],
+            _documents(kind).where(primary_key(model).in_(ids)),
+        )
+    )
+
+
+def rebuild_people_index() -> int:
+    """Re-create the whole index from the base tables; returns the row count."""
+    connection = db.session.connection()
+
+    if not _enabled(connection):
+        raise RuntimeError("The people index requires SQLite with FTS5.")
+
+    connection.execute(text(CREATE_INDEX))
+    connection.execute(delete(people_index))
+
+    for kind in PEOPLE:
+        connection.execute(
+            insert(people_index).from_select(
+                ["rowid", "name", "email", "phones"], _documents(kind)
+            )
+        )
+
+    total: int = connection.scalar(select(func.count()).select_from(people_index))
+    db.session.commit()
+
+    return total
+
+
+def listen_people(
+    refresh: Callable[[Connection, str, List[int]], Any],
+    attributes: Optional[Iterable[str]] = None,
+) -> None:
+    """Call ``refresh(connection, kind, ids)`` for the people a flush touches.
+
+    Deleted people and the old and new owners of written phones are always
+    refreshed; inserted people, and updated people whose ``attributes``
+    changed, only when ``attributes`` are given.
+    """
+    for kind, (_, model, phone_model) in PEOPLE.items():
+        _listen(refresh, attributes, kind, model, phone_model)
+
+
+def _listen(refresh, attributes, kind: str, model, phone_model) -> None:
+    pk: str = primary_key(model).key
+    owner: str = owner_column(phone_model).key
+
+    def person_written(mapper, connection, target) -> None:
+        refresh(connection, kind, [getattr(target, pk)])
+
+    def person_updated(mapper, connection, target) -> None:
+        if changed(target, attributes):
+            person_written(mapper, connection, target)
+
+    def phone_written(mapper, connection, target) -> None:
+        refresh(connection, kind, [previous(target, owner), getattr(target, owner)])
+
+    if attributes is not None:
+        event.listen(model, "after_insert", person_written)
+        event.listen(model, "after_update", person_updated)
+
+    event.listen(model, "after_delete", person_written)
+
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(phone_model, name, phone_written)
+
+
+listen_people(reindex_people, NAME_ATTRIBUTES)
+
+
+def _trigrams(value: str) -> Set[str]:
+    grams: Set[str] = set()
+
+    for word in re.findall(r"\w+", value.lower()):
+        grams.update(word[i : i + 3] for i in range(len(word) - 2))
+
+    return grams
+
+
+def search_people(q: str, limit: int) -> List[Dict]:
+    """Top ``limit`` people whose name, email or phone resembles ``q``.
+
+    The index returns people sharing any trigram with the query, best bm25
+    first; those candidates are re-ranked by the share of the query's
+    trigrams they contain, so one or two typos still find the person.
+    """
+    connection = db.session.connection()
+    grams: Set[str] = _trigrams(q)
+
+    if not grams or not _enabled(connection):
+        return []
+
+    table = literal_column("people_index")
+    match: str = " OR ".join('"{}"'.format(gram.replace('"', '""')) for gram in grams)
+
+    rows = connection.execute(
+        select(people_index)
+        .where(text("people_index MATCH :match").bindparams(match=match))
+        .order_by(func.bm25(table))
+        .limit(max(CANDIDATES, limit))
+    )
+
+    people: List[Dict] = []
+
+    for row in rows:
+        document: Set[str] = _trigrams(f"{row.name} {row.email} {row.phones}")
+        score: float = len(grams & document) / len(grams)
+
+        if score >= MIN_SCORE:
+            people.append(
+                {
+                    "kind": KIND_NAMES[row.rowid % 8],
+                    "id": row.rowid // 8,
+                    "name": row.name,
+                    "email": row.email or None,
+                    "phones": row.phones.split(),
+                    "score": round(score, 3),
+                }
+            )
+
+    people.sort(key=lambda person: -person["score"])
+
+    return people[:limit]
@@ -0,0 +1,221 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import Connection, delete, func, insert, select
+
+from app.extensions import console, db
+from app.models.phone import phone_index
+from app.services.people import PEOPLE, listen_people, owner_column, primary_key
+
+# Longest number E.164 allows, country code included.
+MAX_DIGITS = 15
+
+
+def normalize_phone(number: str, country_code: Optional[str] = None) -> Optional[str]:
+    """E.164-style key of a phone number as people type it, or ``None``.
+
+    Separators are dropped; ``00`` and ``+`` prefixes are international, a
+    leading ``0`` is the national trunk prefix, and shorter numbers without
+    either get ``PHONE_COUNTRY_CODE``: "0700 123 456", "+93 700-123-456" and
+    "0093700123456" all become "+93700123456".
+    """
+    country_code = country_code or current_app.config["PHONE_COUNTRY_CODE"]
+    number = (number or "").strip()
+    digits: str = re.sub(r"\D", "", number)
+
+    if not digits.strip("0"):
+        return None
+    if number.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0"):
+        digits = country_code + digits[1:]
+    elif not (digits.startswith(country_code) and len(digits) > 9):
+        digits = country_code + digits
+
+    return f"+{digits}" if len(digits) <= MAX_DIGITS else None
+
+
+def refresh_phones(
+    connection: Connection, kind: str, ids: Iterable[Optional[int]]
+) -> List[Tuple[str, int]]:
+    """Re-index the phones of the ``kind`` people with ``ids``.
+
+    Every holder of a number is indexed; the ``(number, person_id)`` pairs
+    whose number someone else already has are returned as conflicts.
+    """
+    ids = [i for i in set(ids) if i is not None]
+
+    if not ids:
+        return []
+
+    _, _, phone_model = PEOPLE[kind]
+    owner = owner_column(phone_model)
+    c = phone_index.c
+
+    connection.execute(delete(phone_index).where(c.kind == kind, c.person_id.in_(ids)))
+
+    first: Dict[str, int] = {}
+    numbers: Dict[Tuple[str, int], None] = {}
+
+    for person_id, phone in connection.execute(
+        select(owner, phone_model.__table__.c.phone_number).where(owner.in_(ids))
+    ):
+        if (number := normalize_phone(phone)) is not None:
+            first.setdefault(number, person_id)
+            numbers[(number, person_id)] = None
+
+    if not numbers:
+        return []
+
+    taken: Set[str] = set(
+        connection.scalars(select(c.number).where(c.number.in_(list(first))))
+    )
+    connection.execute(
+        insert(phone_index),
+        [
+            {"number": number, "kind": kind, "person_id": person_id}
+            for number, person_id in numbers
+        ],
+    )
+
+    return [
+        (number, person_id)
+        for number, person_id in numbers
+        if number in taken or first[number] != person_id
+    ]
+
+
+def rebuild_phone_index() -> Tuple[int, List[Tuple[str, str, int]]]:
+    """Re-index every phone; returns the row count and the numbers that
+    another person already has."""
+    connection = db.session.connection()
+    connection.execute(delete(phone_index))
+    conflicts: List[Tuple[str, str, int]] = []
+
+    for kind, (_, model, _) in PEOPLE.items():
+        ids = connection.scalars(select(primary_key(model))).all()
+
+        for offset in range(0, len(ids), 2000):
+            conflicts.extend(
+                (number, kind, person_id)
+                for number, person_id in refresh_phones(
+                    connection, kind, ids[offset : offset + 2000]
+                )
+            )
+
+    total: int = connection.scalar(select(func.count()).select_from(phone_index))
+    db.session.commit()
+
+    return total, conflicts
+
+
+listen_people(refresh_phones)
+
+
+def check_phones(
+    numbers: Iterable[str], kind: str, person_id: Optional[int] = None
+) -> Optional[str]:
+    """Why the submitted ``numbers`` of a person cannot be saved, or ``None``.
+
+    Every number is normalized and all of them are checked in one ``IN``
+    query against the index, so "0700 123 456" collides with a teacher's
+    "+93700123456" as well as with a student's.
+    """
+    submitted: Dict[str, str] = {}
+
+    for raw in numbers:
+        if (number := normalize_phone(raw)) is None:
+            return f"{raw!r} is not a valid phone number!"
+        if number in submitted:
+            return f"Duplicate entry {raw!r} for phone number!"
+
+        submitted[number] = raw
+
+    if not submitted:
+        return None
+
+    c = phone_index.c
+    owners = db.session.execute(
+        select(c.number, c.kind, c.person_id).where(c.number.in_(list(submitted)))
+    )
+
+    for number, owner_kind, owner_id in owners:
+        if (owner_kind, owner_id) != (kind, person_id):
+            return f"Duplicate entry {submitted[number]!r} for phone number!"
+
+    return None
+
+
+def diff_phones(phones: Iterable, numbers: Iterable[str]) -> Tuple[List, List[str]]:
+    """Split an update of a person's ``phones`` into the rows to delete and the
+    submitted ``numbers`` to add.
+
+    Numbers are compared normalized and in memory, so a number that is only
+    spelled differently keeps its row.  Whether anyone else has a number is
+    :func:`check_phones`' job in the form.
+    """
+    submitted: Dict[str, str] = {}
+
+    for raw in numbers:
+        submitted.setdefault(normalize_phone(raw) or raw, raw)
+
+    kept: Set[str] = set()
+    removed: List = []
+
+    for phone in phones:
+        if (number := normalize_phone(phone.phone_number)) in submitted:
+            kept.add(number)
+        else:
+            removed.append(phone)
+
+    return removed, [raw for n, raw in submitted.items() if n not in kept]
+
+
+def lookup_phone(number: str) -> Optional[Dict]:
+    """``{"number", "holders"}`` for ``number`` in any spelling, or ``None``.
+
+    ``holders`` lists ``{"kind", "id"}`` of everyone with the number; more
+    than one means it was shared before the uniqueness check existed.
+    """
+    if (normalized := normalize_phone(number)) is None:
+        return None
+
+    c = phone_index.c
+    holders: List[Dict] = [
+        {"kind": kind, "id": person_id}
+        for kind, person_id in db.session.execute(
+            select(c.kind, c.person_id)
+            .where(c.number == normalized)
+            .order_by(c.kind, c.person_id)
+        )
+    ]
+
+    return {"number": normalized, "holders": holders} if holders else None
+
+
+phones_cli: AppGroup = AppGroup("phones", help="Maintain the phone number index.")
+
+
+@phones_cli.command("index")
+def index_command() -> None:
+    """Re-index the phones of every student, teacher and employee."""
+    total, conflicts = rebuild_phone_index()
+
+    c = phone_index.c
+
+    for number, kind, person_id in conflicts:
+        owners = db.session.execute(
+            select(c.kind, c.person_id).where(
+                c.number == number, (c.kind != kind) | (c.person_id != person_id)
+            )
+        )
+        console.print(
+            f"{number}  {kind} {person_id}  also belongs to  "
+            + ", ".join(f"{k} {i}" for k, i in owners)
+        )
+
+    console.print(f"{total} number(s) indexed, {len(conflicts)} conflict(s)")
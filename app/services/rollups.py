@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, Optional, Type
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, func, insert, inspect, literal, select
+
+from app.extensions import console, db
+from app.models.course import Course
+from app.models.employee import Employee
+from app.models.enrollment import Enrollment
+from app.models.payment import Payment
+from app.models.rollup import bump_rollup, daily_rollups, rollup_day
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.models.view import View
+
+# Models whose daily counts are rolled up.  Views are normally bulk-inserted
+# by the view recorder, which bumps its rollups itself since bulk inserts
+# bypass mapper events.
+TRACKED: Dict[str, Type[db.Model]] = {
+    "courses": Course,
+    "employees": Employee,
+    "enrollments": Enrollment,
+    "payments": Payment,
+    "students": Student,
+    "teachers": Teacher,
+    "views": View,
+}
+
+
+def _amount(target) -> float:
+    return getattr(target, "amount", None) or 0
+
+
+def _after_insert(mapper, connection, target) -> None:
+    bump_rollup(
+        connection,
+        mapper.local_table.name,
+        rollup_day(target.created_at),
+        1,
+        _amount(target),
+    )
+
+
+def _after_delete(mapper, connection, target) -> None:
+    bump_rollup(
+        connection,
+        mapper.local_table.name,
+        rollup_day(target.created_at),
+        -1,
+        -_amount(target),
+    )
+
+
+def _after_update(mapper, connection, target) -> None:
+    history = inspect(target).attrs.amount.history
+
+    if history.has_changes() and history.deleted:
+        bump_rollup(
+            connection,
+            mapper.local_table.name,
+            rollup_day(target.created_at),
+            0,
+            (target.amount or 0) - (history.deleted[0] or 0),
+        )
+
+
+for _model in TRACKED.values():
+    event.listen(_model, "after_insert", _after_insert)
+    event.listen(_model, "after_delete", _after_delete)
+
+event.listen(Payment, "after_update", _after_update)
+
+
+def rebuild_rollups(names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Recompute the rollups of ``names`` (default: all) from the base tables."""
+    c = daily_rollups.c
+    result: Dict[str, int] = {}
+
+    for name in names or TRACKED:
+        model = TRACKED[name]
+        day = func.date(model.created_at)
+        amount = (
+            func.coalesce(func.sum(model.amount), 0) if model is Payment else literal(0)
+        )
+
+        db.session.execute(delete(daily_rollups).where(c.model == name))
+        db.session.execute(
+            insert(daily_rollups).from_select(
+                ["model", "day", "count", "amount"],
+                select(literal(name), day, func.count(), amount).group_by(day),
+            )
+        )
+
+        result[name] = db.session.execute(
+            select(func.count()).where(c.model == name)
+        ).scalar()
+
+    db.session.commit()
+
+    return result
+
+
+rollups_cli: AppGroup = AppGroup("rollups", help="Maintain the daily rollup tables.")
+
+
+@rollups_cli.command("rebuild")
+@click.argument("names", nargs=-1, type=click.Choice(list(TRACKED)))
+def rebuild_command(names) -> None:
+    """Recompute daily rollups from the base tables."""
+    for name, days in rebuild_rollups(names).items():
+        console.print(f"{name}: {days} day(s)")
@@ -0,0 +1,94 @@
+from typing import Dict, Optional
+
+from flask import Flask
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.job import Job
+from app.models.teacher import Teacher
+from app.services.cache import TTLCache
+from app.services.events import changed, invalidate_on_commit
+
+# Population name -> model with a ``salary`` column.
+POPULATIONS = {"employees": Employee, "teachers": Teacher}
+
+# Attributes whose change makes the cached figures stale.
+SALARY_ATTRIBUTES = {Employee: ("salary", "job_id"), Teacher: ("salary",)}
+
+
+class SalaryStats:
+    """Average salaries per population and salary aggregates per job.
+
+    Each figure set is one grouped query, memoized for ``SALARY_STATS_TTL``
+    seconds.  A commit in this process that adds, removes or re-salaries an
+    employee or teacher (or moves an employee to another job) drops the
+    cache right away; other workers catch up within the TTL.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.cache: TTLCache = TTLCache(ttl=0)
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.cache = TTLCache(ttl=app.config["SALARY_STATS_TTL"])
+
+        app.extensions["salary_stats"] = self
+
+    def averages(self) -> Dict[str, Optional[float]]:
+        return self.cache.get_or_set("averages", self._compute_averages)
+
+    def average(self, population: str) -> Optional[float]:
+        """Average salary of ``employees`` or ``teachers`` (``None`` if no data)."""
+        return self.averages()[population]
+
+    def jobs(self) -> Dict[int, Dict[str, Optional[float]]]:
+        return self.cache.get_or_set("jobs", self._compute_jobs)
+
+    def job(self, job_id: int) -> Dict[str, Optional[float]]:
+        """``Job.SALARY_AGGREGATES`` of one job."""
+        return self.jobs().get(job_id) or dict.fromkeys(Job.SALARY_AGGREGATES)
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+    @staticmethod
+    def _compute_averages() -> Dict[str, Optional[float]]:
+        row = db.session.execute(
+            select(
+                *[
+                    select(func.avg(model.salary)).scalar_subquery().label(name)
+                    for name, model in POPULATIONS.items()
+                ]
+            )
+        ).one()
+
+        return {
+            name: None if getattr(row, name) is None else float(getattr(row, name))
+            for name in POPULATIONS
+        }
+
+    @staticmethod
+    def _compute_jobs() -> Dict[int, Dict[str, Optional[float]]]:
+        return Job.salary_stats_for(db.session.scalars(select(Job.job_id)))
+
+
+salary_stats: SalaryStats = SalaryStats()
+
+
+def _touches_salaries(session: Session) -> bool:
+    for obj in session.new | session.deleted:
+        if type(obj) in SALARY_ATTRIBUTES:
+            return True
+
+    for obj in session.dirty:
+        if (keys := SALARY_ATTRIBUTES.get(type(obj))) and changed(obj, keys):
+            return True
+
+    return False
+
+
+invalidate_on_commit("salary_stats_stale", _touches_salaries, salary_stats.invalidate)
@@ -0,0 +1,253 @@
+import math
+import re
+from typing import Dict, Iterable, List, Optional
+
+from flask import current_app
+from flask.cli import AppGroup
+from markupsafe import Markup, escape
+from sqlalchemy import (
+    DDL,
+    Column,
+    Connection,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    delete,
+    event,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+
+from app.extensions import console, db
+from app.models.course import Course
+from app.models.teacher import Teacher
+from app.services.events import changed, previous
+from app.services.people import rebuild_people_index
+
+# Documents live in an FTS5 table keyed by ``rowid = ref_id * 8 + kind``, so
+# re-indexing one row is a rowid lookup rather than a scan of the index.
+KINDS: Dict[str, int] = {"course": 1, "teacher": 2}
+KIND_NAMES: Dict[int, str] = {code: name for name, code in KINDS.items()}
+
+# Relative weight of the title and body columns in the bm25 ranking.
+WEIGHTS = (10.0, 1.0)
+
+CREATE_INDEX = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    "title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+
+# Only used to build statements; the virtual table is created by the DDL
+# below (``db.create_all``) or by the migration, never by ``MetaData``.
+search_index = Table(
+    "search_index",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("title", Text),
+    Column("body", Text),
+)
+
+event.listen(
+    db.metadata, "after_create", DDL(CREATE_INDEX).execute_if(dialect="sqlite")
+)
+event.listen(
+    db.metadata,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS search_index").execute_if(dialect="sqlite"),
+)
+
+# Attributes that end up in a document; other updates skip the re-index.
+INDEXED_ATTRIBUTES = {
+    Course: ("course_title", "course_description", "teacher_id"),
+    Teacher: ("first_name", "middle_name", "last_name"),
+}
+
+
+def _enabled(connection: Connection) -> bool:
+    return connection.dialect.name == "sqlite"
+
+
+def _documents(kind: str):
+    """``SELECT rowid, title, body`` of every document of ``kind``."""
+    c = Course.__table__.c
+    t = Teacher.__table__.c
+    name = t.first_name + " " + func.coalesce(t.middle_name + " ", "") + t.last_name
+
+    match kind:
+        case "course":
+            return select(
+                (c.course_id * 8 + KINDS["course"]).label("rowid"),
+                c.course_title,
+                func.coalesce(c.course_description, "") + " " + name,
+            ).join_from(Course.__table__, Teacher.__table__)
+        case "teacher":
+            titles = (
+                select(func.group_concat(c.course_title, " "))
+                .where(c.teacher_id == t.teacher_id)
+                .scalar_subquery()
+            )
+            return select(
+                (t.teacher_id * 8 + KINDS["teacher"]).label("rowid"),
+                name,
+                func.coalesce(titles, ""),
+            )
+
+
+def _key(kind: str) -> Column:
+    return {"course": Course.course_id, "teacher": Teacher.teacher_id}[kind]
+
+
+def reindex(connection: Connection, kind: str, ids: Iterable[Optional[int]]) -> None:
+    """Replace the documents of ``kind`` with primary keys ``ids``."""
+    ids = [i for i in set(ids) if i is not None]
+
+    if not ids or not _enabled(connection):
+        return
+
+    connection.execute(
+        delete(search_index).where(
+            search_index.c.rowid.in_([i * 8 + KINDS[kind] for i in ids])
+        )
+    )
+    connection.execute(
+        insert(search_index).from_select(
+            ["rowid", "title", "body"],
+            _documents(kind).where(_key(kind).in_(ids)),
+        )
+    )
+
+
+def rebuild_index() -> int:
+    """Re-create every document from the base tables; returns the count."""
+    connection = db.session.connection()
+
+    if not _enabled(connection):
+        raise RuntimeError("Full-text search requires SQLite with FTS5.")
+
+    connection.execute(text(CREATE_INDEX))
+    connection.execute(delete(search_index))
+
+    for kind in KINDS:
+        connection.execute(
+            insert(search_index).from_select(
+                ["rowid", "title", "body"], _documents(kind)
+            )
+        )
+
+    total: int = connection.scalar(select(func.count()).select_from(search_index))
+    db.session.commit()
+
+    return total
+
+
+@event.listens_for(Course, "after_insert")
+@event.listens_for(Course, "after_delete")
+def _course_written(mapper, connection, target: Course) -> None:
+    reindex(connection, "course", [target.course_id])
+    reindex(connection, "teacher", [target.teacher_id])
+
+
+@event.listens_for(Course, "after_update")
+def _course_updated(mapper, connection, target: Course) -> None:
+    if changed(target, INDEXED_ATTRIBUTES[Course]):
+        reindex(connection, "course", [target.course_id])
+        reindex(
+            connection, "teacher", [previous(target, "teacher_id"), target.teacher_id]
+        )
+
+
+@event.listens_for(Teacher, "after_insert")
+@event.listens_for(Teacher, "after_delete")
+def _teacher_written(mapper, connection, target: Teacher) -> None:
+    reindex(connection, "teacher", [target.teacher_id])
+
+
+@event.listens_for(Teacher, "after_update")
+def _teacher_updated(mapper, connection, target: Teacher) -> None:
+    if not changed(target, INDEXED_ATTRIBUTES[Teacher]):
+        return
+
+    c = Course.__table__.c
+
+    reindex(connection, "teacher", [target.teacher_id])
+    reindex(
+        connection,
+        "course",
+        connection.scalars(
+            select(c.course_id).where(c.teacher_id == target.teacher_id)
+        ),
+    )
+
+
+def _match(q: str) -> Optional[str]:
+    """FTS5 query matching every word of ``q``, the last one as a prefix."""
+    words: List[str] = re.findall(r"\w+", q)[:10]
+
+    if not words:
+        return None
+
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def _highlight(value: str) -> Markup:
+    """Escape a snippet, turning its \\x02/\\x03 markers into ``<mark>``."""
+    return Markup(
+        str(escape(value)).replace("\x02", "<mark>").replace("\x03", "</mark>")
+    )
+
+
+def search(q: str, page: int = 1, per_page: Optional[int] = None) -> Dict:
+    """Rank courses and teachers matching ``q`` with bm25, one page at a time."""
+    per_page = per_page or current_app.config["SEARCH_PAGE_SIZE"]
+    page = max(page, 1)
+    result: Dict = {"q": q, "page": page, "pages": 0, "total": 0, "items": []}
+    connection = db.session.connection()
+
+    if (match := _match(q)) is None or not _enabled(connection):
+        return result
+
+    where = text("search_index MATCH :match").bindparams(match=match)
+    table = literal_column("search_index")
+
+    result["total"] = connection.scalar(
+        select(func.count()).select_from(search_index).where(where)
+    )
+    result["pages"] = math.ceil(result["total"] / per_page)
+
+    rows = connection.execute(
+        select(
+            search_index.c.rowid,
+            search_index.c.title,
+            func.snippet(table, 1, "\x02", "\x03", "…", 16).label("excerpt"),
+        )
+        .where(where)
+        .order_by(func.bm25(table, *WEIGHTS))
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    )
+
+    result["items"] = [
+        {
+            "kind": KIND_NAMES[row.rowid % 8],
+            "id": row.rowid // 8,
+            "title": row.title,
+            "excerpt": _highlight(row.excerpt),
+        }
+        for row in rows
+    ]
+
+    return result
+
+
+search_cli: AppGroup = AppGroup("search", help="Maintain the search indexes.")
+
+
+@search_cli.command("rebuild")
+def rebuild_command() -> None:
+    """Re-index every course and teacher, and the people quick-search."""
+    console.print(f"{rebuild_index()} document(s) indexed")
+    console.print(f"{rebuild_people_index()} people indexed")
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from flask import Flask
+
+from app.models.setting import Setting
+
+
+class SettingCache:
+    """Per-worker snapshot of the single ``Setting`` row.
+
+    The row is loaded once and then served from memory.  Writers call
+    :meth:`invalidate` after committing, which replaces a small version stamp
+    file (``SETTING_VERSION_FILE``).  Every worker compares the stamp with the
+    one it loaded under, so a change made in one process is picked up by all
+    others on their next request without querying the database.
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.stamp_path: str = ""
+        self._snapshot: Optional[Dict] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._loaded: bool = False
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        # Absolute, so every worker and CLI command shares one stamp whatever
+        # directory it was started from.
+        self.stamp_path = os.path.abspath(
+            app.config["SETTING_VERSION_FILE"]
+            or os.path.join(app.instance_path, "setting.version")
+        )
+        self._loaded = False
+
+        app.extensions["setting_cache"] = self
+
+    def get(self) -> Optional[Dict]:
+        """Return ``Setting.to_dict()`` of the current row, or ``None``."""
+        stamp = self._read_stamp()
+
+        if not self._loaded or stamp != self._stamp:
+            with self._lock:
+                setting: Optional[Setting] = Setting.query.first()
+
+                self._snapshot = setting.to_dict() if setting else None
+                self._stamp = stamp
+                self._loaded = True
+
+        return self._snapshot
+
+    def exists(self) -> bool:
+        return self.get() is not None
+
+    def invalidate(self) -> None:
+        """Drop the local snapshot and tell the other workers to do the same."""
+        self._loaded = False
+
+        directory = os.path.dirname(self.stamp_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Replacing the file gives it a new inode, so the stamp changes even
+        # when two updates land within the filesystem's mtime resolution.
+        tmp = f"{self.stamp_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp, self.stamp_path)
+
+    def _read_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.stamp_path)
+        except OSError:
+            return None
+
+        return st.st_ino, st.st_mtime_ns
+
+
+setting_cache: SettingCache = SettingCache()
@@ -0,0 +1,268 @@
+import hashlib
+import os
+import pathlib
+import re
+import time
+import uuid
+from typing import IO, Dict, Optional, Set
+from urllib.parse import unquote
+
+from flask import Flask, current_app, url_for
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from werkzeug.security import safe_join
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.file import File
+from app.models.setting import Setting
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.models.user import User
+
+BUFFER_SIZE: int = 64 * 1024
+
+# Every column that may hold the URL of an uploaded file.
+URL_COLUMNS = (
+    File.file_url,
+    Student.avatar_path,
+    Teacher.avatar_path,
+    Employee.avatar_path,
+    User.avatar_path,
+    Setting.logo_url,
+    Setting.favicon_url,
+)
+
+
+def variant_extension(image_format: str) -> str:
+    """File extension of image variants written in ``image_format``."""
+    image_format = image_format.upper()
+    return ".jpg" if image_format == "JPEG" else f".{image_format.lower()}"
+
+
+class ContentStore:
+    """Content-addressed storage for uploads.
+
+    A blob lives at ``UPLOAD_FOLDER/cas/<h[:2]>/<h[2:4]>/<sha256><.ext>``, so
+    identical bytes are stored once no matter how often they are uploaded.
+    Blobs are reference-counted through the URL columns above: when the last
+    ``File`` row pointing at a blob is deleted and nothing else references its
+    URL, the blob is removed after the commit.
+    """
+
+    PREFIX: str = "cas"
+    HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions["content_store"] = self
+
+    @property
+    def root(self) -> str:
+        return current_app.config["UPLOAD_FOLDER"]
+
+    @property
+    def incoming(self) -> str:
+        path: str = os.path.join(self.root, ".incoming")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def _extension(filename: str) -> str:
+        suffix: str = pathlib.PurePath(filename or "").suffix.lower()
+        return suffix if re.fullmatch(r"\.[a-z0-9]{1,10}", suffix) else ""
+
+    def _relative(self, sha256: str, filename: str) -> str:
+        return "/".join(
+            [
+                self.PREFIX,
+                sha256[:2],
+                sha256[2:4],
+                f"{sha256}{self._extension(filename)}",
+            ]
+        )
+
+    def path(self, sha256: str, filename: str) -> str:
+        return os.path.join(self.root, *self._relative(sha256, filename).split("/"))
+
+    def url(self, sha256: str, filename: str) -> str:
+        return url_for("static", filename=f"uploads/{self._relative(sha256, filename)}")
+
+    def _describe(self, sha256: str, filename: str, deduplicated: bool) -> Dict:
+        return {
+            "name": filename,
+            "url": self.url(sha256, filename),
+            "sha256": sha256,
+            "size": os.path.getsize(self.path(sha256, filename)),
+            "deduplicated": deduplicated,
+        }
+
+    def find(self, sha256: str, filename: str) -> Optional[Dict]:
+        """Describe the stored blob for ``sha256`` if it is already present."""
+        sha256 = (sha256 or "").lower()
+
+        if not self.HASH_PATTERN.match(sha256):
+            return None
+
+        try:
+            # Mark the blob as freshly used so it survives the release grace.
+            os.utime(self.path(sha256, filename))
+        except FileNotFoundError:
+            return None
+
+        return self._describe(sha256, filename, True)
+
+    def commit(self, source: str, sha256: str, filename: str) -> Dict:
+        """Move the fully written ``source`` into the store (or drop it if known)."""
+        if found := self.find(sha256, filename):
+            os.remove(source)
+            return found
+
+        destination: str = self.path(sha256, filename)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        os.replace(source, destination)
+
+        return self._describe(sha256, filename, False)
+
+    def save(self, stream: IO[bytes], filename: str) -> Dict:
+        """Copy ``stream`` into the store, hashing it on the way."""
+        digest = hashlib.sha256()
+        temp: str = os.path.join(self.incoming, f"{uuid.uuid4().hex}.tmp")
+
+        try:
+            with open(temp, "wb") as fp:
+                while buffer := stream.read(BUFFER_SIZE):
+                    fp.write(buffer)
+                    digest.update(buffer)
+        except BaseException:
+            os.remove(temp)
+            raise
+
+        return self.commit(temp, digest.hexdigest(), filename)
+
+    def path_for_url(self, url: str) -> Optional[str]:
+        """Return the blob path of a store URL, or ``None`` for other URLs."""
+        marker: str = f"/uploads/{self.PREFIX}/"
+
+        if not url or marker not in url:
+            return None
+
+        relative: str = url.split(marker, 1)[1]
+
+        if not re.fullmatch(
+            r"[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.[a-z0-9]{1,10})?", relative
+        ):
+            return None
+
+        return os.path.join(self.root, self.PREFIX, *relative.split("/"))
+
+    def local_path(self, url: Optional[str]) -> Optional[str]:
+        """Path under ``UPLOAD_FOLDER`` of any upload URL, stored or legacy."""
+        marker: str = "/uploads/"
+
+        if not url or marker not in url:
+            return None
+
+        relative: str = unquote(url.split(marker, 1)[1].split("?", 1)[0])
+
+        return safe_join(self.root, relative)
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """Delete a blob together with the image variants derived from it.
+
+        Variants are named ``<sha256>.<variant><extension>`` next to their
+        blob and are shared by every extension the same bytes were stored
+        under, so they are only deleted once no such sibling is left.
+        """
+        directory, name = os.path.split(path)
+        sha256: str = name[:64]
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        extension: str = variant_extension(current_app.config["IMAGE_FORMAT"])
+        variants: Set[str] = {
+            f"{sha256}.{variant}{extension}"
+            for variant in current_app.config["IMAGE_VARIANTS"]
+        }
+
+        try:
+            siblings = [
+                entry
+                for entry in os.listdir(directory)
+                if entry.split(".", 1)[0] == sha256 and entry not in variants
+            ]
+        except FileNotFoundError:
+            return
+
+        if siblings:
+            return
+
+        for variant in variants:
+            try:
+                os.remove(os.path.join(directory, variant))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def references(url: str, session: Optional[Session] = None) -> int:
+        """Number of rows, across every URL column, that point at ``url``."""
+        session = session or db.session
+
+        return sum(
+            session.execute(
+                select(func.count()).select_from(column.class_).where(column == url)
+            ).scalar()
+            for column in URL_COLUMNS
+        )
+
+
+content_store: ContentStore = ContentStore()
+
+
+@event.listens_for(File, "after_delete")
+def _file_deleted(mapper, connection, target) -> None:
+    session: Optional[Session] = Session.object_session(target)
+
+    if session is not None and content_store.path_for_url(target.file_url):
+        session.info.setdefault("released_urls", set()).add(target.file_url)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _collect_unreferenced_blobs(session: Session, flush_context) -> None:
+    released: Set[str] = session.info.pop("released_urls", set())
+
+    for url in released:
+        if not content_store.references(url, session):
+            session.info.setdefault("unreferenced_blobs", set()).add(
+                content_store.path_for_url(url)
+            )
+
+
+@event.listens_for(Session, "after_commit")
+def _remove_unreferenced_blobs(session: Session) -> None:
+    paths: Set[str] = session.info.pop("unreferenced_blobs", set())
+
+    if not paths:
+        return
+
+    cutoff: float = time.time() - current_app.config["UPLOAD_GRACE_PERIOD"]
+
+    for path in paths:
+        try:
+            # A blob handed out again recently may be about to get linked;
+            # leave it to the orphan collector.
+            if os.path.getmtime(path) < cutoff:
+                content_store.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_unreferenced_blobs(session: Session, previous_transaction) -> None:
+    session.info.pop("released_urls", None)
+    session.info.pop("unreferenced_blobs", None)
@@ -0,0 +1,148 @@
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from flask import Response, current_app, stream_with_context
+from sqlalchemy import Select
+
+from app.extensions import db
+
+
+def iter_json_array(
+    stmt: Select, serialize: Callable[[Any], Any], batch_size: int
+) -> Iterator[str]:
+    """Yield a JSON array of ``serialize(row)`` one ``batch_size`` chunk at a time.
+
+    The statement runs with ``yield_per`` so only one batch of ORM objects (and
+    of its selectin-loaded relationships) is alive at once.
+    """
+    yield "["
+
+    separator = ""
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+
+    for partition in result.scalars().partitions():
+        yield separator + ",".join(json.dumps(serialize(obj)) for obj in partition)
+        separator = ","
+
+    yield "]"
+
+
+def stream_json(
+    stmt: Select,
+    serialize: Callable[[Any], Any],
+    batch_size: Optional[int] = None,
+) -> Response:
+    """Stream the rows of ``stmt`` as a JSON array instead of building it in memory."""
+    batch_size = batch_size or current_app.config["STREAM_BATCH_SIZE"]
+
+    return Response(
+        stream_with_context(iter_json_array(stmt, serialize, batch_size)),
+        status=200,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable write target that hands back whatever was written so far.
+
+    ``zipfile`` notices it cannot seek and writes data descriptors after each
+    member instead of patching the local headers, so the archive can be sent
+    while it is being built.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data: bytes = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def iter_zip(entries: Iterable[Tuple[str, str]], chunk_size: int) -> Iterator[bytes]:
+    """Yield a ZIP of ``(name in archive, path on disk)`` pairs as it is written.
+
+    Members are stored uncompressed (uploads are mostly already compressed) and
+    copied ``chunk_size`` bytes at a time, so memory stays constant whatever
+    the archive size.  Missing files are skipped.
+    """
+    sink: _ZipSink = _ZipSink()
+
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, path in entries:
+            try:
+                source = open(path, "rb")
+            except OSError:
+                continue
+
+            with source:
+                stat = os.fstat(source.fileno())
+                # ZIP cannot represent dates before 1980.
+                info = zipfile.ZipInfo(
+                    name, time.localtime(max(stat.st_mtime, 315532800))[:6]
+                )
+                info.file_size = stat.st_size
+
+                with archive.open(info, "w", force_zip64=True) as member:
+                    while chunk := source.read(chunk_size):
+                        member.write(chunk)
+                        yield sink.drain()
+
+            yield sink.drain()
+
+    yield sink.drain()
+
+
+_archive_slots: Optional[threading.BoundedSemaphore] = None
+_archive_slots_lock = threading.Lock()
+
+
+def stream_zip(entries: List[Tuple[str, str]], download_name: str) -> Response:
+    """Stream ``entries`` as a ZIP download.
+
+    At most ``ARCHIVE_MAX_CONCURRENT`` archives are streamed per process at a
+    time; further requests get ``503`` with ``Retry-After``.
+    """
+    global _archive_slots
+
+    with _archive_slots_lock:
+        if _archive_slots is None:
+            _archive_slots = threading.BoundedSemaphore(
+                current_app.config["ARCHIVE_MAX_CONCURRENT"]
+            )
+
+    slots: threading.BoundedSemaphore = _archive_slots
+
+    if not slots.acquire(blocking=False):
+        return Response(
+            json.dumps(
+                {"message": "Too many downloads, try again later.", "category": "error"}
+            ),
+            status=503,
+            headers={"Content-Type": "application/json", "Retry-After": "5"},
+        )
+
+    response: Response = Response(
+        stream_with_context(
+            iter_zip(entries, current_app.config["ARCHIVE_CHUNK_SIZE"])
+        ),
+        status=200,
+        mimetype="application/zip",
+    )
+    response.headers.set("Content-Disposition", "attachment", filename=download_name)
+    # Runs when the server closes the response, even if it was never iterated.
+    response.call_on_close(slots.release)
+
+    return response
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import re
+import uuid
+from typing import IO, Dict, Optional
+
+from flask import current_app
+from werkzeug.utils import secure_filename
+
+from app.services.storage import content_store
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+BUFFER_SIZE: int = 64 * 1024
+
+
+class UploadError(Exception):
+    """A chunked upload request that cannot be applied.
+
+    ``status`` is the HTTP status to answer with; ``offset`` (when set) tells
+    the client where to resume from.
+    """
+
+    def __init__(
+        self, message: str, status: int = 400, offset: Optional[int] = None
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as fp:
+        while chunk := fp.read(1024 * 1024):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ChunkedUpload:
+    """A resumable upload written straight to disk, then moved into the store.
+
+    The bytes go to ``UPLOAD_FOLDER/.incoming/<id>.part`` next to a small JSON
+    sidecar that remembers the name, declared size and expected checksum.  The
+    current offset is simply the size of the part file, so a client that lost
+    its connection asks for the status and continues from there.  Finalizing
+    checks size and SHA-256 and renames the part file into the content store
+    (same file system, so no copy).
+    """
+
+    ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+    def __init__(self, upload_id: str, state: Dict) -> None:
+        self.upload_id = upload_id
+        self.state = state
+
+    @staticmethod
+    def _state_path(upload_id: str) -> str:
+        return os.path.join(content_store.incoming, f"{upload_id}.json")
+
+    @classmethod
+    def create(
+        cls, filename: str, size: int, sha256: Optional[str] = None
+    ) -> "ChunkedUpload":
+        if not secure_filename(filename or ""):
+            raise UploadError("A file name is required.")
+        if size < 0 or size > current_app.config["UPLOAD_MAX_SIZE"]:
+            raise UploadError("File is too large.", status=413)
+        if sha256 is not None and not re.fullmatch(r"[0-9a-f]{64}", sha256):
+            raise UploadError("Invalid SHA-256 checksum.")
+
+        upload_id: str = uuid.uuid4().hex
+        state: Dict = {"name": filename, "size": size, "sha256": sha256}
+        upload: ChunkedUpload = cls(upload_id, state)
+
+        os.makedirs(os.path.dirname(cls._state_path(upload_id)), exist_ok=True)
+        open(upload.part_path, "wb").close()
+
+        with open(cls._state_path(upload_id), "w") as fp:
+            json.dump(state, fp)
+
+        return upload
+
+    @classmethod
+    def load(cls, upload_id: str) -> "ChunkedUpload":
+        if not cls.ID_PATTERN.match(upload_id):
+            raise UploadError("Upload not found.", status=404)
+
+        try:
+            with open(cls._state_path(upload_id)) as fp:
+                return cls(upload_id, json.load(fp))
+        except FileNotFoundError:
+            raise UploadError("Upload not found.", status=404) from None
+
+    @property
+    def part_path(self) -> str:
+        return os.path.join(content_store.incoming, f"{self.upload_id}.part")
+
+    @property
+    def offset(self) -> int:
+        try:
+            return os.path.getsize(self.part_path)
+        except OSError:
+            return 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "upload_id": self.upload_id,
+            "name": self.state["name"],
+            "size": self.state["size"],
+            "offset": self.offset,
+            "chunk_size": current_app.config["UPLOAD_CHUNK_SIZE"],
+        }
+
+    def append(
+        self,
+        stream: IO[bytes],
+        offset: int,
+        length: Optional[int],
+        sha256: Optional[str] = None,
+    ) -> int:
+        """Write ``length`` bytes from ``stream`` at ``offset``; returns the new offset.
+
+        The chunk is copied in small buffers, so memory stays bounded whatever
+        the chunk size.  When ``sha256`` is given and does not match, the part
+        file is truncated back to ``offset``.
+        """
+        if length is None:
+            raise UploadError("Content-Length is required.", status=411)
+        if length > current_app.config["UPLOAD_CHUNK_SIZE"]:
+            raise UploadError("Chunk is too large.", status=413)
+
+        with open(self.part_path, "r+b") as fp:
+            if fcntl is not None:
+                fcntl.flock(fp, fcntl.LOCK_EX)
+
+            current = fp.seek(0, os.SEEK_END)
+
+            if offset != current:
+                raise UploadError("Offset mismatch.", status=409, offset=current)
+            if offset + length > self.state["size"]:
+                raise UploadError(
+                    "Chunk exceeds the declared size.", status=416, offset=current
+                )
+
+            digest = hashlib.sha256()
+            remaining = length
+
+            while remaining:
+                buffer = stream.read(min(BUFFER_SIZE, remaining))
+
+                if not buffer:
+                    break
+
+                fp.write(buffer)
+                digest.update(buffer)
+                remaining -= len(buffer)
+
+            if remaining or (sha256 and digest.hexdigest() != sha256.lower()):
+                fp.truncate(offset)
+                raise UploadError(
+                    "Chunk was incomplete or corrupted.", status=422, offset=offset
+                )
+
+            return fp.tell()
+
+    def finalize(self, sha256: Optional[str] = None) -> Dict:
+        expected: Optional[str] = (sha256 or self.state.get("sha256") or "").lower()
+
+        if self.offset != self.state["size"]:
+            raise UploadError("Upload is incomplete.", status=409, offset=self.offset)
+
+        actual: str = file_sha256(self.part_path)
+
+        if expected and actual != expected:
+            self.abort()
+            raise UploadError("Checksum mismatch; upload discarded.", status=422)
+
+        file: Dict = content_store.commit(self.part_path, actual, self.state["name"])
+        os.remove(self._state_path(self.upload_id))
+
+        return file
+
+    def abort(self) -> None:
+        for path in (self.part_path, self._state_path(self.upload_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,179 @@
+import atexit
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from flask import Flask
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import console, db
+from app.models.base import make_uid
+from app.models.rollup import bump_rollup, rollup_day
+from app.models.view import View
+
+
+class ViewRecorder:
+    """Buffer page views in memory and write them to ``views`` in batches.
+
+    Requests only enqueue a small dict; a daemon thread drains the queue and
+    bulk-inserts up to ``VIEW_BATCH_SIZE`` rows per transaction, at least every
+    ``VIEW_FLUSH_INTERVAL`` seconds, and bumps the ``views`` daily rollups in
+    the same transaction.  When the queue fills up the configured
+    ``VIEW_OVERLOAD_POLICY`` decides what happens to new views:
+
+    * ``drop``   - keep recording until the queue is full, then drop.
+    * ``sample`` - once the queue is half full, keep only ``VIEW_SAMPLE_RATE``
+      of the incoming views (and drop when full).
+    """
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        self.app: Optional[Flask] = None
+        self.queue: queue.Queue = queue.Queue()
+        self.dropped: int = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._flush_at_exit: bool = False
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.app = app
+        self.enabled: bool = app.config["VIEW_RECORDER_ENABLED"]
+        self.batch_size: int = app.config["VIEW_BATCH_SIZE"]
+        self.flush_interval: float = app.config["VIEW_FLUSH_INTERVAL"]
+        self.policy: str = app.config["VIEW_OVERLOAD_POLICY"]
+        self.sample_rate: float = app.config["VIEW_SAMPLE_RATE"]
+        self.queue = queue.Queue(maxsize=app.config["VIEW_QUEUE_SIZE"])
+
+        app.extensions["view_recorder"] = self
+
+        # ``create_app`` may run many times per process (tests, CLI); one
+        # exit hook is enough since it flushes whatever app is current.
+        if not self._flush_at_exit:
+            atexit.register(self.flush)
+            self._flush_at_exit = True
+
+    def record(
+        self, path: str, ip_address: Optional[str], user_agent: Optional[str]
+    ) -> bool:
+        """Queue a view; returns ``False`` when it was dropped."""
+        if not self.enabled:
+            return False
+
+        if (
+            self.policy == "sample"
+            and self.queue.qsize() >= self.queue.maxsize // 2
+            and random.random() >= self.sample_rate
+        ):
+            self._drop(1)
+            return False
+
+        now = datetime.now(timezone.utc)
+
+        try:
+            self.queue.put_nowait(
+                {
+                    "uid": make_uid(View),
+                    "path": path[:255],
+                    "ip_address": (ip_address or "")[:50] or None,
+                    "user_agent": (user_agent or "")[:255] or None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        except queue.Full:
+            self._drop(1)
+            return False
+
+        self._ensure_started()
+
+        return True
+
+    def flush(self) -> int:
+        """Synchronously write everything that is currently queued."""
+        written: int = 0
+
+        while batch := self._drain(timeout=0):
+            self._write(batch)
+            written += len(batch)
+
+        return written
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            # Also restarts the flusher in a freshly forked worker process.
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="view-recorder", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            if batch := self._drain(timeout=self.flush_interval):
+                self._write(batch)
+
+    def _drain(self, timeout: float) -> List[Dict]:
+        batch: List[Dict] = []
+        deadline: float = time.monotonic() + timeout
+
+        while len(batch) < self.batch_size:
+            try:
+                if timeout:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        break
+
+                    batch.append(self.queue.get(timeout=remaining))
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _write(self, batch: List[Dict]) -> None:
+        if self.app is None:
+            return
+
+        days: Counter = Counter(rollup_day(view["created_at"]) for view in batch)
+
+        with self.app.app_context():
+            for _ in range(3):
+                try:
+                    db.session.execute(insert(View), batch)
+
+                    connection = db.session.connection()
+                    for day, count in days.items():
+                        bump_rollup(connection, View.__tablename__, day, count)
+
+                    db.session.commit()
+                    return
+                except IntegrityError:
+                    # Random uids can collide; draw new ones and try again.
+                    db.session.rollback()
+                    for view in batch:
+                        view["uid"] = make_uid(View)
+                except Exception as err:
+                    db.session.rollback()
+                    console.print(err)
+                    break
+
+        self._drop(len(batch))
+
+    def _drop(self, count: int) -> None:
+        with self._lock:
+            self.dropped += count
+
+
+view_recorder: ViewRecorder = ViewRecorder()
@@ -1,3 +1,169 @@
+// Files above this size go through the resumable /api/upload/chunked protocol.
+const CHUNKED_UPLOAD_THRESHOLD = 8 * 1024 * 1024;
+const CHUNK_RETRIES = 5;
+
+// Milliseconds of typing pause before an ID field asks for suggestions.
+const AUTOCOMPLETE_DELAY = 200;
+
+async function sha256Hex(blob) {
+  if (!window.crypto?.subtle) return null;
+
+  const digest = await crypto.subtle.digest(
+    "SHA-256",
+    await blob.arrayBuffer(),
+  );
+
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+function putChunk(url, chunk, checksum, onProgress, controller) {
+  return new Promise((resolve, reject) => {
+    let http = new XMLHttpRequest();
+
+    controller.http = http;
+
+    http.upload.addEventListener("progress", onProgress);
+    http.addEventListener("load", () => resolve(http));
+    http.addEventListener("error", () => reject(new Error("network")));
+    http.addEventListener("abort", () => reject(new Error("abort")));
+
+    http.open("PUT", url, true);
+    if (checksum) http.setRequestHeader("X-Chunk-SHA256", checksum);
+    http.send(chunk);
+  });
+}
+
+function uploadFileChunked(
+  file,
+  on_progress,
+  on_abort,
+  on_upload_load,
+  on_load,
+  on_loadstart,
+  on_loadend,
+) {
+  // Mimics the XMLHttpRequest used for small files: callers get abort() and
+  // the same progress/load callbacks.
+  const controller = {
+    aborted: false,
+    http: null,
+    abort() {
+      this.aborted = true;
+      this.http?.abort();
+    },
+  };
+  const key = ["upload", file.name, file.size, file.lastModified].join(":");
+
+  const call = (fn, event) => {
+    if (typeof fn == "function") fn(event);
+  };
+
+  (async () => {
+    call(on_loadstart, {});
+
+    try {
+      let status;
+      let uploadID = localStorage.getItem(key);
+
+      // Resume an upload interrupted by a reload, if the server still has it.
+      if (uploadID) {
+        let response = await fetch("/api/upload/chunked/".concat(uploadID));
+
+        if (response.ok) status = await response.json();
+      }
+
+      if (!status) {
+        let response = await fetch("/api/upload/chunked", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ name: file.name, size: file.size }),
+        });
+
+        status = await response.json();
+
+        if (!response.ok) throw new Error(status?.message);
+
+        // The server already had these bytes.
+        if (status.complete) {
+          call(on_upload_load, {});
+          call(on_load, {
+            target: { response: JSON.stringify([{ file: status.file }]) },
+          });
+          return;
+        }
+
+        localStorage.setItem(key, status.upload_id);
+      }
+
+      const url = "/api/upload/chunked/".concat(status.upload_id);
+      let offset = status.offset;
+      let retries = 0;
+
+      while (offset < file.size) {
+        if (controller.aborted) throw new Error("abort");
+
+        const chunk = file.slice(offset, offset + status.chunk_size);
+
+        try {
+          let http = await putChunk(
+            url.concat("?offset=", offset),
+            chunk,
+            await sha256Hex(chunk),
+            (e) =>
+              call(on_progress, {
+                loaded: offset + e.loaded,
+                total: file.size,
+              }),
+            controller,
+          );
+          let data = JSON.parse(http.response);
+
+          if (http.status != 200 && data?.offset === undefined) {
+            throw new Error(data?.message);
+          }
+
+          offset = data.offset;
+          retries = 0;
+        } catch (err) {
+          if (controller.aborted || ++retries > CHUNK_RETRIES) throw err;
+
+          // Connection dropped: wait, then ask the server where to resume.
+          await new Promise((r) => setTimeout(r, 1000 * 2 ** retries));
+
+          let response = await fetch(url);
+          if (response.ok) offset = (await response.json()).offset;
+        }
+      }
+
+      call(on_upload_load, {});
+
+      let response = await fetch(url.concat("/finalize"), { method: "POST" });
+
+      localStorage.removeItem(key);
+      call(on_load, { target: { response: await response.text() } });
+    } catch (err) {
+      if (controller.aborted) {
+        let uploadID = localStorage.getItem(key);
+
+        localStorage.removeItem(key);
+        if (uploadID) {
+          fetch("/api/upload/chunked/".concat(uploadID), { method: "DELETE" });
+        }
+
+        call(on_abort, {});
+      } else {
+        console.log(err);
+      }
+    } finally {
+      call(on_loadend, {});
+    }
+  })();
+
+  return controller;
+}
+
 export function uploadFile(
   file,
   on_progress,
@@ -7,23 +173,71 @@ export function uploadFile(
   on_loadstart,
   on_loadend,
 ) {
-  let http = new XMLHttpRequest();
-  let data = new FormData();
+  if (file.size > CHUNKED_UPLOAD_THRESHOLD) {
+    return uploadFileChunked(
+      file,
+      on_progress,
+      on_abort,
+      on_upload_load,
+      on_load,
+      on_loadstart,
+      on_loadend,
+    );
+  }
+
+  const controller = {
+    aborted: false,
+    http: null,
+    abort() {
+      this.aborted = true;
+      this.http?.abort();
+    },
+  };
+
+  (async () => {
+    // Uploads are stored by content hash: skip sending bytes the server has.
+    const checksum = await sha256Hex(file).catch(() => null);
+
+    if (checksum && !controller.aborted) {
+      let response = await fetch("/api/upload/check", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ name: file.name, sha256: checksum }),
+      }).catch(() => null);
+
+      if (response?.ok) {
+        let text = await response.text();
+
+        on_loadstart({});
+        on_upload_load({});
+        on_load({ target: { response: text } });
+        on_loadend({});
+        return;
+      }
+    }
 
-  data.append("file", file);
+    if (controller.aborted) return on_abort({});
 
-  http.upload.addEventListener("progress", on_progress);
-  http.upload.addEventListener("abort", on_abort);
-  http.upload.addEventListener("load", on_upload_load);
-  http.upload.addEventListener("loadstart", on_loadstart);
-  http.upload.addEventListener("loadend", on_loadend);
+    let http = new XMLHttpRequest();
+    let data = new FormData();
 
-  http.addEventListener("load", on_load);
+    data.append("file", file);
 
-  http.open("POST", "/api/upload", true);
-  http.send(data);
+    http.upload.addEventListener("progress", on_progress);
+    http.upload.addEventListener("abort", on_abort);
+    http.upload.addEventListener("load", on_upload_load);
+    http.upload.addEventListener("loadstart", on_loadstart);
+    http.upload.addEventListener("loadend", on_loadend);
 
-  return http;
+    http.addEventListener("load", on_load);
+
+    controller.http = http;
+
+    http.open("POST", "/api/upload", true);
+    http.send(data);
+  })();
+
+  return controller;
 }
 
 export function resetForm(formElement) {}
@@ -403,6 +617,50 @@ export function upload(files, dropZone) {
   }
 }
 
+function autocomplete(inputElement) {
+  // Inputs with data-autocomplete get a <datalist> of "id" options labelled
+  // with the matching name, refreshed once typing pauses.
+  if (!inputElement.list) {
+    let datalistElement = document.createElement("datalist");
+
+    datalistElement.id = "autocomplete-".concat(
+      Math.random().toString(36).slice(2),
+    );
+    inputElement.after(datalistElement);
+    inputElement.setAttribute("list", datalistElement.id);
+  }
+
+  clearTimeout(inputElement.autocompleteTimer);
+
+  inputElement.autocompleteTimer = setTimeout(async () => {
+    const q = inputElement.value.trim();
+    if (!q) return;
+
+    const URL = new window.URL(
+      inputElement.dataset.autocomplete,
+      window.location.origin,
+    );
+    URL.searchParams.set("q", q);
+
+    let response = await fetch(URL);
+    if (!response.ok || inputElement.value.trim() != q) return;
+
+    let suggestions = await response.json();
+
+    inputElement.list.replaceChildren(
+      ...suggestions.map(({ id, label }) => {
+        let optionElement = document.createElement("option");
+
+        optionElement.value = id;
+        optionElement.label = label;
+        optionElement.textContent = label;
+
+        return optionElement;
+      }),
+    );
+  }, AUTOCOMPLETE_DELAY);
+}
+
 (function () {
   document.addEventListener("dragover", (event) => {
     const dropZoneElement = event.target.closest("div.drop-zone");
@@ -494,6 +752,10 @@ export function upload(files, dropZone) {
     }
   });
 
+  document.addEventListener("input", (event) => {
+    if (event.target.dataset?.autocomplete) autocomplete(event.target);
+  });
+
   document.addEventListener("change", (event) => {
     if (event.target.type == "file") {
       const dropZone = event.target.closest("div.drop-zone");
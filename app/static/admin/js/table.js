@@ -1,5 +1,30 @@
-async function fetchTableData(tableElement) {
-  let URL = tableElement.dataset.getRows;
+function tableState(tableElement) {
+  if (!tableElement.tableState) {
+    tableElement.tableState = {
+      sort: null,
+      order: "asc",
+      q: "",
+      cursor: null,
+      hasMore: false,
+      loading: false,
+      sortable: [],
+    };
+  }
+
+  return tableElement.tableState;
+}
+
+async function fetchTableData(tableElement, cursor = null) {
+  const state = tableState(tableElement);
+  const URL = new window.URL(
+    tableElement.dataset.getRows,
+    window.location.href,
+  );
+
+  if (state.sort) URL.searchParams.set("sort", state.sort);
+  if (state.order) URL.searchParams.set("order", state.order);
+  if (state.q) URL.searchParams.set("q", state.q);
+  if (cursor) URL.searchParams.set("cursor", cursor);
 
   let response = await fetch(URL);
 
@@ -11,21 +36,97 @@ async function fetchTableData(tableElement) {
 }
 
 async function initTable(tableElement, theadElement, tbodyElement) {
+  const state = tableState(tableElement);
+
+  state.cursor = null;
+  state.loading = true;
+
   let data = await fetchTableData(tableElement);
 
+  state.loading = false;
+
   if (data) {
     let cols = data?.cols;
     let rows = data?.rows;
 
+    state.sort = data?.sort ?? state.sort;
+    state.order = data?.order ?? state.order;
+    state.sortable = data?.sortable ?? [];
+    state.cursor = data?.next_cursor ?? null;
+    state.hasMore = Boolean(data?.has_more);
+
     if (cols) {
       theadElement.innerHTML = "";
-      initTableHeader(theadElement, cols);
+      initTableHeader(theadElement, cols, tableElement);
     }
 
     if (rows) {
       tbodyElement.innerHTML = "";
       addTableRows(tableElement, tbodyElement, rows);
     }
+
+    updateLoadMore(tableElement);
+  }
+}
+
+async function loadMoreRows(tableElement) {
+  const state = tableState(tableElement);
+
+  if (state.loading || !state.hasMore || !state.cursor) return;
+
+  state.loading = true;
+
+  let data = await fetchTableData(tableElement, state.cursor);
+
+  state.loading = false;
+
+  if (data) {
+    state.cursor = data?.next_cursor ?? null;
+    state.hasMore = Boolean(data?.has_more);
+
+    addTableRows(
+      tableElement,
+      tableElement.querySelector("tbody"),
+      data?.rows ?? [],
+      true,
+    );
+  }
+
+  updateLoadMore(tableElement);
+}
+
+function initLoadMore(tableElement) {
+  let divElement = document.createElement("div");
+  let buttonElement = document.createElement("button");
+
+  divElement.classList.value = "table-more text-center py-3 d-none";
+
+  buttonElement.type = "button";
+  buttonElement.classList.value = "btn btn-sm btn-outline-secondary m-0";
+  buttonElement.innerHTML = "Load more";
+
+  buttonElement.addEventListener("click", () => loadMoreRows(tableElement));
+
+  divElement.append(buttonElement);
+  tableElement.after(divElement);
+
+  // Infinite scroll: fetch the next page once the button scrolls into view.
+  if ("IntersectionObserver" in window) {
+    new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        loadMoreRows(tableElement);
+      }
+    }).observe(divElement);
+  }
+
+  tableElement.loadMoreElement = divElement;
+}
+
+function updateLoadMore(tableElement) {
+  const divElement = tableElement.loadMoreElement;
+
+  if (divElement) {
+    divElement.classList.toggle("d-none", !tableState(tableElement).hasMore);
   }
 }
 
@@ -307,11 +408,11 @@ function reloadRow(tableElement, theadElement, rowElement) {
     });
 }
 
-function addTableRows(tableElement, tbodyElement, rows) {
+function addTableRows(tableElement, tbodyElement, rows, append = false) {
   let trElement;
   let tdElement;
 
-  tbodyElement.innerHTML = "";
+  if (!append) tbodyElement.innerHTML = "";
 
   if (rows.length > 0) {
     Array.from(rows).forEach((row) => {
@@ -339,12 +440,13 @@ function addTableRows(tableElement, tbodyElement, rows) {
 
       tbodyElement.append(trElement);
     });
-  } else {
+  } else if (!append) {
     addNoRowLabel(tableElement.querySelector("thead"), tbodyElement);
   }
 }
 
-function initTableHeader(theadElement, cols) {
+function initTableHeader(theadElement, cols, tableElement) {
+  const state = tableElement ? tableState(tableElement) : null;
   let trElement = document.createElement("tr");
   let thElement;
 
@@ -365,6 +467,27 @@ function initTableHeader(theadElement, cols) {
 
     thElement.innerHTML = name;
 
+    if (state?.sortable.includes(id)) {
+      thElement.role = "button";
+      thElement.dataset.sort = id;
+
+      if (state.sort == id) {
+        thElement.innerHTML += state.order == "desc" ? " &darr;" : " &uarr;";
+      }
+
+      thElement.addEventListener("click", () => {
+        state.order =
+          state.sort == id && state.order == "asc" ? "desc" : "asc";
+        state.sort = id;
+
+        initTable(
+          tableElement,
+          theadElement,
+          tableElement.querySelector("tbody"),
+        );
+      });
+    }
+
     trElement.append(thElement);
   });
 
@@ -480,14 +603,12 @@ function initTableContol(
   searchInputElement.addEventListener("input", (event) => {
     clearTimeout(timer);
 
-    const searchTerm = event.target.value.toLowerCase();
+    const searchTerm = event.target.value.trim();
 
     timer = setTimeout(() => {
-      Array.from(tbodyElement.querySelectorAll("tr")).forEach((row) => {
-        const text = row.textContent.toLowerCase();
+      tableState(tableElement).q = searchTerm;
 
-        row.style.display = text.includes(searchTerm) ? "" : "none";
-      });
+      initTable(tableElement, theadElement, tbodyElement);
     }, 500);
   });
 
@@ -526,6 +647,7 @@ function initTableContol(
         tbodyElement,
         theadElement,
       );
+      initLoadMore(tableElement);
       initTable(tableElement, theadElement, tbodyElement);
     });
 
@@ -45,6 +45,21 @@ target_db = current_app.extensions['migrate'].db
 # ... etc.
 
 
+# FTS5 tables (and their _data/_idx/_content/_docsize/_config shadow tables)
+# are created with raw SQL, not in the metadata; keep autogenerate from
+# emitting drop_table for them.
+FTS_TABLES = ('search_index', 'people_index')
+
+
+def include_name(name, type_, parent_names):
+    if type_ == 'table':
+        return not any(
+            name == table or name.startswith(f'{table}_')
+            for table in FTS_TABLES
+        )
+    return True
+
+
 def get_metadata():
     if hasattr(target_db, 'metadatas'):
         return target_db.metadatas[None]
@@ -65,7 +80,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_name=include_name
     )
 
     with context.begin_transaction():
@@ -93,6 +109,7 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_name", include_name)
 
     connectable = get_engine()
 
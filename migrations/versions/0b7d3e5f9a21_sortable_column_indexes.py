@@ -0,0 +1,128 @@
+"""sortable column indexes
+
+Revision ID: 0b7d3e5f9a21
+Revises: f7b2d9e4a1c6
+Create Date: 2026-10-19 09:41:27.508113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b7d3e5f9a21'
+down_revision = 'f7b2d9e4a1c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_courses_active_enrollments_count'), ['active_enrollments_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_closed_enrollments_count'), ['closed_enrollments_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_course_title'), ['course_title'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_end_date'), ['end_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_end_time'), ['end_time'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_monthly_fee'), ['monthly_fee'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_start_date'), ['start_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_courses_start_time'), ['start_time'], unique=False)
+
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_employees_first_name'), ['first_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_employees_hire_date'), ['hire_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_employees_last_name'), ['last_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_employees_middle_name'), ['middle_name'], unique=False)
+
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_enrollments_discount_rate'), ['discount_rate'], unique=False)
+        batch_op.create_index(batch_op.f('ix_enrollments_enrollment_date'), ['enrollment_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_enrollments_status'), ['status'], unique=False)
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_jobs_employee_count'), ['employee_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_jobs_job_title'), ['job_title'], unique=False)
+        batch_op.create_index(batch_op.f('ix_jobs_max_salary'), ['max_salary'], unique=False)
+        batch_op.create_index(batch_op.f('ix_jobs_min_salary'), ['min_salary'], unique=False)
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payments_amount'), ['amount'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_enrollment_id'), ['enrollment_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_month_for'), ['month_for'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_payment_date'), ['payment_date'], unique=False)
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_students_active_enrollments_count'), ['active_enrollments_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_students_birthday'), ['birthday'], unique=False)
+        batch_op.create_index(batch_op.f('ix_students_closed_enrollments_count'), ['closed_enrollments_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_students_first_name'), ['first_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_students_last_name'), ['last_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_students_middle_name'), ['middle_name'], unique=False)
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_teachers_birthday'), ['birthday'], unique=False)
+        batch_op.create_index(batch_op.f('ix_teachers_first_name'), ['first_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_teachers_last_name'), ['last_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_teachers_middle_name'), ['middle_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_teachers_total_students_count'), ['total_students_count'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_birthday'), ['birthday'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_first_name'), ['first_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_last_name'), ['last_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_middle_name'), ['middle_name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_middle_name'))
+        batch_op.drop_index(batch_op.f('ix_users_last_name'))
+        batch_op.drop_index(batch_op.f('ix_users_first_name'))
+        batch_op.drop_index(batch_op.f('ix_users_birthday'))
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_teachers_total_students_count'))
+        batch_op.drop_index(batch_op.f('ix_teachers_middle_name'))
+        batch_op.drop_index(batch_op.f('ix_teachers_last_name'))
+        batch_op.drop_index(batch_op.f('ix_teachers_first_name'))
+        batch_op.drop_index(batch_op.f('ix_teachers_birthday'))
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_students_middle_name'))
+        batch_op.drop_index(batch_op.f('ix_students_last_name'))
+        batch_op.drop_index(batch_op.f('ix_students_first_name'))
+        batch_op.drop_index(batch_op.f('ix_students_closed_enrollments_count'))
+        batch_op.drop_index(batch_op.f('ix_students_birthday'))
+        batch_op.drop_index(batch_op.f('ix_students_active_enrollments_count'))
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payments_payment_date'))
+        batch_op.drop_index(batch_op.f('ix_payments_month_for'))
+        batch_op.drop_index(batch_op.f('ix_payments_enrollment_id'))
+        batch_op.drop_index(batch_op.f('ix_payments_amount'))
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_jobs_min_salary'))
+        batch_op.drop_index(batch_op.f('ix_jobs_max_salary'))
+        batch_op.drop_index(batch_op.f('ix_jobs_job_title'))
+        batch_op.drop_index(batch_op.f('ix_jobs_employee_count'))
+
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_enrollments_status'))
+        batch_op.drop_index(batch_op.f('ix_enrollments_enrollment_date'))
+        batch_op.drop_index(batch_op.f('ix_enrollments_discount_rate'))
+
+    with op.batch_alter_table('employees', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_employees_middle_name'))
+        batch_op.drop_index(batch_op.f('ix_employees_last_name'))
+        batch_op.drop_index(batch_op.f('ix_employees_hire_date'))
+        batch_op.drop_index(batch_op.f('ix_employees_first_name'))
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_courses_start_time'))
+        batch_op.drop_index(batch_op.f('ix_courses_start_date'))
+        batch_op.drop_index(batch_op.f('ix_courses_monthly_fee'))
+        batch_op.drop_index(batch_op.f('ix_courses_end_time'))
+        batch_op.drop_index(batch_op.f('ix_courses_end_date'))
+        batch_op.drop_index(batch_op.f('ix_courses_course_title'))
+        batch_op.drop_index(batch_op.f('ix_courses_closed_enrollments_count'))
+        batch_op.drop_index(batch_op.f('ix_courses_active_enrollments_count'))
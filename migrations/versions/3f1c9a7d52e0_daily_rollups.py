@@ -0,0 +1,47 @@
+"""daily rollups
+
+Revision ID: 3f1c9a7d52e0
+Revises: 0a246eb9df9f
+Create Date: 2026-10-18 13:05:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d52e0'
+down_revision = '0a246eb9df9f'
+branch_labels = None
+depends_on = None
+
+
+ROLLED_UP = ['courses', 'employees', 'enrollments', 'students', 'teachers', 'views']
+
+
+def upgrade():
+    op.create_table('daily_rollups',
+    sa.Column('model', sa.String(length=50), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('model', 'day')
+    )
+
+    # Backfill from existing rows (same as `flask rollups rebuild`)
+    for table in ROLLED_UP:
+        op.execute(
+            f"INSERT INTO daily_rollups (model, day, count, amount) "
+            f"SELECT '{table}', date(created_at), count(*), 0 FROM {table} "
+            f"GROUP BY date(created_at)"
+        )
+
+    op.execute(
+        "INSERT INTO daily_rollups (model, day, count, amount) "
+        "SELECT 'payments', date(created_at), count(*), coalesce(sum(amount), 0) "
+        "FROM payments GROUP BY date(created_at)"
+    )
+
+
+def downgrade():
+    op.drop_table('daily_rollups')
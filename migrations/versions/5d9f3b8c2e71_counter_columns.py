@@ -0,0 +1,68 @@
+"""counter columns
+
+Revision ID: 5d9f3b8c2e71
+Revises: c41e7a2b9d05
+Create Date: 2026-10-18 19:12:47.604213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d9f3b8c2e71'
+down_revision = 'c41e7a2b9d05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('active_enrollments_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('closed_enrollments_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('active_enrollments_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('closed_enrollments_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_students_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('employee_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill; afterwards `flask counters repair` does the same.
+    for table, key in (('students', 'student_id'), ('courses', 'course_id')):
+        op.execute(
+            f"UPDATE {table} SET "
+            f"active_enrollments_count = (SELECT count(*) FROM enrollments "
+            f"WHERE enrollments.{key} = {table}.{key} AND enrollments.status = 'ACTIVE'), "
+            f"closed_enrollments_count = (SELECT count(*) FROM enrollments "
+            f"WHERE enrollments.{key} = {table}.{key} AND enrollments.status = 'CLOSED')"
+        )
+
+    op.execute(
+        "UPDATE teachers SET total_students_count = (SELECT count(*) FROM enrollments "
+        "JOIN courses ON courses.course_id = enrollments.course_id "
+        "WHERE courses.teacher_id = teachers.teacher_id)"
+    )
+    op.execute(
+        "UPDATE jobs SET employee_count = (SELECT count(*) FROM employees "
+        "WHERE employees.job_id = jobs.job_id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_column('employee_count')
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_column('total_students_count')
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_column('closed_enrollments_count')
+        batch_op.drop_column('active_enrollments_count')
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.drop_column('closed_enrollments_count')
+        batch_op.drop_column('active_enrollments_count')
@@ -0,0 +1,26 @@
+"""payments enrollment month index
+
+Revision ID: 7e2a9c4f6b18
+Revises: 5d9f3b8c2e71
+Create Date: 2026-10-18 20:03:11.284519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e2a9c4f6b18'
+down_revision = '5d9f3b8c2e71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index('ix_payments_enrollment_month', ['enrollment_id', 'month_for'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('ix_payments_enrollment_month')
@@ -0,0 +1,38 @@
+"""file metadata
+
+Revision ID: 8b2d4e6f1a93
+Revises: 3f1c9a7d52e0
+Create Date: 2026-10-18 15:42:10.503117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2d4e6f1a93'
+down_revision = '3f1c9a7d52e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('files', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('file_size', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('file_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('mime_type', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('file_exists', sa.Boolean(), server_default=sa.true(), nullable=False))
+        batch_op.add_column(sa.Column('verified_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_files_file_hash'), ['file_hash'], unique=False)
+
+    # Existing rows are filled in by `flask files verify`.
+
+
+def downgrade():
+    with op.batch_alter_table('files', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_files_file_hash'))
+        batch_op.drop_column('verified_at')
+        batch_op.drop_column('file_exists')
+        batch_op.drop_column('mime_type')
+        batch_op.drop_column('file_hash')
+        batch_op.drop_column('file_size')
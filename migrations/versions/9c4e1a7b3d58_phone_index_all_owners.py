@@ -0,0 +1,45 @@
+"""phone index keeps every owner
+
+Revision ID: 9c4e1a7b3d58
+Revises: 0b7d3e5f9a21
+Create Date: 2026-10-18 14:02:31.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1a7b3d58'
+down_revision = '0b7d3e5f9a21'
+branch_labels = None
+depends_on = None
+
+
+def _create(*primary_key):
+    op.create_table('phone_index',
+    sa.Column('number', sa.String(length=16), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint(*primary_key)
+    )
+    with op.batch_alter_table('phone_index', schema=None) as batch_op:
+        batch_op.create_index('ix_phone_index_person', ['kind', 'person_id'], unique=False)
+
+
+def _drop():
+    with op.batch_alter_table('phone_index', schema=None) as batch_op:
+        batch_op.drop_index('ix_phone_index_person')
+
+    op.drop_table('phone_index')
+
+
+# The index is derived data: run `flask phones index` after either direction.
+def upgrade():
+    _drop()
+    _create('number', 'kind', 'person_id')
+
+
+def downgrade():
+    _drop()
+    _create('number')
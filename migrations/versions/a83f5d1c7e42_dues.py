@@ -0,0 +1,31 @@
+"""dues
+
+Revision ID: a83f5d1c7e42
+Revises: 7e2a9c4f6b18
+Create Date: 2026-10-18 20:41:36.902117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a83f5d1c7e42'
+down_revision = '7e2a9c4f6b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('dues',
+    sa.Column('enrollment_id', sa.Integer(), nullable=False),
+    sa.Column('month_for', sa.String(length=20), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['enrollment_id'], ['enrollments.enrollment_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('enrollment_id', 'month_for')
+    )
+
+
+def downgrade():
+    op.drop_table('dues')
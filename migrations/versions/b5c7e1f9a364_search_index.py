@@ -0,0 +1,47 @@
+"""search index
+
+Revision ID: b5c7e1f9a364
+Revises: a83f5d1c7e42
+Create Date: 2026-10-18 21:17:52.430871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5c7e1f9a364'
+down_revision = 'a83f5d1c7e42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+    # Backfill (same as `flask search rebuild`): rowid = id * 8 + kind
+    op.execute(
+        "INSERT INTO search_index (rowid, title, body) "
+        "SELECT courses.course_id * 8 + 1, courses.course_title, "
+        "coalesce(courses.course_description, '') || ' ' || teachers.first_name || ' ' "
+        "|| coalesce(teachers.middle_name || ' ', '') || teachers.last_name "
+        "FROM courses JOIN teachers ON teachers.teacher_id = courses.teacher_id"
+    )
+    op.execute(
+        "INSERT INTO search_index (rowid, title, body) "
+        "SELECT teachers.teacher_id * 8 + 2, teachers.first_name || ' ' "
+        "|| coalesce(teachers.middle_name || ' ', '') || teachers.last_name, "
+        "coalesce((SELECT group_concat(courses.course_title, ' ') FROM courses "
+        "WHERE courses.teacher_id = teachers.teacher_id), '') FROM teachers"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,26 @@
+"""file url index
+
+Revision ID: c41e7a2b9d05
+Revises: 8b2d4e6f1a93
+Create Date: 2026-10-18 17:05:31.228419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7a2b9d05'
+down_revision = '8b2d4e6f1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('files', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_files_file_url'), ['file_url'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('files', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_files_file_url'))
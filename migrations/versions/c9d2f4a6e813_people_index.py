@@ -0,0 +1,53 @@
+"""people index
+
+Revision ID: c9d2f4a6e813
+Revises: b5c7e1f9a364
+Create Date: 2026-10-18 21:58:20.117364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9d2f4a6e813'
+down_revision = 'b5c7e1f9a364'
+branch_labels = None
+depends_on = None
+
+
+# table, primary key, phone table, rowid code
+PEOPLE = [
+    ('students', 'student_id', 'student_phones', 1),
+    ('teachers', 'teacher_id', 'teacher_phones', 2),
+    ('employees', 'employee_id', 'employee_phones', 3),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS people_index USING fts5("
+        "name, email, phones, tokenize = 'trigram')"
+    )
+
+    # Backfill (same as `flask search rebuild`)
+    digits = "phone_number"
+    for char in " -()+":
+        digits = f"replace({digits}, '{char}', '')"
+
+    for table, key, phones, code in PEOPLE:
+        op.execute(
+            f"INSERT INTO people_index (rowid, name, email, phones) "
+            f"SELECT {key} * 8 + {code}, first_name || ' ' "
+            f"|| coalesce(middle_name || ' ', '') || last_name, coalesce(email, ''), "
+            f"coalesce((SELECT group_concat({digits}, ' ') FROM {phones} "
+            f"WHERE {phones}.{key} = {table}.{key}), '') FROM {table}"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS people_index")
@@ -0,0 +1,34 @@
+"""autocomplete indexes
+
+Revision ID: d1e8b3a7c520
+Revises: c9d2f4a6e813
+Create Date: 2026-10-18 22:34:09.651820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1e8b3a7c520'
+down_revision = 'c9d2f4a6e813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.create_index('ix_students_first_name_lower', [sa.text('lower(first_name)'), 'first_name', 'middle_name', 'last_name'], unique=False)
+        batch_op.create_index('ix_students_last_name_lower', [sa.text('lower(last_name)'), 'first_name', 'middle_name', 'last_name'], unique=False)
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.create_index('ix_courses_title_lower', [sa.text('lower(course_title)'), 'course_title'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_index('ix_courses_title_lower')
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.drop_index('ix_students_last_name_lower')
+        batch_op.drop_index('ix_students_first_name_lower')
@@ -0,0 +1,36 @@
+"""person blocks
+
+Revision ID: e4a6c8f0b297
+Revises: d1e8b3a7c520
+Create Date: 2026-10-18 23:12:44.590236
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a6c8f0b297'
+down_revision = 'd1e8b3a7c520'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('person_blocks',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('key', 'kind', 'person_id')
+    )
+    with op.batch_alter_table('person_blocks', schema=None) as batch_op:
+        batch_op.create_index('ix_person_blocks_person', ['kind', 'person_id'], unique=False)
+
+    # The keys are computed in Python: run `flask people blocks` afterwards.
+
+
+def downgrade():
+    with op.batch_alter_table('person_blocks', schema=None) as batch_op:
+        batch_op.drop_index('ix_person_blocks_person')
+
+    op.drop_table('person_blocks')
@@ -0,0 +1,36 @@
+"""phone index
+
+Revision ID: f7b2d9e4a1c6
+Revises: e4a6c8f0b297
+Create Date: 2026-10-18 23:58:07.318402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7b2d9e4a1c6'
+down_revision = 'e4a6c8f0b297'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('phone_index',
+    sa.Column('number', sa.String(length=16), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('number')
+    )
+    with op.batch_alter_table('phone_index', schema=None) as batch_op:
+        batch_op.create_index('ix_phone_index_person', ['kind', 'person_id'], unique=False)
+
+    # Numbers are normalized in Python: run `flask phones index` afterwards.
+
+
+def downgrade():
+    with op.batch_alter_table('phone_index', schema=None) as batch_op:
+        batch_op.drop_index('ix_phone_index_person')
+
+    op.drop_table('phone_index')
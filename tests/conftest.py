@@ -1,10 +1,17 @@
 import os
 import tempfile
+from contextlib import contextmanager
+from typing import Iterator, List
 
 import pytest
+from sqlalchemy import event
 
 from app import create_app
+from app.config import Config
 from app.extensions import db
+from app.models.setting import Setting
+from app.models.user import Role, User
+from app.services.views import view_recorder
 
 
 @pytest.fixture()
@@ -13,7 +20,12 @@ def app():
     db_fd, db_path = tempfile.mkstemp()
     os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
 
-    app = create_app()
+    class TestConfig(Config):
+        TESTING = True
+        WTF_CSRF_ENABLED = False
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+
+    app = create_app(TestConfig)
     with app.app_context():
         db.create_all()
     yield app
@@ -25,3 +37,48 @@ def app():
 @pytest.fixture()
 def client(app):
     return app.test_client()
+
+
+@pytest.fixture()
+def admin(app, client, monkeypatch):
+    """A test client logged in as an admin of a set-up site."""
+    monkeypatch.setattr(view_recorder, "enabled", False)
+
+    with app.app_context():
+        db.session.add(Setting(site_name="Test"))
+        user = User(user_name="admin", email="admin@x.com", role=Role.ADMIN)
+        user.set_password("secret")
+        db.session.add(user)
+        db.session.commit()
+
+    with client.session_transaction() as session:
+        session["_user_id"] = "1"
+
+    return client
+
+
+@pytest.fixture()
+def count_queries(app):
+    """Return a context manager collecting the SQL statements run inside it.
+
+    Usage: ``with count_queries() as statements: ...`` then assert on
+    ``len(statements)``.
+    """
+
+    @contextmanager
+    def counter() -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -0,0 +1,133 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.employee import Employee
+from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.job import Job
+from app.models.payment import Payment
+from app.models.student import Student
+from app.models.teacher import Teacher
+
+
+def _column(attribute, key, ids):
+    """``{id: attribute}`` of the rows with ``ids``, evaluated in SQL."""
+    return dict(db.session.execute(select(key, attribute).where(key.in_(ids))).all())
+
+
+def test_money_hybrids_agree_with_their_sql_and_batch_forms(app):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        courses = [
+            Course(
+                course_title=f"C{i}",
+                teacher=teacher,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 12, 1),
+                monthly_fee=fee,
+            )
+            for i, fee in enumerate([Decimal("120.00"), Decimal("75.50"), None])
+        ]
+        students = [
+            Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            for i in range(3)
+        ]
+        enrollments = [
+            Enrollment(student=students[0], course=courses[0], discount_rate=10),
+            Enrollment(student=students[1], course=courses[0], discount_rate=None),
+            Enrollment(student=students[2], course=courses[0], discount_rate=50),
+            Enrollment(student=students[0], course=courses[1], discount_rate=25),
+            Enrollment(student=students[1], course=courses[2], discount_rate=0),
+        ]
+        enrollments[2].status = EnrollmentStatus.CLOSED
+        enrollments[0].payments.extend(
+            [
+                Payment(amount=Decimal("108.00"), month_for="2025-09"),
+                Payment(amount=Decimal("54.25"), month_for="2025-10"),
+            ]
+        )
+        enrollments[3].payments.append(
+            Payment(amount=Decimal("56.63"), month_for="2025-09")
+        )
+
+        job = Job(job_title="Clerk", min_salary=0, max_salary=20000)
+        idle = Job(job_title="Idle", min_salary=0, max_salary=20000)
+        db.session.add_all([*enrollments, job, idle])
+        db.session.flush()
+        db.session.add_all(
+            Employee(first_name=f"E{i}", last_name="X", job_id=job.job_id, salary=s)
+            for i, s in enumerate([Decimal(100), Decimal(250), None])
+        )
+        db.session.commit()
+
+        course_ids = [c.course_id for c in courses]
+        enrollment_ids = [e.enrollment_id for e in enrollments]
+        job_ids = [job.job_id, idle.job_id]
+
+        # Active enrollments only: 120 * 0.9 + 120 for C0, 75.50 * 0.75 (56.625,
+        # billed as 56.63) for C1.
+        expected = {course_ids[0]: 228.0, course_ids[1]: 56.63, course_ids[2]: 0.0}
+        assert {c.course_id: c.monthly_earnings for c in courses} == expected
+        assert Course.monthly_earnings_for(course_ids) == expected
+        assert {
+            course_id: round(float(total), 2)
+            for course_id, total in _column(
+                Course.monthly_earnings, Course.course_id, course_ids
+            ).items()
+        } == expected
+
+        expected = [Decimal("162.25"), 0, 0, Decimal("56.63"), 0]
+        assert [e.total_payments for e in enrollments] == expected
+        assert list(Enrollment.total_payments_for(enrollment_ids).values()) == expected
+        sql = _column(
+            Enrollment.total_payments, Enrollment.enrollment_id, enrollment_ids
+        )
+        assert [sql[i] for i in enrollment_ids] == expected
+        assert Payment.total_amount() == Decimal("218.88")
+
+        batch = Job.salary_stats_for(job_ids)
+        for name in Job.SALARY_AGGREGATES:
+            sql = _column(getattr(Job, name), Job.job_id, job_ids)
+            instance = {j.job_id: getattr(j, name) for j in (job, idle)}
+
+            assert instance == {i: batch[i][name] for i in job_ids}
+            assert {i: sql[i] and float(sql[i]) for i in job_ids} == instance
+
+        assert batch[job.job_id] == {
+            "average_salary": 350 / 3,
+            "highest_salary": 250.0,
+            "lowest_salary": 0.0,
+        }
+        assert batch[idle.job_id] == dict.fromkeys(Job.SALARY_AGGREGATES)
+
+
+def test_earnings_sum_the_fees_rounded_per_enrollment(app):
+    with app.app_context():
+        course = Course(
+            course_title="C",
+            teacher=Teacher(first_name="T", last_name="X", email="t@x.com"),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal("33.33"),
+        )
+        enrollments = [
+            Enrollment(
+                student=Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com"),
+                course=course,
+                discount_rate=50,
+            )
+            for i in range(2)
+        ]
+        db.session.add_all(enrollments)
+        db.session.commit()
+
+        assert [e.monthly_fee for e in enrollments] == [Decimal("16.67")] * 2
+        assert course.monthly_earnings == 33.34
+        sql = _column(Course.monthly_earnings, Course.course_id, [course.course_id])
+        assert sql == {course.course_id: Decimal("33.34")}
+        assert Course.monthly_earnings_for([course.course_id]) == {
+            course.course_id: 33.34
+        }
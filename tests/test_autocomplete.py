@@ -0,0 +1,110 @@
+import time
+from datetime import date
+
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.autocomplete import autocomplete
+
+
+def test_autocomplete_prefixes_are_cached_until_commit(app, admin, count_queries):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+
+        course = Course(
+            course_title="English B1",
+            teacher_id=teacher.teacher_id,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 6, 1),
+        )
+        students = [
+            Student(first_name="Elham", last_name="Sadat", email="e@x.com"),
+            Student(first_name="Omid", last_name="Elyas", email="o@x.com"),
+        ]
+        db.session.add(Enrollment(student=students[0], course=course))
+        db.session.add_all(students)
+        db.session.commit()
+
+    def suggest(kind, q):
+        return admin.get(f"/api/autocomplete/{kind}", query_string={"q": q}).get_json()
+
+    assert suggest("students", "EL") == [
+        {"id": 1, "label": "Elham Sadat"},
+        {"id": 2, "label": "Omid Elyas"},
+    ]
+    assert suggest("courses", "eng") == [{"id": 1, "label": "English B1"}]
+    assert suggest("enrollments", "sad") == [
+        {"id": 1, "label": "Elham Sadat — English B1"}
+    ]
+    assert suggest("enrollments", "1") == suggest("enrollments", "sad")
+
+    with count_queries() as statements:
+        suggest("students", "el")
+    assert not [s for s in statements if "students" in s]
+
+    with app.app_context():
+        db.session.add(Student(first_name="Ela", last_name="Z", email="z@x.com"))
+        db.session.commit()
+
+    assert [s["label"] for s in suggest("students", "el")][0] == "Ela Z"
+    assert admin.get("/api/autocomplete/users?q=a").status_code == 404
+    assert b"data-autocomplete" in admin.get("/admin/enrollments").data
+
+
+def test_student_suggestions_rank_first_names_before_last_names(
+    app, admin, monkeypatch
+):
+    monkeypatch.setattr(autocomplete, "limit", 3)
+
+    with app.app_context():
+        db.session.add_all(
+            Student(first_name=first, last_name=last, email=f"{i}@x.com")
+            for i, (first, last) in enumerate(
+                [
+                    ("Zahra", "Karimi"),
+                    ("karim", "Noori"),
+                    ("Ali", "Kazemi"),
+                    ("Kamal", "Ahmadi"),
+                    ("Karima", "Amiri"),
+                ]
+            )
+        )
+        db.session.commit()
+
+    labels = [
+        s["label"]
+        for s in admin.get(
+            "/api/autocomplete/students", query_string={"q": "ka"}
+        ).get_json()
+    ]
+    assert labels == ["Kamal Ahmadi", "karim Noori", "Karima Amiri"]
+
+
+def test_suggestions_expire_for_writes_from_other_workers(app, admin, monkeypatch):
+    def suggest():
+        resp = admin.get("/api/autocomplete/students", query_string={"q": "ka"})
+        return [s["label"] for s in resp.get_json()]
+
+    assert suggest() == []
+
+    # Another worker's commit does not reach this process' session hooks.
+    with app.app_context(), db.engine.begin() as connection:
+        connection.execute(
+            insert(Student.__table__).values(
+                first_name="Kamal", last_name="Ahmadi", email="k@x.com", uid="S-1"
+            )
+        )
+
+    assert suggest() == []
+
+    now = time.monotonic()
+    monkeypatch.setattr(
+        time, "monotonic", lambda: now + app.config["AUTOCOMPLETE_CACHE_TTL"] + 1
+    )
+    assert suggest() == ["Kamal Ahmadi"]
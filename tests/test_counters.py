@@ -0,0 +1,64 @@
+from datetime import date
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.employee import Employee
+from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.job import Job
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.counters import repair_counters
+
+
+def _counts(student, course, teachers, job):
+    return (
+        student.active_enrollments_count,
+        student.closed_enrollments_count,
+        course.active_enrollments_count,
+        course.closed_enrollments_count,
+        [t.total_students_count for t in teachers],
+        job.employee_count,
+    )
+
+
+def test_counters_follow_orm_changes_and_repair(app):
+    with app.app_context():
+        teachers = [
+            Teacher(first_name="T", last_name=str(i), email=f"t{i}@x.com")
+            for i in range(2)
+        ]
+        student = Student(first_name="S", last_name="X", email="s@x.com")
+        job = Job(job_title="Clerk", min_salary=0, max_salary=1)
+        db.session.add_all([*teachers, student, job])
+        db.session.flush()
+
+        course = Course(
+            course_title="C",
+            teacher_id=teachers[0].teacher_id,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 6, 1),
+        )
+        db.session.add(course)
+        db.session.commit()
+
+        enrollment = Enrollment(student=student, course=course)
+        employee = Employee(first_name="E", last_name="X", job_id=job.job_id)
+        db.session.add_all([enrollment, employee])
+        db.session.commit()
+        assert _counts(student, course, teachers, job) == (1, 0, 1, 0, [1, 0], 1)
+
+        enrollment.status = EnrollmentStatus.CLOSED
+        course.teacher_id = teachers[1].teacher_id
+        db.session.commit()
+        assert _counts(student, course, teachers, job) == (0, 1, 0, 1, [0, 1], 1)
+
+        db.session.delete(enrollment)
+        employee.job_id = None
+        db.session.commit()
+        assert _counts(student, course, teachers, job) == (0, 0, 0, 0, [0, 0], 0)
+
+        # Drift introduced behind the ORM's back is fixed by the repair.
+        db.session.execute(db.update(Job).values(employee_count=42))
+        db.session.commit()
+        repair_counters()
+        assert job.employee_count == 0
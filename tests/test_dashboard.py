@@ -0,0 +1,60 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.payment import Payment
+from app.models.rollup import bump_rollup
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.dashboard import DashboardStats
+
+
+def test_dashboard_stats_are_one_grouped_query_and_cached(app, count_queries):
+    app.config["DASHBOARD_STATS_TTL"] = 60
+    stats = DashboardStats(app)
+
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        course = Course(
+            course_title="C",
+            teacher=teacher,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal(100),
+        )
+        students = [
+            Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            for i in range(3)
+        ]
+        enrollment = Enrollment(student=students[0], course=course)
+        enrollment.payments.append(Payment(amount=250, month_for="2025-09"))
+        db.session.add_all([enrollment, *students])
+        db.session.commit()
+
+        # Two students joined last month.
+        last_month = datetime.now(timezone.utc).date().replace(day=1) - timedelta(1)
+        bump_rollup(db.session.connection(), "students", last_month, 2)
+        db.session.commit()
+
+        with count_queries() as statements:
+            first = stats.get()
+            assert stats.get() is first
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+
+        assert first["students"].total == 5
+        assert first["students"].monthly_growth == 50.0
+        assert first["students"].display_monthly_growth == "+50.0%"
+        assert first["teachers"].total == first["courses"].total == 1
+        assert first["payments"].amount == Decimal("250.00")
+        assert first["employees"].total == 0
+        assert first["employees"].monthly_growth == 0
+
+        db.session.add(Student(first_name="S3", last_name="X", email="s3@x.com"))
+        db.session.commit()
+
+        assert stats.get()["students"].total == 5  # served from the cache
+        stats.invalidate()
+        assert stats.get()["students"].total == 6
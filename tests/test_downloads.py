@@ -0,0 +1,85 @@
+import hashlib
+import io
+import json
+import os
+import zipfile
+
+from app.extensions import db
+from app.models.file import File, StudentFile
+from app.models.student import Student
+
+
+def test_download_supports_ranges_etags_and_offload(app, admin, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+
+    data = os.urandom(4096)
+    checksum = hashlib.sha256(data).hexdigest()
+    upload = admin.post("/api/upload", data={"file": (io.BytesIO(data), "v.mp4")})
+    url = json.loads(upload.data)[0]["file"]["url"]
+
+    with app.test_request_context():
+        file = File(file_name="v.mp4", file_url=url, file_hash=checksum)
+        db.session.add(file)
+        db.session.commit()
+        download_url = file.download_url()
+
+    resp = admin.get(download_url, headers={"Range": "bytes=100-199"})
+    assert resp.status_code == 206
+    assert resp.data == data[100:200]
+    assert resp.headers["ETag"] == f'"{checksum}"'
+    assert "immutable" in resp.headers["Cache-Control"]
+
+    resp = admin.get(download_url, headers={"If-None-Match": f'"{checksum}"'})
+    assert resp.status_code == 304
+
+    # Without the version parameter the response must be revalidated.
+    resp = admin.get(download_url.split("?")[0])
+    assert resp.data == data
+    assert "no-cache" in resp.headers["Cache-Control"]
+
+    app.config["DOWNLOAD_OFFLOAD"] = "x-accel-redirect"
+    resp = admin.get(download_url)
+    assert resp.data == b""
+    assert resp.headers["X-Accel-Redirect"] == (
+        f"/internal/uploads/cas/{checksum[:2]}/{checksum[2:4]}/{checksum}.mp4"
+    )
+    assert resp.headers["Content-Disposition"] == "attachment; filename=v.mp4"
+
+    assert admin.get("/api/download/file/999").status_code == 404
+
+
+def test_entity_files_stream_as_zip(app, admin, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["ARCHIVE_CHUNK_SIZE"] = 1024
+
+    blobs = {"a.pdf": os.urandom(5000), "b.txt": b"hello"}
+    urls = {
+        name: json.loads(
+            admin.post("/api/upload", data={"file": (io.BytesIO(data), name)}).data
+        )[0]["file"]["url"]
+        for name, data in blobs.items()
+    }
+
+    with app.app_context():
+        student = Student(first_name="Ali", last_name="Khan", email="a@x.com")
+        db.session.add(student)
+        db.session.commit()
+
+        for name, url in urls.items():
+            file = File(file_name=name, file_url=url, file_for="docs")
+            db.session.add(file)
+            db.session.flush()
+            db.session.add(
+                StudentFile(student_id=student.student_id, file_id=file.file_id)
+            )
+        db.session.commit()
+
+    resp = admin.get("/api/download/student/1/files")
+    assert resp.is_streamed
+    assert resp.headers["Content-Disposition"] == "attachment; filename=Ali_Khan.zip"
+
+    with zipfile.ZipFile(io.BytesIO(resp.data)) as archive:
+        assert archive.testzip() is None
+        assert {name: archive.read(f"docs/{name}") for name in blobs} == blobs
+
+    assert admin.get("/api/download/course/1/files").status_code == 404
@@ -0,0 +1,162 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.due import dues
+from app.models.enrollment import Enrollment, EnrollmentStatus
+from app.models.payment import Payment
+from app.models.student import Student
+from app.models.teacher import Teacher
+
+
+def test_dues_lists_active_unpaid_enrollments_and_refreshes(app, admin):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+
+        course = Course(
+            course_title="C",
+            teacher_id=teacher.teacher_id,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal(100),
+        )
+        students = [
+            Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            for i in range(3)
+        ]
+        enrollments = [
+            Enrollment(student=s, course=course, discount_rate=Decimal(0))
+            for s in students
+        ]
+        enrollments[2].status = EnrollmentStatus.CLOSED
+        enrollments[1].payments.append(Payment(amount=100, month_for="2025-09"))
+        db.session.add_all(enrollments)
+        db.session.commit()
+
+        ids = [e.enrollment_id for e in enrollments]
+        assert enrollments[1].is_paid_for("2025-09")
+        assert not enrollments[0].is_paid_for("2025-09")
+
+    def unpaid():
+        resp = admin.get("/api/fetch/rows/dues?month=2025-09")
+        assert resp.status_code == 200
+        return [row[0] for row in resp.get_json()["rows"]]
+
+    assert unpaid() == [ids[0]]
+
+    with app.app_context():
+        db.session.add(Payment(enrollment_id=ids[0], amount=100, month_for="2025-09"))
+        db.session.commit()
+
+    assert unpaid() == []
+    assert [
+        e["enrollment_id"]
+        for e in admin.get("/api/fetch/dues?month=2025-10").get_json()
+    ] == ids[:2]
+    assert admin.get("/api/fetch/rows/dues?month=2025-13").status_code == 400
+
+
+def test_billing_run_is_idempotent_per_month(app, admin):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+
+        course = Course(
+            course_title="C",
+            teacher_id=teacher.teacher_id,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal(200),
+        )
+        enrollments = [
+            Enrollment(
+                student=Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com"),
+                course=course,
+                discount_rate=rate,
+            )
+            for i, rate in enumerate([None, Decimal("12.50"), Decimal(0)])
+        ]
+        enrollments[2].status = EnrollmentStatus.CLOSED
+        db.session.add_all(enrollments)
+        db.session.commit()
+
+    first = admin.post("/api/billing/run", data={"month": "2025-09"}).get_json()
+    again = admin.post("/api/billing/run", data={"month": "2025-09"}).get_json()
+
+    assert (first["created"], first["total"], first["amount"]) == (2, 2, "375.00")
+    assert (again["created"], again["total"]) == (0, 2)
+    assert admin.post("/api/billing/run", data={"month": "09-2025"}).status_code == 400
+
+    with app.app_context():
+        enrollment = db.session.get(Enrollment, 1)
+        db.session.delete(enrollment)
+        db.session.commit()
+
+        assert db.session.scalars(select(dues.c.enrollment_id)).all() == [2]
+
+
+def test_monthly_fee_hybrid_matches_python_side(app):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+
+        course = Course(
+            course_title="C",
+            teacher_id=teacher.teacher_id,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal("99.99"),
+        )
+        enrollments = [
+            Enrollment(
+                student=Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com"),
+                course=course,
+                discount_rate=rate,
+            )
+            for i, rate in enumerate([None, Decimal("33.33"), Decimal("10")])
+        ]
+        db.session.add_all(enrollments)
+        db.session.commit()
+
+        rows = db.session.execute(
+            select(
+                Enrollment.enrollment_id,
+                Enrollment.monthly_fee,
+                Enrollment.monthly_discount,
+            ).order_by(Enrollment.monthly_fee)
+        ).all()
+
+        assert [
+            (e.enrollment_id, e.monthly_fee, e.monthly_discount)
+            for e in sorted(enrollments, key=lambda e: e.monthly_fee)
+        ] == [tuple(row) for row in rows]
+        assert enrollments[0].monthly_fee == Decimal("99.99")
+
+
+def test_monthly_fee_rounds_midpoints_like_sql(app):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        course = Course(
+            course_title="C",
+            teacher=teacher,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal("10.25"),
+        )
+        enrollment = Enrollment(
+            student=Student(first_name="S", last_name="X", email="s@x.com"),
+            course=course,
+            discount_rate=Decimal(50),
+        )
+        db.session.add(enrollment)
+        db.session.commit()
+
+        assert enrollment.monthly_fee == Decimal("5.13")
+        assert db.session.scalar(select(Enrollment.monthly_fee)) == Decimal("5.13")
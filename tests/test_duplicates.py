@@ -0,0 +1,64 @@
+from datetime import date
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.phone import EmployeePhone
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.duplicates import find_duplicates, phonetic, rebuild_blocks
+
+
+def test_phonetic_codes_group_spelling_variants():
+    assert phonetic("Mohammad") == phonetic("Muhammad") == "M530"
+    assert phonetic("Rasouli") == phonetic("Rasuli")
+    assert phonetic("محمد") == phonetic("محمّد")
+
+
+def test_duplicates_are_found_within_blocks(app, admin):
+    with app.app_context():
+        employee = Employee(first_name="Ahmad", last_name="Noori")
+        employee.phones.append(EmployeePhone(phone_number="+93 (700) 555-123"))
+        db.session.add_all(
+            [
+                Student(
+                    first_name="Mohammad",
+                    last_name="Rasouli",
+                    email="a@x.com",
+                    birthday=date(2001, 3, 21),
+                ),
+                Teacher(first_name="Zahra", last_name="Karimi", email="z@x.com"),
+                employee,
+            ]
+        )
+        db.session.commit()
+
+    resp = admin.post(
+        "/api/add/student",
+        data={
+            "first_name": "Muhammad",
+            "last_name": "Rasuli",
+            "email": "b@x.com",
+            "birthday": "2001-03-21",
+        },
+    )
+    dct = resp.get_json()
+
+    assert [(d["kind"], d["id"]) for d in dct["duplicates"]] == [("student", 1)]
+    assert "Possible duplicate of Mohammad Rasouli (student #1)." in dct["message"]
+
+    with app.app_context():
+        teacher = Teacher(first_name="Ahmed", last_name="Nuri", email="n@x.com")
+        db.session.add(teacher)
+        db.session.commit()
+        teacher_id = teacher.teacher_id
+
+        assert rebuild_blocks() > 0
+        pairs = [
+            ((m["a"]["kind"], m["a"]["id"]), (m["b"]["kind"], m["b"]["id"]))
+            for m in find_duplicates(min_score=0.4)
+        ]
+
+    assert pairs == [
+        (("student", 1), ("student", 2)),
+        (("employee", 1), ("teacher", teacher_id)),
+    ]
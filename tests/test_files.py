@@ -0,0 +1,105 @@
+import hashlib
+import io
+
+import pytest
+
+from app.extensions import db
+from app.models.file import File
+from app.services.files import FileVerifier, verify_files
+from app.services.storage import content_store
+
+
+def test_verify_backfills_and_reconciles_metadata(app, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.models.file.APP_DIR", str(tmp_path))
+    (tmp_path / "notes.txt").write_bytes(b"hello")
+    (tmp_path / "photo.png").write_bytes(b"\x89PNG....")
+
+    with app.app_context():
+        db.session.add_all(
+            [
+                File(file_name="notes.txt", file_url="notes.txt"),
+                File(file_name="photo.png", file_url="photo.png"),
+                File(file_name="gone.pdf", file_url="gone.pdf"),
+            ]
+        )
+        db.session.commit()
+
+    def verify(*args):
+        result = app.test_cli_runner().invoke(args=["files", "verify", *args])
+        assert result.exit_code == 0, result.output
+        return result.output.strip()
+
+    def notes():
+        return db.session.query(File).filter_by(file_name="notes.txt").one()
+
+    # Rows registered without metadata are backfilled; missing files flagged.
+    assert verify() == "checked: 3, changed: 3, missing: 1"
+
+    with app.app_context():
+        rows = {f.file_name: f for f in db.session.query(File)}
+        assert rows["notes.txt"].file_size == 5
+        assert rows["notes.txt"].file_hash == hashlib.sha256(b"hello").hexdigest()
+        assert rows["notes.txt"].mime_type == "text/plain"
+        assert rows["photo.png"].mime_type == "image/png"
+        assert not rows["gone.pdf"].file_exists and rows["gone.pdf"].size == 0
+
+    assert verify() == "checked: 3, changed: 0, missing: 1"
+    assert verify("--stale", "1") == "checked: 0, changed: 0, missing: 0"
+
+    # A size change is caught cheaply; same-size edits need --rehash.
+    (tmp_path / "notes.txt").write_bytes(b"hello, world")
+    assert verify() == "checked: 3, changed: 1, missing: 1"
+
+    (tmp_path / "notes.txt").write_bytes(b"HELLO, WORLD")
+    with app.app_context():
+        assert verify_files() == {"checked": 3, "changed": 0, "missing": 1}
+        assert verify_files(rehash=True)["changed"] == 1
+        assert notes().file_hash == hashlib.sha256(b"HELLO, WORLD").hexdigest()
+
+
+def test_background_verifier_checks_stale_rows(app, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.models.file.APP_DIR", str(tmp_path))
+    (tmp_path / "notes.txt").write_bytes(b"hello")
+    app.config.update(FILE_VERIFY_INTERVAL=60, FILE_VERIFY_BATCH_SIZE=10)
+
+    with app.app_context():
+        db.session.add(File(file_name="notes.txt", file_url="notes.txt"))
+        db.session.commit()
+
+    sleeps = []
+
+    def sleep(seconds):
+        if sleeps:
+            raise SystemExit  # stop after one pass
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("app.services.files.time.sleep", sleep)
+    verifier = FileVerifier(app)
+
+    with pytest.raises(SystemExit):
+        verifier._run()
+
+    assert sleeps == [60]
+    with app.app_context():
+        assert db.session.query(File).one().file_size == 5
+
+
+def test_linking_a_file_only_stats_it(app, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.models.file.APP_DIR", str(tmp_path))
+    app.config["UPLOAD_FOLDER"] = str(tmp_path / "static" / "uploads")
+    (tmp_path / "legacy.mp4").write_bytes(b"legacy")
+
+    with app.test_request_context():
+        url = content_store.save(io.BytesIO(b"video"), "lesson.mp4")["url"]
+
+        def read(self):
+            raise AssertionError("file contents were read")
+
+        monkeypatch.setattr(File, "_sha256", read)
+
+        stored = File.from_link(url)
+        assert (stored.file_size, stored.file_exists) == (5, True)
+        assert stored.file_hash == hashlib.sha256(b"video").hexdigest()
+
+        legacy = File.from_link("legacy.mp4")
+        assert (legacy.file_size, legacy.file_hash) == (6, None)
@@ -0,0 +1,59 @@
+import io
+import os
+
+import pytest
+
+from app.services.images import image_derivatives
+from app.services.storage import content_store
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def test_variants_are_built_looked_up_and_removed(app, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (2000, 1000), "red").save(buffer, format="PNG")
+    buffer.seek(0)
+
+    with app.test_request_context():
+        url = content_store.save(buffer, "banner.png")["url"]
+        source = content_store.path_for_url(url)
+
+        assert len(image_derivatives.build(url)) == 3
+        assert image_derivatives.build(url) == []
+
+        urls = image_derivatives.urls(url)
+        assert urls["thumb"].endswith(".thumb.webp")
+        assert image_derivatives.src(url, "card") == urls["card"]
+        assert f"{urls['full']} 1600w" in image_derivatives.srcset(url)
+
+        with Image.open(source.replace(".png", ".card.webp")) as card:
+            assert card.size == (480, 240)
+
+        # Anything that is not a stored image is served as is.
+        assert image_derivatives.src("/static/logo.png") == "/static/logo.png"
+        assert image_derivatives.srcset(None) == ""
+
+        content_store.remove(source)
+        assert os.listdir(os.path.dirname(source)) == []
+
+
+def test_removing_one_extension_keeps_the_other(app, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+
+    with app.test_request_context():
+        jpg = content_store.save(io.BytesIO(b"same bytes"), "photo.jpg")["url"]
+        png = content_store.save(io.BytesIO(b"same bytes"), "photo.png")["url"]
+        jpg, png = content_store.path_for_url(jpg), content_store.path_for_url(png)
+        directory = os.path.dirname(jpg)
+        thumb = image_derivatives._variant_path(png, "thumb")
+        open(thumb, "wb").close()
+
+        content_store.remove(jpg)
+        assert sorted(os.listdir(directory)) == sorted(
+            [os.path.basename(png), os.path.basename(thumb)]
+        )
+
+        content_store.remove(png)
+        assert os.listdir(directory) == []
@@ -0,0 +1,49 @@
+import os
+
+from app.extensions import db
+from app.models.file import File
+from app.services.orphans import collect_orphans
+
+
+def _touch(path, age=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * 10)
+    os.utime(path, (path.stat().st_atime - age, path.stat().st_mtime - age))
+    return path
+
+
+def test_collect_orphans(app, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    linked, blob = "a" * 64, "b" * 64
+
+    kept = [
+        _touch(tmp_path / "2024-01-01" / "1_linked.pdf", age=7200),
+        _touch(tmp_path / "cas" / "aa" / "aa" / f"{linked}.png", age=7200),
+        _touch(tmp_path / "cas" / "aa" / "aa" / f"{linked}.thumb.webp", age=7200),
+        _touch(tmp_path / "2024-01-01" / "2_fresh.pdf"),
+    ]
+    orphans = [
+        _touch(tmp_path / "2024-01-01" / "3_unlinked.pdf", age=7200),
+        _touch(tmp_path / "cas" / "bb" / "bb" / f"{blob}.png", age=7200),
+        _touch(tmp_path / ".incoming" / f"{'c' * 32}.part", age=7200),
+    ]
+
+    with app.app_context():
+        db.session.add_all(
+            [
+                File(file_url="/static/uploads/2024-01-01/1_linked.pdf"),
+                File(file_url=f"/static/uploads/cas/aa/aa/{linked}.png"),
+            ]
+        )
+        db.session.commit()
+
+        stats = collect_orphans(grace_period=3600, dry_run=True)
+        assert (stats["scanned"], stats["referenced"]) == (7, 3)
+        assert (stats["recent"], stats["orphans"], stats["bytes"]) == (1, 3, 30)
+        assert all(path.exists() for path in kept + orphans)
+
+        collect_orphans(grace_period=3600, quarantine=True)
+
+    assert all(path.exists() for path in kept)
+    assert not any(path.exists() for path in orphans)
+    assert (tmp_path / ".quarantine" / "2024-01-01" / "3_unlinked.pdf").exists()
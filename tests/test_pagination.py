@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import event, select
+
+from app.extensions import db
+from app.models.student import Student
+from app.services.pagination import KeysetPage, PaginationError
+
+
+def _walk(args):
+    ids, cursor = [], None
+
+    while True:
+        page = KeysetPage(
+            select(Student),
+            Student.student_id,
+            sortable={"middle_name": Student.middle_name},
+            searchable=[Student.first_name],
+            args={**args, "limit": "3", **({"cursor": cursor} if cursor else {})},
+        )
+        ids += [student.student_id for student in page.items]
+        cursor = page.next_cursor
+
+        if not page.has_more:
+            return ids
+
+
+def test_keyset_pages_cover_every_row_once(app):
+    with app.test_request_context():
+        for i in range(10):
+            db.session.add(
+                Student(
+                    first_name=f"S{i}",
+                    middle_name=None if i % 3 else f"M{i % 2}",
+                    last_name="L",
+                    email=f"s{i}@example.com",
+                )
+            )
+        db.session.commit()
+
+        for order in ("asc", "desc"):
+            ids = _walk({"sort": "middle_name", "order": order})
+            assert sorted(ids) == list(range(1, 11))
+
+            # Values in order, ties and then NULLs by primary key.
+            names = {
+                i: "M0" if i in (1, 7) else "M1" if i in (4, 10) else None for i in ids
+            }
+            reverse = order == "desc"
+            expected = sorted(
+                (i for i in ids if names[i]),
+                key=lambda i: (names[i], i),
+                reverse=reverse,
+            ) + sorted((i for i in ids if not names[i]), reverse=reverse)
+            assert ids == expected
+
+        assert _walk({"q": "S1"}) == [2]
+
+        with pytest.raises(PaginationError):
+            _walk({"cursor": "not-a-cursor"})
+
+
+def test_keyset_pages_seek_an_index_without_sorting(app):
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            rows = cursor.connection.execute(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plans.append(" / ".join(row[-1] for row in rows))
+
+    with app.test_request_context():
+        for i in range(10):
+            db.session.add(
+                Student(
+                    first_name=f"S{i}",
+                    middle_name=f"M{i}" if i % 2 else None,
+                    last_name="L",
+                    email=f"s{i}@example.com",
+                )
+            )
+        db.session.commit()
+
+        event.listen(db.engine, "before_cursor_execute", explain)
+        try:
+            for sort in ("student_id", "first_name", "middle_name"):
+                for order in ("asc", "desc"):
+                    cursor = None
+
+                    while True:
+                        page = KeysetPage(
+                            select(Student),
+                            Student.student_id,
+                            sortable={
+                                "first_name": Student.first_name,
+                                "middle_name": Student.middle_name,
+                            },
+                            args={
+                                "sort": sort,
+                                "order": order,
+                                "limit": "3",
+                                **({"cursor": cursor} if cursor else {}),
+                            },
+                        )
+                        if not (cursor := page.next_cursor):
+                            break
+        finally:
+            event.remove(db.engine, "before_cursor_execute", explain)
+
+    # Every page walks an index (or the rowid order) from the cursor on.
+    assert plans
+    for plan in plans:
+        assert "TEMP B-TREE" not in plan, plan
+        assert "USING" in plan or plan == "SCAN students", plan
+    assert sum(plan.startswith("SEARCH") for plan in plans) >= 6
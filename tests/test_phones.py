@@ -0,0 +1,155 @@
+import json
+
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models.phone import StudentPhone
+from app.models.student import Student
+from app.services.phones import normalize_phone, rebuild_phone_index
+
+
+def test_spellings_normalize_to_one_key(app):
+    with app.app_context():
+        assert {
+            normalize_phone(number)
+            for number in (
+                "0700 123 456",
+                "+93 (700) 123-456",
+                "0093700123456",
+                "93700123456",
+                "700123456",
+            )
+        } == {"+93700123456"}
+        assert normalize_phone("+1 202 555 0100") == "+12025550100"
+        assert normalize_phone("---") is None
+
+
+def test_numbers_are_unique_across_people(app, admin):
+    with app.app_context():
+        student = Student(first_name="Mohammad", last_name="Rahimi", email="m@x.com")
+        student.phones.append(StudentPhone(phone_number="+93 700-123-456"))
+        db.session.add(student)
+        db.session.commit()
+        student_id = student.student_id
+
+    def add_teacher(*phones):
+        return admin.post(
+            "/api/add/teacher",
+            data={
+                "first_name": "Maryam",
+                "last_name": "Rahmani",
+                "email": f"r{len(phones)}@x.com",
+                "salary": "100",
+                "phones": json.dumps(phones),
+            },
+        ).get_json()
+
+    errors = add_teacher("0799 000 111", "0700123456")["errors"]
+    assert errors["phones"] == ["Duplicate entry '0700123456' for phone number!"]
+
+    errors = add_teacher("0799 000 111", "+93799000111")["errors"]
+    assert errors["phones"] == ["Duplicate entry '+93799000111' for phone number!"]
+
+    teacher_id = add_teacher("0799 000 111")["id"]
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "0799-000-111"})
+    assert lookup.get_json() == {
+        "number": "+93799000111",
+        "kind": "teacher",
+        "id": teacher_id,
+    }
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "700123456"})
+    assert lookup.get_json()["id"] == student_id
+
+    with app.app_context():
+        db.session.delete(db.session.get(StudentPhone, 1))
+        db.session.commit()
+
+        assert rebuild_phone_index() == (1, [])
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "700123456"})
+    assert lookup.status_code == 404
+
+
+def test_update_with_a_malformed_id_is_a_form_error(admin):
+    for kind in ("student", "teacher", "employee"):
+        for bad_id in ("", "abc"):
+            resp = admin.post(
+                f"/api/update/{kind}",
+                data={
+                    f"{kind}_id": bad_id,
+                    "first_name": "A",
+                    "last_name": "B",
+                    "email": "a@x.com",
+                    "phones": json.dumps(["0799 000 111"]),
+                },
+            )
+            assert resp.status_code == 200
+            assert f"{kind}_id" in resp.get_json()["errors"]
+
+
+def test_a_freed_number_stays_indexed_for_its_other_holder(app, admin):
+    with app.app_context():
+        students = [
+            Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            for i in range(2)
+        ]
+        for student, spelling in zip(students, ["0700 123 456", "+93 700123456"]):
+            student.phones.append(StudentPhone(phone_number=spelling))
+        db.session.add_all(students)
+        db.session.commit()
+
+        assert rebuild_phone_index() == (2, [("+93700123456", "student", 2)])
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "0700123456"})
+    assert lookup.status_code == 409
+    assert lookup.get_json()["holders"] == [
+        {"kind": "student", "id": 1},
+        {"kind": "student", "id": 2},
+    ]
+
+    with app.app_context():
+        students = db.session.scalars(select(Student).order_by(Student.student_id)).all()
+        db.session.delete(students[0].phones[0])
+        db.session.commit()
+        second = students[1].student_id
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "0700123456"})
+    assert lookup.get_json()["id"] == second
+
+
+def test_update_keeps_respelled_numbers_and_swaps_the_rest(app, admin):
+    with app.app_context():
+        student = Student(first_name="S", last_name="X", email="s@x.com")
+        student.phones.extend(
+            [
+                StudentPhone(phone_number="0700 123 456"),
+                StudentPhone(phone_number="0799 000 111"),
+            ]
+        )
+        db.session.add(student)
+        db.session.commit()
+
+    resp = admin.post(
+        "/api/update/student",
+        data={
+            "student_id": "1",
+            "first_name": "S",
+            "last_name": "X",
+            "email": "s@x.com",
+            "phones": json.dumps(["+93 700-123-456", "0788 555 000"]),
+        },
+    )
+    assert resp.status_code == 200, resp.get_json()
+
+    with app.app_context():
+        assert sorted(p.phone_number for p in db.session.get(Student, 1).phones) == [
+            "0700 123 456",
+            "0788 555 000",
+        ]
+
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "0799000111"})
+    assert lookup.status_code == 404
+    lookup = admin.get("/api/lookup/phone", query_string={"number": "0788555000"})
+    assert lookup.get_json()["id"] == 1
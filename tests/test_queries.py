@@ -0,0 +1,87 @@
+from datetime import date
+
+import pytest
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.file import File, StudentFile, TeacherFile
+from app.models.phone import StudentPhone, TeacherPhone
+from app.models.student import Student
+from app.models.teacher import Teacher
+
+
+def _add_students(course: Course, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        student = Student(first_name=f"S{i}", last_name="L", email=f"s{i}@x.com")
+        db.session.add(student)
+        db.session.flush()
+
+        db.session.add(StudentPhone(student_id=student.student_id, phone_number=f"{i}"))
+        file = File(file_name=f"f{i}", file_url=f"static/uploads/f{i}.txt")
+        db.session.add(file)
+        db.session.flush()
+        db.session.add(StudentFile(student_id=student.student_id, file_id=file.file_id))
+        db.session.add(
+            Enrollment(
+                student_id=student.student_id,
+                course_id=course.course_id,
+                discount_rate=0,
+            )
+        )
+
+    db.session.commit()
+
+
+@pytest.fixture()
+def course(app, admin):
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="L", email="t@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+        db.session.add(TeacherPhone(teacher_id=teacher.teacher_id, phone_number="0"))
+        file = File(file_name="cv", file_url="static/uploads/cv.txt")
+        db.session.add(file)
+        db.session.flush()
+        db.session.add(TeacherFile(teacher_id=teacher.teacher_id, file_id=file.file_id))
+        db.session.add(
+            Course(
+                course_title="Math",
+                teacher_id=teacher.teacher_id,
+                start_date=date.today(),
+                end_date=date.today(),
+                monthly_fee=100,
+            )
+        )
+        db.session.commit()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/fetch/students",
+        "/api/fetch/teachers",
+        "/api/fetch/courses",
+        "/api/fetch/enrollments",
+        "/api/fetch/rows/students",
+        "/api/fetch/rows/enrollments",
+    ],
+)
+def test_list_endpoints_run_a_constant_number_of_queries(
+    app, admin, course, count_queries, url
+):
+    counts = []
+
+    # Warm the per-worker caches (settings...) so only the endpoint is counted.
+    admin.get(url)
+
+    for start, count in ((0, 2), (2, 6)):
+        with app.app_context():
+            _add_students(Course.query.first(), start, count)
+
+        with count_queries() as statements:
+            assert admin.get(url).status_code == 200
+
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
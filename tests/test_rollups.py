@@ -0,0 +1,84 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.job import Job
+from app.models.payment import Payment
+from app.models.rollup import daily_rollups
+from app.models.student import Student
+from app.models.teacher import Teacher
+
+
+def test_growth_of_untracked_tables_counts_created_rows(app):
+    with app.app_context():
+        db.session.add(Job(job_title="Clerk", min_salary=0, max_salary=100))
+        db.session.add(Student(first_name="S", last_name="X", email="s@x.com"))
+        db.session.commit()
+
+        # Jobs have no rollups; students do.  Both grew from nothing.
+        assert Job.monthly_growth() == Job.weekly_growth() == 100
+        assert Student.monthly_growth() == Student.weekly_growth() == 100
+
+
+def _rollups():
+    return {
+        (row.model, row.day): (row.count, Decimal(str(row.amount)))
+        for row in db.session.execute(select(daily_rollups))
+        if row.count or row.amount
+    }
+
+
+def test_rollups_follow_inserts_deletes_and_amounts(app):
+    today = datetime.now(timezone.utc).date()
+
+    with app.app_context():
+        teacher = Teacher(first_name="T", last_name="X", email="t@x.com")
+        course = Course(
+            course_title="C",
+            teacher=teacher,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 1),
+            monthly_fee=Decimal(100),
+        )
+        students = [
+            Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            for i in range(3)
+        ]
+        enrollment = Enrollment(student=students[0], course=course)
+        payments = [
+            Payment(amount=100, month_for="2025-09"),
+            Payment(amount=50, month_for="2025-10"),
+        ]
+        enrollment.payments.extend(payments)
+        db.session.add_all([enrollment, *students])
+        db.session.commit()
+
+        assert _rollups()[("students", today)] == (3, Decimal(0))
+        assert _rollups()[("payments", today)] == (2, Decimal(150))
+
+        db.session.delete(students[2])
+        payments[0].amount = 120
+        db.session.delete(payments[1])
+        db.session.commit()
+
+        live = _rollups()
+        assert live[("students", today)] == (2, Decimal(0))
+        assert live[("payments", today)] == (1, Decimal(120))
+        assert (
+            live[("courses", today)]
+            == live[("enrollments", today)]
+            == (
+                1,
+                Decimal(0),
+            )
+        )
+
+    result = app.test_cli_runner().invoke(args=["rollups", "rebuild"])
+    assert result.exit_code == 0, result.output
+
+    with app.app_context():
+        assert _rollups() == live
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.job import Job
+from app.services.salaries import salary_stats
+
+
+def test_salary_comparisons_are_cached_and_invalidated(app, count_queries):
+    with app.app_context():
+        job = Job(job_title="Clerk", min_salary=0, max_salary=20000)
+        db.session.add(job)
+        db.session.flush()
+
+        employees = [
+            Employee(
+                first_name=f"E{i}",
+                last_name="X",
+                salary=Decimal(100 * i),
+                job_id=job.job_id,
+            )
+            for i in range(1, 6)
+        ]
+        db.session.add_all(employees)
+        db.session.commit()
+
+        # Load the rows before counting.
+        db.session.refresh(job)
+        for e in employees:
+            db.session.refresh(e)
+
+        with count_queries() as statements:
+            flags = [e.is_salary_gt_avg for e in employees]
+            assert job.average_salary == 300.0
+            assert [e.is_salary_gt_avg for e in employees] == flags
+        assert flags == [False, False, False, True, True]
+        assert len(statements) == 3  # job ids, job aggregates, averages
+
+        employees[0].salary = Decimal(10000)
+        db.session.commit()
+
+        assert employees[0].is_salary_gt_avg
+        assert job.highest_salary == 10000.0
+
+
+def test_rollback_drops_figures_cached_after_a_flush(app):
+    with app.app_context():
+        db.session.add(Employee(first_name="A", last_name="X", salary=Decimal(100)))
+        db.session.commit()
+
+        db.session.add(Employee(first_name="B", last_name="X", salary=Decimal(300)))
+        db.session.flush()
+        assert salary_stats.average("employees") == 200.0
+
+        db.session.rollback()
+        assert salary_stats.average("employees") == 100.0
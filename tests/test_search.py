@@ -0,0 +1,122 @@
+from datetime import date
+
+from app.extensions import db
+from app.models.course import Course
+from app.models.employee import Employee
+from app.models.phone import StudentPhone
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.services.search import rebuild_index, search
+
+
+def test_search_index_follows_orm_changes(app, admin):
+    with app.app_context():
+        teacher = Teacher(first_name="Zahra", last_name="Karimi", email="z@x.com")
+        db.session.add(teacher)
+        db.session.flush()
+
+        courses = [
+            Course(
+                course_title=title,
+                course_description=description,
+                teacher_id=teacher.teacher_id,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 6, 1),
+            )
+            for title, description in [
+                ("Python Basics", "Variables, loops and functions."),
+                ("Web Design", "HTML, CSS and a little Python."),
+            ]
+        ]
+        db.session.add_all(courses)
+        db.session.commit()
+
+        def hits(q):
+            return [(i["kind"], i["title"]) for i in search(q)["items"]]
+
+        # Title matches outrank body matches; the last word is a prefix.
+        assert hits("pyth")[0] == ("course", "Python Basics")
+        assert sorted(hits("pyth")[1:]) == [
+            ("course", "Web Design"),
+            ("teacher", "Zahra Karimi"),
+        ]
+        assert hits("karim") == [
+            ("teacher", "Zahra Karimi"),
+            ("course", "Python Basics"),
+            ("course", "Web Design"),
+        ]
+
+        teacher.last_name = "Ahmadi"
+        db.session.delete(courses[1])
+        db.session.commit()
+
+        assert hits("karimi") == []
+        assert hits("ahmadi web") == []
+        assert hits("ahmadi") == [
+            ("teacher", "Zahra Ahmadi"),
+            ("course", "Python Basics"),
+        ]
+        assert hits('"; DROP') == []
+        assert rebuild_index() == 2
+
+    resp = admin.get("/search?keyword=loops")
+    assert resp.status_code == 200
+    assert b"<mark>loops</mark>" in resp.data
+
+
+def test_people_search_is_typo_tolerant(app, admin):
+    with app.app_context():
+        student = Student(first_name="Mohammad", last_name="Rahimi", email="m@x.com")
+        student.phones.append(StudentPhone(phone_number="+93 700-123-456"))
+        db.session.add_all(
+            [
+                student,
+                Teacher(first_name="Maryam", last_name="Rahmani", email="r@x.com"),
+                Employee(first_name="Ahmad", last_name="Noori"),
+            ]
+        )
+        db.session.commit()
+
+        student.last_name = "Rasuli"
+        db.session.commit()
+        student_id = student.student_id
+
+    def people(q):
+        resp = admin.get("/api/search/people", query_string={"q": q, "limit": 2})
+        return [(p["kind"], p["id"], p["name"]) for p in resp.get_json()["people"]]
+
+    assert people("Mohamad Rasouli")[0] == ("student", student_id, "Mohammad Rasuli")
+    assert people("0700-123")[0][1] == student_id
+    assert people("rahmany")[0][0] == "teacher"
+    assert people("rahimi") == []  # the old name left the index
+    assert people("noory ahmed")[0][0] == "employee"
+
+
+def test_results_link_their_pages_and_window_the_pager(app, admin):
+    app.config["SEARCH_PAGE_SIZE"] = 1
+
+    with app.app_context():
+        teacher = Teacher(first_name="Zahra", last_name="Karimi", email="z@x.com")
+        db.session.add_all(
+            Course(
+                course_title=f"Algebra {i}",
+                teacher=teacher,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 6, 1),
+            )
+            for i in range(9)
+        )
+        db.session.commit()
+
+    html = admin.get("/search?keyword=algebra&page=5").get_data(as_text=True)
+
+    assert 'href="/courses#course-' in html
+    pages = {n for n in range(1, 10) if f"keyword=algebra&amp;page={n}\"" in html}
+    # Five numbered links around page 5, plus the previous/next arrows.
+    assert pages == {3, 4, 5, 6, 7}
+
+    html = admin.get("/search?keyword=karimi").get_data(as_text=True)
+    assert 'href="/courses?teacher=1"' in html
+
+    html = admin.get("/courses?teacher=1").get_data(as_text=True)
+    assert html.count('id="course-') == 9
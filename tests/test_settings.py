@@ -0,0 +1,48 @@
+import os
+
+from app.extensions import db
+from app.models.setting import Setting
+from app.services import settings
+from app.services.settings import SettingCache
+
+
+def test_invalidation_reaches_other_workers(app, tmp_path, count_queries):
+    app.config["SETTING_VERSION_FILE"] = str(tmp_path / "setting.version")
+    mine, other = SettingCache(app), SettingCache(app)
+
+    with app.app_context():
+        db.session.add(Setting(site_name="Before"))
+        db.session.commit()
+
+        assert mine.get()["site_name"] == other.get()["site_name"] == "Before"
+
+        with count_queries() as statements:
+            assert other.get()["site_name"] == "Before"
+        assert statements == []
+
+        db.session.query(Setting).update({"site_name": "After"})
+        db.session.commit()
+        mine.invalidate()
+
+        assert other.get()["site_name"] == "After"
+
+
+def test_updating_settings_invalidates_the_cache(app, admin, monkeypatch):
+    calls = []
+    monkeypatch.setattr(settings.setting_cache, "invalidate", lambda: calls.append(1))
+
+    resp = admin.post("/api/update/setting", data={"site_name": "Renamed"})
+
+    assert resp.get_json()["category"] == "success"
+    assert calls == [1]
+
+    with app.app_context():
+        assert db.session.query(Setting).one().site_name == "Renamed"
+
+
+def test_stamp_defaults_to_the_instance_folder(app, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    app.config["SETTING_VERSION_FILE"] = None
+    cache = SettingCache(app)
+
+    assert cache.stamp_path == os.path.join(app.instance_path, "setting.version")
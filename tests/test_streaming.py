@@ -0,0 +1,52 @@
+import json
+
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models.phone import StudentPhone
+from app.models.student import Student
+from app.services.streaming import iter_json_array
+
+
+def _students():
+    return select(Student).order_by(Student.student_id)
+
+
+def test_json_array_is_valid_when_empty_and_across_partitions(app):
+    with app.app_context():
+        chunks = list(iter_json_array(_students(), Student.to_dict, batch_size=2))
+        assert chunks == ["[", "]"]
+        assert json.loads("".join(chunks)) == []
+
+        for i in range(5):
+            db.session.add(
+                Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            )
+        db.session.commit()
+
+        chunks = list(iter_json_array(_students(), Student.to_dict, batch_size=2))
+        assert len(chunks) == 2 + 3  # brackets and three partitions of <= 2
+        assert [s["email"] for s in json.loads("".join(chunks))] == [
+            f"s{i}@x.com" for i in range(5)
+        ]
+
+
+def test_fetch_endpoints_stream_a_json_array(app, admin):
+    app.config["STREAM_BATCH_SIZE"] = 2
+
+    assert admin.get("/api/fetch/students").get_json() == []
+
+    with app.app_context():
+        for i in range(3):
+            student = Student(first_name=f"S{i}", last_name="X", email=f"s{i}@x.com")
+            student.phones.append(StudentPhone(phone_number=f"070000000{i}"))
+            db.session.add(student)
+        db.session.commit()
+
+    resp = admin.get("/api/fetch/students")
+
+    assert resp.is_streamed
+    assert resp.content_type == "application/json"
+    assert [s["phones"] for s in json.loads(resp.get_data(as_text=True))] == [
+        [f"070000000{i}"] for i in range(3)
+    ]
@@ -0,0 +1,92 @@
+import hashlib
+import io
+import json
+import os
+
+from app.extensions import db
+from app.models.file import File
+
+
+def test_chunked_upload_resumes_and_verifies_checksum(app, admin, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["UPLOAD_CHUNK_SIZE"] = 1024
+
+    data = os.urandom(2500)
+    checksum = hashlib.sha256(data).hexdigest()
+
+    resp = admin.post(
+        "/api/upload/chunked",
+        json={"name": "notes.pdf", "size": 2500, "sha256": checksum},
+    )
+    assert resp.status_code == 201
+    url = f"/api/upload/chunked/{resp.json['upload_id']}"
+
+    assert admin.put(f"{url}?offset=0", data=data[:1024]).json["offset"] == 1024
+
+    # A retried chunk is rejected with the offset to resume from.
+    resp = admin.put(f"{url}?offset=0", data=data[:1024])
+    assert resp.status_code == 409
+    assert resp.json["offset"] == 1024
+
+    # A corrupted chunk is rolled back.
+    resp = admin.put(
+        f"{url}?offset=1024",
+        data=data[1024:2048],
+        headers={"X-Chunk-SHA256": "0" * 64},
+    )
+    assert resp.status_code == 422
+    assert admin.get(url).json["offset"] == 1024
+
+    assert admin.put(f"{url}?offset=1024", data=data[1024:2048]).status_code == 200
+    assert admin.post(f"{url}/finalize").status_code == 409
+
+    assert admin.put(f"{url}?offset=2048", data=data[2048:]).status_code == 200
+    resp = admin.post(f"{url}/finalize")
+    assert resp.status_code == 200
+    assert resp.json[0]["file"]["sha256"] == checksum
+
+    path = tmp_path / "cas" / checksum[:2] / checksum[2:4] / f"{checksum}.pdf"
+    assert path.read_bytes() == data
+    assert admin.get(url).status_code == 404
+
+
+def test_identical_uploads_share_one_blob(app, admin, tmp_path):
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["UPLOAD_GRACE_PERIOD"] = 0
+
+    data = os.urandom(2048)
+    checksum = hashlib.sha256(data).hexdigest()
+
+    # /api/upload answers with a non-JSON content type.
+    first, second = [
+        json.loads(
+            admin.post("/api/upload", data={"file": (io.BytesIO(data), "a.txt")}).data
+        )[0]["file"]
+        for _ in range(2)
+    ]
+    assert first["url"] == second["url"]
+    assert (first["deduplicated"], second["deduplicated"]) == (False, True)
+    assert len(list((tmp_path / "cas").rglob("*.txt"))) == 1
+
+    resp = admin.post("/api/upload/check", json={"name": "b.txt", "sha256": checksum})
+    assert resp.json[0]["file"]["url"] == first["url"]
+    resp = admin.post(
+        "/api/upload/chunked", json={"size": 2048, "sha256": checksum, "name": "c.txt"}
+    )
+    assert resp.json["complete"]
+
+    with app.app_context():
+        rows = [File.from_link(first["url"]) for _ in range(2)]
+        db.session.add_all(rows)
+        db.session.commit()
+
+        blob = tmp_path / "cas" / checksum[:2] / checksum[2:4] / f"{checksum}.txt"
+        os.utime(blob, (0, 0))
+
+        db.session.delete(rows[0])
+        db.session.commit()
+        assert blob.exists()
+
+        db.session.delete(rows[1])
+        db.session.commit()
+        assert not blob.exists()
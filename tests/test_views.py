@@ -0,0 +1,40 @@
+from app.extensions import db
+from app.models.view import View
+from app.services.views import ViewRecorder
+
+
+def test_views_are_written_in_batches(app):
+    app.config["VIEW_BATCH_SIZE"] = 2
+    recorder = ViewRecorder(app)
+    recorder._ensure_started = lambda: None
+
+    for i in range(5):
+        assert recorder.record(f"/page/{i}", "127.0.0.1", "pytest")
+
+    assert recorder.flush() == 5
+
+    with app.app_context():
+        assert db.session.query(View).count() == 5
+
+
+def test_views_are_dropped_when_queue_is_full(app):
+    app.config["VIEW_QUEUE_SIZE"] = 2
+    recorder = ViewRecorder(app)
+    recorder._ensure_started = lambda: None
+
+    results = [recorder.record("/", None, None) for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert recorder.dropped == 1
+    assert recorder.flush() == 2
+
+
+def test_exit_flush_is_registered_once(app, monkeypatch):
+    registered = []
+    monkeypatch.setattr("atexit.register", registered.append)
+    recorder = ViewRecorder()
+
+    recorder.init_app(app)
+    recorder.init_app(app)
+
+    assert registered == [recorder.flush]